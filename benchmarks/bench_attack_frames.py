@@ -0,0 +1,106 @@
+"""
+Benchmark deteksi segment frame attack
+--------------------------------------
+Membandingkan cara mencari rentang kolom berisi pixel pada
+spritesheet lebar (frame dengan lebar tidak seragam):
+- per kolom : subsurface 1 px + get_bounding_rect() (cara lama)
+- numpy     : find_segments dengan reduksi alpha per kolom
+- mask      : find_segments tanpa NumPy (bounding rect komponen)
+
+Semua hasil harus sama persis dengan cara lama.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_attack_frames
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from core import spritesheet_loader
+from core.spritesheet_loader import find_segments
+
+HEIGHT = 64
+REPEAT = 5
+
+
+def legacy_segments(sheet):
+    """Cara lama load_attack_frames: satu subsurface per kolom."""
+    w, h = sheet.get_width(), sheet.get_height()
+    segments = []
+    started = False
+    start = 0
+
+    for x in range(w):
+        column = sheet.subsurface((x, 0, 1, h))
+        if column.get_bounding_rect() != pygame.Rect(0, 0, 0, 0):
+            if not started:
+                start = x
+                started = True
+        else:
+            if started:
+                segments.append((start, x))
+                started = False
+    if started:
+        segments.append((start, w))
+    return segments
+
+
+def make_sheet(rng, frames):
+    """Frame acak: blob beberapa rect, celah transparan 1-12 px, alpha acak."""
+    widths = [rng.randint(24, 110) for _ in range(frames)]
+    gaps = [rng.randint(1, 12) for _ in range(frames)]
+    sheet = pygame.Surface((sum(widths) + sum(gaps), HEIGHT), pygame.SRCALPHA)
+
+    x = 0
+    for w, gap in zip(widths, gaps):
+        for _ in range(rng.randint(1, 4)):
+            bw = rng.randint(1, w)
+            bh = rng.randint(1, HEIGHT)
+            rect = pygame.Rect(x + rng.randint(0, w - bw), rng.randint(0, HEIGHT - bh), bw, bh)
+            sheet.fill((200, 80, 40, rng.randint(1, 255)), rect)
+        # pastikan kolom pertama & terakhir frame berisi (lebar frame tetap)
+        sheet.fill((0, 0, 0, 1), (x, HEIGHT - 1, 1, 1))
+        sheet.fill((0, 0, 0, 1), (x + w - 1, HEIGHT - 1, 1, 1))
+        x += w + gap
+    return sheet
+
+
+def timed(fn, sheet):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = fn(sheet)
+    return result, (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    pygame.init()
+    has_numpy = spritesheet_loader.numpy is not None
+    rng = random.Random(3)
+
+    sheets = [("assets/player/attack.png", pygame.image.load("assets/player/attack.png"))]
+    for frames in (50, 500, 2000):
+        sheet = make_sheet(rng, frames)
+        sheets.append((f"sintetis {frames} frame", sheet))
+
+    print(f"{'sheet':>28} {'lebar':>7} {'per kolom ms':>13} {'numpy ms':>9} {'mask ms':>8}")
+    for name, sheet in sheets:
+        expected, legacy_ms = timed(legacy_segments, sheet)
+
+        masked, mask_ms = timed(lambda s: find_segments(s, use_numpy=False), sheet)
+        assert masked == expected, name
+
+        numpy_text = "-"
+        if has_numpy:
+            vector, numpy_ms = timed(lambda s: find_segments(s, use_numpy=True), sheet)
+            assert vector == expected, name
+            numpy_text = f"{numpy_ms:.2f}"
+
+        print(f"{name:>28} {sheet.get_width():>7} {legacy_ms:>13.2f} {numpy_text:>9} {mask_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
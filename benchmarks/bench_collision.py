@@ -0,0 +1,95 @@
+"""
+Benchmark collision map
+-----------------------
+Membandingkan biaya collision per frame antara:
+- loop semua collider (cara lama)
+- query SpatialHash (cara baru)
+
+Jumlah collider dinaikkan 10x dengan kepadatan yang sama
+(map ikut diperbesar), seperti map TMX yang lebih besar.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_collision
+"""
+import math
+import random
+import time
+
+import pygame
+
+from world.spatial_hash import SpatialHash
+
+ENTITIES = 50
+FRAMES = 200
+BASE_COLLIDERS = 120
+BASE_MAP = 2048
+
+
+def make_colliders(count, map_size, rng):
+    rects = []
+    for _ in range(count):
+        w = rng.randint(8, 160)
+        h = rng.randint(8, 160)
+        rects.append(pygame.Rect(rng.randint(0, map_size - w), rng.randint(0, map_size - h), w, h))
+    return rects
+
+
+def make_hitboxes(map_size, rng):
+    return [pygame.Rect(rng.randint(0, map_size - 32), rng.randint(0, map_size - 32), 20, 24)
+            for _ in range(ENTITIES)]
+
+
+def run_linear(hitboxes, colliders):
+    hits = 0
+    for _ in range(FRAMES):
+        for hb in hitboxes:
+            # sumbu X lalu Y, seperti collide_x / collide_y
+            for c in colliders:
+                if hb.colliderect(c):
+                    hits += 1
+            for c in colliders:
+                if hb.colliderect(c):
+                    hits += 1
+    return hits
+
+
+def run_indexed(hitboxes, index):
+    hits = 0
+    for _ in range(FRAMES):
+        for hb in hitboxes:
+            for c in index.query(hb):
+                if hb.colliderect(c):
+                    hits += 1
+            for c in index.query(hb):
+                if hb.colliderect(c):
+                    hits += 1
+    return hits
+
+
+def measure(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, result
+
+
+def main():
+    rng = random.Random(1)
+
+    print(f"{'colliders':>10} {'map px':>8} {'linear ms/frame':>16} {'hash ms/frame':>14}")
+    for scale in (1, 10):
+        count = BASE_COLLIDERS * scale
+        map_size = int(BASE_MAP * math.sqrt(scale))
+
+        colliders = make_colliders(count, map_size, rng)
+        hitboxes = make_hitboxes(map_size, rng)
+        index = SpatialHash.from_rects(colliders, 64)
+
+        linear_ms, linear_hits = measure(run_linear, hitboxes, colliders)
+        hash_ms, hash_hits = measure(run_indexed, hitboxes, index)
+        assert linear_hits == hash_hits, "hasil query harus sama dengan loop penuh"
+
+        print(f"{count:>10} {map_size:>8} {linear_ms:>16.3f} {hash_ms:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
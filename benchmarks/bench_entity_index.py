@@ -0,0 +1,91 @@
+"""
+Benchmark index entity bergerak
+-------------------------------
+Biaya satu langkah query gameplay terhadap N enemy:
+rebuild index + serangan player (rect), ledakan bomb
+(lingkaran), damage kontak (lingkaran) dan target terdekat.
+
+- loop     : cek semua enemy satu per satu (cara lama)
+- index    : DynamicSpatialHash (rebuild tiap langkah)
+
+Hasil kedua cara harus sama persis.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_entity_index
+"""
+import math
+import random
+import time
+
+import pygame
+
+from world.spatial_hash import DynamicSpatialHash
+
+MAP_SIZE = 2048
+REPEAT = 50
+
+
+class Entity:
+    def __init__(self, x, y, w, h):
+        self.hitbox = pygame.Rect(0, 0, w, h)
+        self.hitbox.center = (x, y)
+
+
+def circle_hits(box, x, y, radius):
+    dx = x - max(box.left, min(x, box.right))
+    dy = y - max(box.top, min(y, box.bottom))
+    return dx * dx + dy * dy <= radius * radius
+
+
+def brute_step(enemies, attack, bomb, player):
+    hit = [e for e in enemies if attack.colliderect(e.hitbox)]
+    boom = [e for e in enemies if circle_hits(e.hitbox, bomb[0], bomb[1], 90)]
+    contact = [e for e in enemies if circle_hits(e.hitbox, player[0], player[1], 40)]
+    nearest = min(enemies, key=lambda e: math.hypot(e.hitbox.centerx - player[0], e.hitbox.centery - player[1]))
+    return hit, boom, contact, nearest
+
+
+def index_step(index, enemies, attack, bomb, player):
+    index.rebuild(enemies)
+    hit = index.query_rect(attack)
+    boom = index.query_circle(bomb[0], bomb[1], 90)
+    contact = index.query_circle(player[0], player[1], 40)
+    nearest = index.nearest(player[0], player[1], 1)[0][1]
+    return hit, boom, contact, nearest
+
+
+def main():
+    rng = random.Random(9)
+    print(f"{'enemy':>7} {'loop ms':>8} {'index ms':>9} {'speedup':>8}")
+    for count in (20, 100, 500, 2000, 10000):
+        enemies = [
+            Entity(rng.uniform(0, MAP_SIZE), rng.uniform(0, MAP_SIZE),
+                   rng.choice((35, 86)), rng.choice((28, 70)))
+            for _ in range(count)
+        ]
+        player = (rng.uniform(0, MAP_SIZE), rng.uniform(0, MAP_SIZE))
+        attack = pygame.Rect(player[0] + 10, player[1] - 10, 40, 30)
+        bomb = (player[0] + 60, player[1])
+        index = DynamicSpatialHash(64)
+
+        expected = brute_step(enemies, attack, bomb, player)
+        result = index_step(index, enemies, attack, bomb, player)
+        for a, b in zip(expected[:3], result[:3]):
+            assert set(map(id, a)) == set(map(id, b))
+        assert expected[3] is result[3]
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            brute_step(enemies, attack, bomb, player)
+        loop_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            index_step(index, enemies, attack, bomb, player)
+        index_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+        print(f"{count:>7} {loop_ms:>8.3f} {index_ms:>9.3f} {loop_ms / index_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark horde enemy
+---------------------
+Waktu update per frame vs jumlah enemy (setengah slime,
+setengah skeleton) yang mengejar satu target di map dengan wall:
+- sprite : Slime / Skeleton biasa (pygame.sprite.Group.update)
+- horde  : Horde (struct of arrays NumPy, update batch)
+
+Keduanya memakai OccupancyGrid + FlowField yang sama.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_horde
+"""
+import contextlib
+import io
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from entities import horde as horde_module
+from entities.horde import Horde, skeleton_archetype, slime_archetype
+from entities.skeleton import Skeleton
+from entities.slime import Slime
+from world.navigation import FlowField
+from world.occupancy import OccupancyGrid
+from world.spatial_hash import SpatialHash
+
+MAP_SIZE = 2048
+WALLS = 120
+DT = 1 / 60
+FRAMES = 30
+# sprite di atas jumlah ini terlalu lambat untuk diukur lama
+SPRITE_LIMIT = 2000
+
+
+class Target:
+    """Target diam di tengah map (pengganti player)."""
+
+    def __init__(self, x, y):
+        self.hitbox = pygame.Rect(0, 0, 14, 16)
+        self.hitbox.center = (x, y)
+        self.hits = 0
+
+    def take_damage(self, amount):
+        self.hits += amount
+
+    def get_hp(self):
+        return 3
+
+
+def make_walls(rng):
+    walls = []
+    for _ in range(WALLS):
+        w, h = rng.randint(20, 160), rng.randint(20, 120)
+        walls.append(pygame.Rect(rng.randint(0, MAP_SIZE - w), rng.randint(0, MAP_SIZE - h), w, h))
+    return walls
+
+
+def free_positions(rng, grid, count):
+    positions = []
+    while len(positions) < count:
+        x, y = rng.uniform(64, MAP_SIZE - 64), rng.uniform(64, MAP_SIZE - 64)
+        if not any(grid.blocked_at(x + ox, y + oy) for ox in (-24, 24) for oy in (-32, 32)):
+            positions.append((x, y))
+    return positions
+
+
+def time_frames(update):
+    update()  # pemanasan (flow field, tabel arah)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        update()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = random.Random(11)
+
+    walls = make_walls(rng)
+    index = SpatialHash.from_rects(walls, 64)
+    grid = OccupancyGrid(walls, MAP_SIZE, MAP_SIZE, 16)
+    target = Target(*free_positions(rng, grid, 1)[0])
+    archetypes = [slime_archetype(), skeleton_archetype()]
+
+    has_numpy = horde_module.numpy is not None
+    print(f"{'enemy':>7} {'sprite ms':>10} {'horde ms':>9} {'speedup':>8}")
+    for count in (20, 100, 500, 1000, 2000, 5000, 10000):
+        positions = free_positions(rng, grid, count)
+
+        sprite_text = "-"
+        sprite_ms = None
+        if count <= SPRITE_LIMIT:
+            flow = FlowField(grid)
+            flow.update(target.hitbox.center)
+            group = pygame.sprite.Group()
+            for i, (x, y) in enumerate(positions):
+                cls = Slime if i % 2 == 0 else Skeleton
+                group.add(cls(x, y, target, index, grid, flow))
+            # Slime mencetak log saat kena target
+            with contextlib.redirect_stdout(io.StringIO()):
+                sprite_ms = time_frames(lambda: group.update(DT))
+            sprite_text = f"{sprite_ms:.2f}"
+
+        horde_text = speedup = "-"
+        if has_numpy:
+            flow = FlowField(grid)
+            flow.update(target.hitbox.center)
+            horde = Horde(archetypes, grid, flow)
+            for i, (x, y) in enumerate(positions):
+                horde.spawn(i % 2, x, y)
+            horde_ms = time_frames(lambda: horde.update(DT, target))
+            horde_text = f"{horde_ms:.2f}"
+            if sprite_ms is not None:
+                speedup = f"{sprite_ms / horde_ms:.0f}x"
+
+        print(f"{count:>7} {sprite_text:>10} {horde_text:>9} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark line of sight
+-----------------------
+Membandingkan cek garis enemy → player sepanjang 500 px:
+- line_blocked     : langkah per pixel + Rect 2x2 vs wall
+- OccupancyGrid    : DDA per cell dengan early exit
+
+Jalankan dari root project:
+    python -m benchmarks.bench_line_of_sight
+"""
+import math
+import random
+import time
+
+import pygame
+
+from entities.slime import line_blocked
+from world.occupancy import OccupancyGrid
+from world.spatial_hash import SpatialHash
+
+MAP_SIZE = 2048
+WALLS = 120
+DISTANCE = 500
+SEGMENTS = 2000
+
+
+def make_walls(rng):
+    walls = []
+    for _ in range(WALLS):
+        # campuran wall tipis panjang dan blok, seperti mainMap.tmx
+        if rng.random() < 0.5:
+            w, h = rng.choice([(rng.randint(4, 8), rng.randint(40, 360)),
+                               (rng.randint(40, 360), rng.randint(4, 8))])
+        else:
+            w, h = rng.randint(20, 160), rng.randint(20, 120)
+        walls.append(pygame.Rect(rng.randint(0, MAP_SIZE - w), rng.randint(0, MAP_SIZE - h), w, h))
+    return walls
+
+
+def make_segments(rng):
+    segments = []
+    while len(segments) < SEGMENTS:
+        x, y = rng.uniform(0, MAP_SIZE), rng.uniform(0, MAP_SIZE)
+        angle = rng.uniform(0, math.tau)
+        ex = x + math.cos(angle) * DISTANCE
+        ey = y + math.sin(angle) * DISTANCE
+        if 0 <= ex < MAP_SIZE and 0 <= ey < MAP_SIZE:
+            segments.append(((int(x), int(y)), (int(ex), int(ey))))
+    return segments
+
+
+def main():
+    rng = random.Random(5)
+    walls = make_walls(rng)
+    segments = make_segments(rng)
+
+    index = SpatialHash.from_rects(walls, 64)
+    grid = OccupancyGrid(walls, MAP_SIZE, MAP_SIZE, 16)
+
+    start = time.perf_counter()
+    old = [line_blocked(a, b, index) for a, b in segments]
+    old_us = (time.perf_counter() - start) / SEGMENTS * 1e6
+
+    start = time.perf_counter()
+    new = [not grid.line_of_sight(a, b) for a, b in segments]
+    new_us = (time.perf_counter() - start) / SEGMENTS * 1e6
+
+    # grid konservatif: boleh lebih sering "blocked", tidak boleh lolos wall
+    missed = sum(1 for o, n in zip(old, new) if o and not n)
+    agree = sum(1 for o, n in zip(old, new) if o == n) / SEGMENTS * 100
+
+    print(f"segments        : {SEGMENTS} x {DISTANCE} px, {WALLS} walls")
+    print(f"line_blocked    : {old_us:8.1f} us/query")
+    print(f"grid DDA        : {new_us:8.1f} us/query")
+    print(f"speedup         : {old_us / new_us:8.1f}x")
+    print(f"agreement       : {agree:.1f}%  (walls missed by grid: {missed})")
+
+
+if __name__ == "__main__":
+    main()
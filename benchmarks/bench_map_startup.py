@@ -0,0 +1,67 @@
+"""
+Benchmark startup map
+---------------------
+Mengukur waktu MapLoader.load untuk:
+- cold : cache belum ada (parse TMX dengan pytmx + bake + tulis cache)
+- warm : cache valid (baca file cache, pytmx tidak di-import)
+
+Setiap pengukuran dijalankan di proses Python baru supaya
+waktu import modul ikut terhitung seperti saat game dibuka.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_map_startup
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+MAP_PATH = "assets/maps/mainMap.tmx"
+RUNS = 3
+
+CHILD = r"""
+import os, sys, time
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+start = time.perf_counter()
+import pygame
+pygame.display.init()
+pygame.display.set_mode((1, 1))
+from world.map_loader import MapLoader
+m = MapLoader()
+m.load(sys.argv[1], cache_dir=sys.argv[2])
+elapsed = (time.perf_counter() - start) * 1000
+print(f"{elapsed:.1f} {'pytmx' in sys.modules}")
+"""
+
+
+def run_child(cache_dir):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, MAP_PATH, cache_dir],
+        capture_output=True, text=True, check=True, env=env
+    ).stdout.strip().splitlines()[-1]
+    ms, pytmx_loaded = out.split()
+    return float(ms), pytmx_loaded == "True"
+
+
+def main():
+    cache_dir = tempfile.mkdtemp(prefix="fs-map-cache-")
+    try:
+        cold = []
+        for _ in range(RUNS):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(run_child(cache_dir))
+
+        warm = [run_child(cache_dir) for _ in range(RUNS)]
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for name, results in (("cold", cold), ("warm", warm)):
+        best = min(ms for ms, _ in results)
+        pytmx_loaded = any(flag for _, flag in results)
+        print(f"{name:>5}: {best:8.1f} ms  (pytmx imported: {pytmx_loaded})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark spawn posisi aman
+---------------------------
+Membandingkan pencarian posisi spawn 32x32 pada map yang
+hampir penuh wall:
+- rejection sampling (cara lama get_random_safe_position)
+- SpawnIndex.sample (cell aman dihitung sekali)
+
+Jalankan dari root project:
+    python -m benchmarks.bench_spawn
+"""
+import random
+import time
+
+import pygame
+
+from world.occupancy import OccupancyGrid
+from world.spatial_hash import SpatialHash
+from world.spawn_index import SpawnIndex
+
+MAP_SIZE = 2048
+SAFE_SIZE = 32
+SAMPLES = 200
+
+
+def make_dense_walls(rng, free_ratio):
+    """Map penuh blok 64x64; hanya sebagian kecil yang dibiarkan kosong."""
+    walls = []
+    for y in range(0, MAP_SIZE, 64):
+        for x in range(0, MAP_SIZE, 64):
+            if rng.random() >= free_ratio:
+                walls.append(pygame.Rect(x, y, 64, 64))
+    return walls
+
+
+def rejection_sample(rng, index):
+    tries = 0
+    while True:
+        tries += 1
+        x = rng.randint(0, MAP_SIZE - SAFE_SIZE)
+        y = rng.randint(0, MAP_SIZE - SAFE_SIZE)
+        test = pygame.Rect(x, y, SAFE_SIZE, SAFE_SIZE)
+        if test.collidelist(index.query(test)) == -1:
+            return tries
+
+
+def main():
+    print(f"{'free area':>10} {'rejection us':>13} {'tries':>7} {'index us':>9} {'build ms':>9}")
+    for free_ratio in (0.5, 0.1, 0.02):
+        rng = random.Random(7)
+        walls = make_dense_walls(rng, free_ratio)
+        hash_index = SpatialHash.from_rects(walls, 64)
+
+        start = time.perf_counter()
+        tries = sum(rejection_sample(rng, hash_index) for _ in range(SAMPLES))
+        old_us = (time.perf_counter() - start) / SAMPLES * 1e6
+
+        start = time.perf_counter()
+        grid = OccupancyGrid(walls, MAP_SIZE, MAP_SIZE, 16)
+        spawn = SpawnIndex(grid, MAP_SIZE, MAP_SIZE, SAFE_SIZE)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(SAMPLES):
+            spawn.sample(rng)
+        new_us = (time.perf_counter() - start) / SAMPLES * 1e6
+
+        print(f"{free_ratio * 100:>9.0f}% {old_us:>13.1f} {tries / SAMPLES:>7.1f} "
+              f"{new_us:>9.1f} {build_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
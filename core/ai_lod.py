@@ -0,0 +1,127 @@
+class AILevelOfDetail:
+
+    """
+    AILevelOfDetail
+    ---------------
+    Level of detail update enemy berdasarkan jarak ke viewport.
+
+    Tier:
+    - active : di layar (+ margin) → update penuh setiap step
+    - near   : di luar layar tapi dekat → update penuh setiap
+               near_interval step dengan dt yang dikumpulkan
+    - far    : jauh → coarse_update() setiap far_interval step
+               (ikut flow field, tanpa line of sight & animasi)
+
+    dt tiap enemy dikumpulkan (accumulator), jadi total waktu
+    simulasi tetap sama walaupun update-nya lebih jarang.
+    Jadwal update disebar (fase per enemy) supaya enemy near / far
+    tidak ter-update bersamaan di step yang sama: update pertama
+    enemy baru ditunda 0..interval-1 step, dt yang diberikan ke
+    update tidak pernah melebihi waktu yang benar-benar lewat.
+
+    Dengan scheduler (AIScheduler), think() enemy active & near
+    dijalankan bergiliran oleh scheduler dan update penuh hanya
+    memanggil integrate() (gerak, animasi, cooldown).
+    """
+
+    TIERS = ("active", "near", "far")
+
+    def __init__(self, active_margin=64, near_distance=512, near_interval=3, far_interval=12,
+                 scheduler=None):
+        self.active_margin = active_margin
+        self.near_distance = near_distance
+        self.near_interval = near_interval
+        self.far_interval = far_interval
+        self.scheduler = scheduler
+
+        # enemy -> dt yang belum diproses (negatif = masih ditunda)
+        self._pending = {}
+        # fase awal enemy berikutnya (urutan masuk, bukan id() → deterministik)
+        self.next_phase = 0
+        # jumlah enemy per tier & update pada step terakhir
+        self.counts = {tier: 0 for tier in self.TIERS}
+        self.updates = {"full": 0, "coarse": 0}
+
+    def tier_of(self, enemy, view):
+        """Tier enemy dari jarak pusat hitbox ke tepi view (0 = di dalam)."""
+        x, y = enemy.hitbox.center
+        dx = max(view.left - x, 0, x - view.right)
+        dy = max(view.top - y, 0, y - view.bottom)
+        dist = max(dx, dy)
+        if dist <= self.active_margin:
+            return 0
+        if dist <= self.near_distance:
+            return 1
+        return 2
+
+    def update(self, enemies, view, dt):
+        """Update semua enemy sesuai tier-nya untuk satu step sebesar dt."""
+        pending = self._pending
+        counts = [0, 0, 0]
+        full = coarse = 0
+        intervals = (1, self.near_interval, self.far_interval)
+        scheduler = self.scheduler
+
+        tiers = [(enemy, self.tier_of(enemy, view)) for enemy in enemies]
+        if scheduler is not None:
+            # keputusan AI hanya untuk enemy active & near
+            scheduler.run([enemy for enemy, tier in tiers if tier < 2])
+
+        for enemy, tier in tiers:
+            counts[tier] += 1
+
+            waited = pending.get(enemy)
+            if waited is None:
+                # fase awal berbeda per enemy → update tersebar.
+                # Offset negatif = update pertama ditunda beberapa step
+                # (seperti spawn sedikit lebih lambat), bukan dt palsu.
+                waited = -(self.next_phase % intervals[tier]) * dt
+                self.next_phase += 1
+            elif waited < 0 and tier == 0:
+                # masuk layar sebelum update pertama → jangan ditunda lagi
+                waited = 0.0
+            waited += dt
+
+            if waited < intervals[tier] * dt - 1e-9:
+                pending[enemy] = waited
+                continue
+
+            pending[enemy] = 0.0
+            if tier == 2:
+                enemy.coarse_update(waited)
+                coarse += 1
+            elif scheduler is not None:
+                enemy.integrate(waited)
+                full += 1
+            else:
+                enemy.update(waited)
+                full += 1
+
+        self.counts = dict(zip(self.TIERS, counts))
+        self.updates = {"full": full, "coarse": coarse}
+
+    def pending_of(self, enemy):
+        """dt enemy yang belum diproses (None = belum pernah dijadwalkan)."""
+        return self._pending.get(enemy)
+
+    def restore(self, phase, pending):
+        """Pasang state dari snapshot: fase berikutnya & {enemy: dt}."""
+        self._pending = dict(pending)
+        self.next_phase = phase
+
+    def forget(self, enemy):
+        """Hapus state enemy yang mati / kembali ke pool."""
+        self._pending.pop(enemy, None)
+        if self.scheduler is not None:
+            self.scheduler.forget(enemy)
+
+    def clear(self):
+        self._pending.clear()
+        self.next_phase = 0
+        if self.scheduler is not None:
+            self.scheduler.clear()
+
+    def report(self):
+        report = dict(self.counts)
+        report.update(self.updates)
+        return report
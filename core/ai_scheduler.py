@@ -0,0 +1,140 @@
+import time
+from collections import deque
+
+
+class AIScheduler:
+
+    """
+    AIScheduler
+    -----------
+    Membagi bagian mahal AI enemy (think(): line of sight,
+    arah kejar) ke beberapa step secara round-robin dengan
+    budget waktu CPU per step.
+
+    - Setiap step enemy diambil dari depan antrean lalu think(),
+      selama perkiraan waktu think berikutnya (rata-rata bergerak)
+      masih muat di budget_ms (minimal min_thinks enemy per step
+      supaya antrean tetap maju) atau semua enemy sudah dapat giliran.
+    - Enemy baru masuk ke depan antrean (langsung think).
+    - Gerak murah (integrate) tetap jalan tiap step untuk semua enemy
+      memakai velocity hasil think terakhir, jadi tidak tersendat.
+
+    budget_ms = None → tanpa batas waktu, hanya max_thinks
+    (hasil deterministik, tidak bergantung kecepatan CPU).
+
+    Statistik:
+    - thinks       : total think
+    - overruns     : step yang waktu think-nya melebihi budget
+    - latency      : step sejak think sebelumnya (rata-rata & maks)
+    - last_ms/max_ms : waktu think pada step terakhir / terburuk
+    """
+
+    def __init__(self, budget_ms=1.0, min_thinks=4, max_thinks=None):
+        self.budget_ms = budget_ms
+        self.min_thinks = min_thinks
+        self.max_thinks = max_thinks
+
+        self._queue = deque()
+        # enemy -> nomor step think terakhir
+        self._last_think = {}
+        self._step = 0
+        # perkiraan waktu satu think (detik, rata-rata bergerak)
+        self._think_cost = 0.0
+
+        self.stats = {
+            "steps": 0,
+            "thinks": 0,
+            "overruns": 0,
+            "latency_total": 0,
+            "latency_samples": 0,
+            "max_latency": 0,
+            "last_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    def run(self, enemies):
+        """Think untuk sebagian enemy di step ini, kembalikan jumlahnya."""
+        self._step += 1
+        queue = self._queue
+        last_think = self._last_think
+
+        # sinkron antrean: enemy baru di depan, yang hilang dibuang
+        # (urutan dari list enemies, bukan set → deterministik)
+        current = set(enemies)
+        for enemy in enemies:
+            if enemy not in last_think:
+                last_think[enemy] = None
+                queue.appendleft(enemy)
+        if len(last_think) > len(current):
+            for enemy in [e for e in last_think if e not in current]:
+                del last_think[enemy]
+            self._queue = queue = deque(e for e in queue if e in current)
+
+        limit = len(queue)
+        if self.max_thinks is not None:
+            limit = min(limit, self.max_thinks)
+        budget = self.budget_ms / 1000 if self.budget_ms is not None else None
+
+        stats = self.stats
+        start = time.perf_counter()
+        elapsed = 0.0
+        done = 0
+        while done < limit:
+            if budget is not None and done >= self.min_thinks and elapsed + self._think_cost > budget:
+                break
+
+            enemy = queue.popleft()
+            enemy.think()
+            queue.append(enemy)
+
+            previous = last_think[enemy]
+            if previous is not None:
+                latency = self._step - previous
+                stats["latency_total"] += latency
+                stats["latency_samples"] += 1
+                if latency > stats["max_latency"]:
+                    stats["max_latency"] = latency
+            last_think[enemy] = self._step
+
+            done += 1
+            elapsed = time.perf_counter() - start
+
+        if done:
+            self._think_cost += (elapsed / done - self._think_cost) * 0.1
+        elapsed_ms = elapsed * 1000
+        stats["steps"] += 1
+        stats["thinks"] += done
+        stats["last_ms"] = elapsed_ms
+        if elapsed_ms > stats["max_ms"]:
+            stats["max_ms"] = elapsed_ms
+        if budget is not None and elapsed > budget:
+            stats["overruns"] += 1
+        return done
+
+    def order(self):
+        """Urutan antrean think sekarang (depan = giliran berikutnya)."""
+        return list(self._queue)
+
+    def restore(self, order):
+        """Pasang urutan antrean dari snapshot."""
+        self._queue = deque(order)
+        self._last_think = {enemy: None for enemy in order}
+
+    def forget(self, enemy):
+        """Hapus enemy yang mati / kembali ke pool dari antrean."""
+        if enemy in self._last_think:
+            del self._last_think[enemy]
+            self._queue.remove(enemy)
+
+    def clear(self):
+        self._queue.clear()
+        self._last_think.clear()
+        self._step = 0
+
+    def report(self):
+        """Statistik + rata-rata latency think (dalam step)."""
+        report = dict(self.stats)
+        total = report.pop("latency_total")
+        samples = report.pop("latency_samples")
+        report["avg_latency"] = total / samples if samples else 0.0
+        return report
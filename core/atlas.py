@@ -0,0 +1,198 @@
+import pygame
+
+# warna colorkey page (dipilih yang hampir tidak pernah dipakai sprite)
+COLORKEY = (255, 0, 255)
+
+
+class TextureAtlas:
+
+    """
+    TextureAtlas
+    ------------
+    Menggabungkan banyak frame animasi kecil ke beberapa surface
+    besar (page) dengan shelf packing.
+
+    Jenis page:
+    - colorkey : frame yang alpha-nya biner (0 / 255), page di-set
+                 colorkey + RLEACCEL → blit sangat cepat
+    - alpha    : frame dengan alpha bertingkat (per-pixel alpha)
+
+    Frame hasil pack berupa subsurface dari page, jadi tetap bisa
+    dipakai seperti Surface biasa (get_rect, get_size, ...).
+
+    PENTING: page colorkey memakai RLE. Blit subsurface-nya secara
+    langsung memaksa SDL membongkar RLE setiap kali (sangat lambat).
+    Gambar frame atlas selalu lewat blit_args() / blit_batch(),
+    yang mem-blit page + area.
+    """
+
+    def __init__(self, page_width=2048, max_page_height=2048, padding=1, rle=True):
+        self.page_width = page_width
+        self.max_page_height = max_page_height
+        self.padding = padding
+        self.rle = rle
+
+        self.pages = []
+        # id(frame atlas) -> (page, area Rect)
+        self.regions = {}
+        # referensi frame agar id() tetap unik selama atlas hidup
+        self._frames = []
+
+        self.stats = {"frames": 0, "pages": 0, "page_bytes": 0, "source_bytes": 0}
+
+    # ==========================================================
+    # PACK
+    # ==========================================================
+    def pack(self, frame_sets):
+        """
+        Pack beberapa set frame sekaligus.
+
+        frame_sets: list tuple/list Surface
+        Mengembalikan list tuple subsurface dengan urutan yang sama.
+        """
+        # kelompokkan frame menurut jenis page
+        groups = {"colorkey": [], "alpha": []}
+        for set_index, frames in enumerate(frame_sets):
+            for frame_index, frame in enumerate(frames):
+                kind = "colorkey" if self._binary_alpha(frame) else "alpha"
+                groups[kind].append((set_index, frame_index, frame))
+
+        packed = [list(frames) for frames in frame_sets]
+        for kind, items in groups.items():
+            # frame tinggi dulu → shelf lebih rapat
+            items.sort(key=lambda item: (-item[2].get_height(), -item[2].get_width()))
+            # RLE harus melewati semua baris di atas area yang di-blit,
+            # jadi page colorkey dibuat satu shelf (pendek) per page
+            for page, placements in self._layout(items, single_shelf=(kind == "colorkey")):
+                surface = self._create_page(page, kind)
+                for (set_index, frame_index, frame), pos in placements:
+                    surface.blit(frame, pos)
+                if kind == "colorkey":
+                    surface.set_colorkey(COLORKEY, pygame.RLEACCEL if self.rle else 0)
+
+                for (set_index, frame_index, frame), pos in placements:
+                    area = pygame.Rect(pos, frame.get_size())
+                    sub = surface.subsurface(area)
+                    self.regions[id(sub)] = (surface, area)
+                    self._frames.append(sub)
+                    packed[set_index][frame_index] = sub
+
+                    self.stats["frames"] += 1
+                    self.stats["source_bytes"] += _surface_bytes(frame)
+
+                self.pages.append(surface)
+                self.stats["pages"] += 1
+                self.stats["page_bytes"] += _surface_bytes(surface)
+
+        return [tuple(frames) for frames in packed]
+
+    def _layout(self, items, single_shelf=False):
+        """
+        Shelf packing: isi baris kiri → kanan, baris baru jika penuh,
+        page baru jika tinggi page melewati max_page_height
+        (atau setiap shelf jika single_shelf).
+        Menghasilkan (ukuran page, [(item, posisi)]).
+        """
+        pad = self.padding
+        placements = []
+        x = y = shelf_h = 0
+
+        for item in items:
+            w, h = item[2].get_size()
+            if w > self.page_width or h > self.max_page_height:
+                raise ValueError(f"frame {w}x{h} lebih besar dari page atlas")
+
+            if x + w > self.page_width:
+                if single_shelf:
+                    # shelf baru = page baru
+                    yield (x - pad, shelf_h), placements
+                    placements = []
+                    x = shelf_h = 0
+                else:
+                    # shelf baru
+                    x = 0
+                    y += shelf_h + pad
+                    shelf_h = 0
+            if y + h > self.max_page_height:
+                # page baru
+                yield (self.page_width, y), placements
+                placements = []
+                x = y = shelf_h = 0
+
+            placements.append((item, (x, y)))
+            x += w + pad
+            shelf_h = max(shelf_h, h)
+
+        if placements:
+            width = x - pad if single_shelf else self.page_width
+            yield (width, y + shelf_h), placements
+
+    def _create_page(self, size, kind):
+        has_display = pygame.display.get_surface() is not None
+        if kind == "colorkey":
+            page = pygame.Surface(size)
+            if has_display:
+                page = page.convert()
+            page.fill(COLORKEY)
+        else:
+            page = pygame.Surface(size, pygame.SRCALPHA)
+            if has_display:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+        return page
+
+    @staticmethod
+    def _binary_alpha(frame):
+        """
+        True jika semua pixel frame transparan penuh / opaque penuh
+        dan frame tidak memakai warna COLORKEY pada pixel opaque.
+        """
+        visible = pygame.mask.from_surface(frame, 0)
+        opaque = pygame.mask.from_surface(frame, 254)
+        if visible.count() != opaque.count():
+            return False
+        keyed = pygame.mask.from_threshold(frame, COLORKEY + (255,), (1, 1, 1, 255))
+        return keyed.overlap_area(opaque, (0, 0)) == 0
+
+    # ==========================================================
+    # DRAW
+    # ==========================================================
+    def blit_args(self, image, pos):
+        """
+        Argumen blit untuk Surface.blits():
+        frame atlas → (page, pos, area), surface lain → (image, pos).
+        """
+        region = self.regions.get(id(image))
+        if region is None:
+            return (image, pos)
+        return (region[0], pos, region[1])
+
+    def blit_batch(self, target, sprites, camera_x, camera_y, position=None):
+        """
+        Gambar banyak sprite (image + rect) dengan satu blits().
+        position(sprite) opsional: posisi dunia pengganti rect.topleft
+        (mis. hasil interpolasi render).
+        """
+        regions = self.regions
+        batch = []
+        for sprite in sprites:
+            image = sprite.image
+            if position is None:
+                pos = (sprite.rect.x - camera_x, sprite.rect.y - camera_y)
+            else:
+                x, y = position(sprite)
+                pos = (round(x - camera_x), round(y - camera_y))
+            region = regions.get(id(image))
+            if region is None:
+                batch.append((image, pos))
+            else:
+                batch.append((region[0], pos, region[1]))
+        target.blits(batch, doreturn=False)
+
+    def memory_report(self):
+        """Jumlah frame & page serta memori pixel (sumber vs page)."""
+        return dict(self.stats)
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
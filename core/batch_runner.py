@@ -0,0 +1,207 @@
+"""
+Batch runner simulasi headless
+------------------------------
+Menjalankan banyak sesi Game headless paralel (multiprocessing.Pool)
+untuk balancing. Tiap sesi punya seed, set parameter dan policy bot;
+hasilnya (lama bertahan, score, damage, biaya per step) ditulis ke
+satu tabel CSV.
+
+Jalankan dari root project:
+    python -m core.batch_runner --seeds 20 --param enemy_max_limit=10,20,30 \\
+        --param slime_speed=70,80,90 --out batch_results.csv
+"""
+import argparse
+import contextlib
+import csv
+import itertools
+import multiprocessing
+import os
+import time
+
+from core.settings import SIM_HZ
+from core.input import BotInput, ScriptedInput
+from entities.slime import Slime
+from entities.skeleton import Skeleton
+
+# parameter atribut Game (di-set sebelum start_run)
+GAME_PARAMS = ("enemy_increase_interval", "enemy_max_limit", "max_hp_pickup")
+
+# parameter atribut class enemy (dipakai saat enemy dibuat)
+CLASS_PARAMS = {
+    "slime_speed": (Slime, "SPEED"),
+    "slime_damage_delay": (Slime, "DAMAGE_DELAY"),
+    "skeleton_speed": (Skeleton, "SPEED"),
+    "skeleton_attack_cooldown": (Skeleton, "ATTACK_COOLDOWN"),
+    "skeleton_attack_distance": (Skeleton, "ATTACK_DISTANCE"),
+}
+
+# policy player: nama -> pembuat input source dari seed
+POLICIES = {
+    "bot": lambda seed: BotInput(seed),
+    "idle": lambda seed: ScriptedInput([]),
+}
+
+RESULT_FIELDS = (
+    "run", "seed", "policy", "params", "survived_s", "died", "score",
+    "damage_taken", "steps", "step_ms_mean", "step_ms_p95", "step_ms_max", "wall_s",
+)
+
+
+# ==========================================================
+# GRID PARAMETER
+# ==========================================================
+def build_tasks(space, seeds, policy="bot", seconds=300):
+    """
+    Semua kombinasi parameter (product) x seed → daftar task.
+
+    space: {"enemy_max_limit": [10, 20], "slime_speed": [70, 80], ...}
+    """
+    for name in space:
+        if name not in GAME_PARAMS and name not in CLASS_PARAMS:
+            raise ValueError(f"Parameter tidak dikenal: {name}")
+    if policy not in POLICIES:
+        raise ValueError(f"Policy tidak dikenal: {policy}")
+
+    names = sorted(space)
+    tasks = []
+    for values in itertools.product(*(space[name] for name in names)):
+        params = dict(zip(names, values))
+        for seed in seeds:
+            tasks.append({
+                "run": len(tasks),
+                "seed": seed,
+                "policy": policy,
+                "params": params,
+                "seconds": seconds,
+            })
+    return tasks
+
+
+# ==========================================================
+# SATU SESI (DI PROSES WORKER)
+# ==========================================================
+def run_session(task):
+    """Satu game headless sampai player mati / waktu habis → satu baris hasil."""
+    from core.game import Game
+
+    params = task["params"]
+    seed = task["seed"]
+
+    # atribut class dipakai bersama → simpan nilai asli (worker dipakai ulang)
+    saved = {name: getattr(*CLASS_PARAMS[name]) for name in params if name in CLASS_PARAMS}
+    try:
+        for name, value in params.items():
+            if name in CLASS_PARAMS:
+                setattr(*CLASS_PARAMS[name], value)
+
+        game = Game(headless=True, input_source=POLICIES[task["policy"]](seed), seed=seed)
+        for name, value in params.items():
+            if name in GAME_PARAMS:
+                setattr(game, name, value)
+        # mulai dari awal dengan parameter baru
+        game.start_run(seed)
+
+        dt = game.timestep.step_dt
+        total_steps = int(task["seconds"] * SIM_HZ)
+        costs = []
+        start = time.perf_counter()
+        while len(costs) < total_steps and game.state == "PLAY":
+            t = time.perf_counter()
+            game.step(dt)
+            costs.append(time.perf_counter() - t)
+        wall = time.perf_counter() - start
+    finally:
+        for name, value in saved.items():
+            setattr(*CLASS_PARAMS[name], value)
+
+    costs.sort()
+    steps = len(costs)
+    return {
+        "run": task["run"],
+        "seed": seed,
+        "policy": task["policy"],
+        "params": ";".join(f"{k}={v}" for k, v in sorted(params.items())),
+        "survived_s": round(steps * dt, 3),
+        "died": game.state == "GAMEOVER",
+        "score": game.get_score(),
+        "damage_taken": game.player.damage_taken,
+        "steps": steps,
+        "step_ms_mean": round(sum(costs) / steps * 1000, 4) if steps else 0.0,
+        "step_ms_p95": round(costs[int(steps * 0.95)] * 1000, 4) if steps else 0.0,
+        "step_ms_max": round(costs[-1] * 1000, 4) if steps else 0.0,
+        "wall_s": round(wall, 3),
+    }
+
+
+def _run_quiet(task):
+    # log game (print per hit / kill) tidak perlu di batch
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return run_session(task)
+
+
+# ==========================================================
+# BATCH
+# ==========================================================
+def run_batch(tasks, out_path="batch_results.csv", processes=None):
+    """
+    Jalankan semua task di multiprocessing.Pool (default: semua core),
+    tulis hasil ke CSV sesuai urutan selesai. Mengembalikan daftar hasil.
+    """
+    results = []
+    start = time.perf_counter()
+    with open(out_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+
+        if processes == 1:
+            rows = map(_run_quiet, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(processes)
+            rows = pool.imap_unordered(_run_quiet, tasks)
+
+        try:
+            for row in rows:
+                writer.writerow(row)
+                results.append(row)
+                print(f"[Batch] {len(results)}/{len(tasks)} run {row['run']}: "
+                      f"bertahan {row['survived_s']:.0f} s, score {row['score']}")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    wall = time.perf_counter() - start
+    sim = sum(row["survived_s"] for row in results)
+    print(f"[Batch] {len(results)} run ({sim:.0f} s game) dalam {wall:.1f} s → {out_path}")
+    return results
+
+
+def _parse_param(text):
+    name, _, values = text.partition("=")
+    parsed = []
+    for value in values.split(","):
+        parsed.append(float(value) if "." in value else int(value))
+    return name, parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch simulasi headless untuk balancing")
+    parser.add_argument(
+        "--param", action="append", default=[], type=_parse_param,
+        help="nama=nilai1,nilai2,... (boleh berulang): "
+             + ", ".join(GAME_PARAMS + tuple(CLASS_PARAMS))
+    )
+    parser.add_argument("--seeds", type=int, default=4, help="jumlah seed per kombinasi")
+    parser.add_argument("--seconds", type=float, default=300, help="batas waktu game per sesi")
+    parser.add_argument("--policy", default="bot", choices=sorted(POLICIES))
+    parser.add_argument("--processes", type=int, default=None, help="default: semua core")
+    parser.add_argument("--out", default="batch_results.csv")
+    args = parser.parse_args()
+
+    tasks = build_tasks(dict(args.param), range(args.seeds), args.policy, args.seconds)
+    run_batch(tasks, args.out, args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,105 @@
+import itertools
+import math
+import os
+import time
 import pygame
 import random
 from core.settings import *
 from entities.player import Player
 from entities.slime import Slime
 from world.map_loader import MapLoader
+from core.spritesheet_loader import load_image_cached, pack_cached_frames, register_image
+from core.preloader import Preloader
+from core.pool import ObjectPool
+from core.ai_lod import AILevelOfDetail
+from core.ai_scheduler import AIScheduler
+from core.atlas import TextureAtlas
+from core.text_cache import TextCache
+from core.timestep import FixedTimestep, Interpolator
+from core.input import InputState, KeyboardInput, BotInput
+from core.replay import Replay, ReplayInput, world_checksum
+from core.snapshot import SnapshotRing, Autosaver, snapshot_game, restore_game
+from entities.thrown_bomb import ThrownBomb
+from world.navigation import FlowField
+from world.spatial_hash import DynamicSpatialHash
 from entities.health import HealthPickup
 from entities.skeleton import Skeleton
 from entities.BombPickup import BombPickup
+from entities.horde import Horde, slime_archetype, skeleton_archetype
 
 class Game:
     instance = None 
-    def __init__(self):
+    def __init__(self, headless=False, input_source=None, seed=None, record_path=None,
+                 enemy_backend=ENEMY_BACKEND):
+        """
+        headless=True: tanpa window & audio (driver dummy SDL),
+        tanpa render, dijalankan lewat run_headless().
+        input_source: sumber input player (default keyboard, atau
+        BotInput(seed) saat headless).
+        seed: seed Game.rng (semua spawn & efek acak). Dengan seed
+        atau record_path simulasi deterministik: think AI memakai
+        jumlah tetap per step, bukan budget waktu CPU.
+        record_path: run pertama direkam ke file replay ini, run
+        berikutnya ke file bernomor (run.fsr → run-2.fsr, run-3.fsr, ...).
+        enemy_backend: "sprite" (Slime / Skeleton) atau "horde" (Horde,
+        array NumPy untuk ribuan enemy).
+        """
+        if enemy_backend not in ("sprite", "horde"):
+            raise ValueError(f"ENEMY_BACKEND tidak dikenal: {enemy_backend}")
+        load_start = time.perf_counter()
+        self.headless = headless
+
+        # satu sumber acak per game (bisa diulang dengan seed yang sama)
+        self.rng = random.Random(seed)
+        self.deterministic = seed is not None or record_path is not None
+        self.record_path = record_path
+        # Replay yang sedang direkam (None = tidak merekam)
+        self.recording = None
+        # jumlah run yang sudah direkam (untuk nama file replay)
+        self.recorded_runs = 0
+        self.run_seed = seed
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
-        pygame.mixer.init()
+        if not headless:
+            pygame.mixer.init()
+        # display tetap dibuat (dummy saat headless) untuk convert()
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption("Top Down OOP Game")
+
+        # ===============================
+        # INPUT
+        # ===============================
+        if input_source is None:
+            # bot ikut seed game → headless dengan seed yang sama selalu sama
+            input_source = BotInput(seed) if headless else KeyboardInput()
+        self.input = input_source
+        # perintah player untuk langkah simulasi sekarang
+        self.controls = InputState()
+
+        # ===============================
+        # LOADING (WORKER THREAD + PROGRESS)
+        # ===============================
+        # gambar & map dimuat di worker, layar loading langsung tampil
+        self.map = MapLoader(foreground_layers=MAP_FOREGROUND_LAYERS)
+        loader = self.create_preloader()
+        assets = loader.run(
+            self.screen,
+            draw_progress=(lambda *args: None) if headless else None,
+            start=load_start
+        )
+
+        # sheet animasi masuk asset cache (sudah di-convert)
+        for path in self.animation_sheets():
+            register_image(path, assets[path])
+
+        # tile map di-convert di main thread
+        self.map.convert_tiles()
+
         # === MENU BACKGROUND ===
-        self.__menu_bg = pygame.image.load("assets/ui/bgMainMenu.jpg").convert()
+        self.__menu_bg = assets["menu_bg"]
         self.__menu_bg = pygame.transform.scale(
             self.__menu_bg, (SCREEN_W, SCREEN_H)
         )
@@ -38,14 +121,18 @@ class Game:
 
         self.clock = pygame.time.Clock()
 
-        self.heart_img = pygame.image.load("assets/ui/heart.png").convert_alpha()
+        # simulasi langkah tetap + interpolasi posisi saat render
+        self.timestep = FixedTimestep(SIM_HZ, MAX_SIM_STEPS)
+        self.interpolator = Interpolator()
+
+        self.heart_img = assets["heart"]
         w, h = self.heart_img.get_size()
         self.heart_img = pygame.transform.scale(self.heart_img, (w * 4, h * 4))
 
         self.hp_food_images = [
-            pygame.image.load("assets/food/watermelon.png").convert_alpha(),
-            pygame.image.load("assets/food/apple.png").convert_alpha(),
-            pygame.image.load("assets/food/chicken.png").convert_alpha()
+            assets["watermelon"],
+            assets["apple"],
+            assets["chicken"]
         ]
 
         self.hp_food_images = [
@@ -54,18 +141,19 @@ class Game:
 
         self.max_hp_pickup = 2
 
-        self.bomb_img = pygame.image.load("assets/bomb.png").convert_alpha()
+        self.bomb_img = load_image_cached("assets/bomb.png")
         self.bomb_available = True   # bomb siap untuk spawn
         self.current_bomb = None     # referensi bomb yang lagi ada
 
         Game.instance = self   # ← set instance
-        self.font = pygame.font.Font(None, 40)
+        # font dimuat sekali, teks statis di-render sekali
+        self.text = TextCache(max_entries=TEXT_CACHE_SIZE)
         self.__score = 0
 
-        self.__gameover_card = pygame.image.load("assets/ui/cardGameOver.png").convert_alpha()
+        self.__gameover_card = assets["gameover_card"]
 
         # === BUTTON IMAGES ===
-        self.btn_img = pygame.image.load("assets/ui/button.png").convert_alpha()
+        self.btn_img = assets["button"]
 
         # scale
         self.btn_img = pygame.transform.scale_by(self.btn_img, 3)
@@ -75,19 +163,17 @@ class Game:
         self.quit_rect  = self.btn_img.get_rect(center=(SCREEN_W//2, SCREEN_H//2 + 120))
 
         # ===============================
-        # MAP
+        # MAP (sudah dimuat oleh preloader)
         # ===============================
-        self.map = MapLoader()
-        self.map.load("assets/maps/mainMap.tmx")
-
         # Map size (biar gampang dipakai)
         self.map_width = self.map.map_width
         self.map_height = self.map.map_height
 
-        # Collider group dari MapLoader
-        self.walls = []
-        for rect in self.map.colliders:
-            self.walls.append(rect)
+        # Collider dari MapLoader (spatial index, query per area)
+        self.walls = self.map.collider_index
+
+        # Flow field bersama: semua enemy mengikuti arah menuju player
+        self.flow_field = FlowField(self.map.nav_grid)
 
         # ===============================
         # ENTITY GROUPS
@@ -98,14 +184,79 @@ class Game:
         self.bomb_pickups = pygame.sprite.Group()
         self.projectiles = pygame.sprite.Group()
 
+        # ===============================
+        # OBJECT POOL (enemy & bomb didaur ulang)
+        # ===============================
+        self.enemy_pools = {
+            Slime: ObjectPool(
+                lambda x, y: Slime(x, y, self.player, self.walls, self.map.grid, self.flow_field)
+            ),
+            Skeleton: ObjectPool(
+                lambda x, y: Skeleton(x, y, self.player, self.walls, self.map.grid, self.flow_field)
+            ),
+        }
+        self.bomb_pool = ObjectPool(ThrownBomb)
+
+        # index spasial entity bergerak, dibangun ulang tiap step
+        self.enemy_index = DynamicSpatialHash(ENTITY_INDEX_CELL)
+        self.pickup_index = DynamicSpatialHash(ENTITY_INDEX_CELL)
+        self.bomb_pickup_index = DynamicSpatialHash(ENTITY_INDEX_CELL)
+
+        # AI level of detail: enemy jauh dari layar di-update lebih jarang,
+        # think() (line of sight, arah kejar) dibagi antar step sesuai budget
+        if self.deterministic:
+            self.ai_scheduler = AIScheduler(None, AI_THINK_MIN, AI_THINK_FIXED)
+        else:
+            self.ai_scheduler = AIScheduler(AI_THINK_BUDGET_MS, AI_THINK_MIN)
+        self.ai_lod = AILevelOfDetail(
+            AI_LOD_ACTIVE_MARGIN, AI_LOD_NEAR_DISTANCE,
+            AI_LOD_NEAR_INTERVAL, AI_LOD_FAR_INTERVAL,
+            scheduler=self.ai_scheduler
+        )
+
+        # snapshot berkala di memori (rewind) & autosave di thread background
+        self.snapshots = SnapshotRing(SNAPSHOT_RING_SIZE)
+        self.autosaver = None if headless else Autosaver(AUTOSAVE_PATH)
+        # jumlah step PLAY sejak run dimulai (jadwal snapshot)
+        self.play_steps = 0
+
+        # ===============================
+        # TEXTURE ATLAS
+        # ===============================
+        # muat semua animasi dulu, lalu pack ke atlas sebelum
+        # entity pertama dibuat (semua entity memakai frame atlas)
+        self.preload_animations()
+        self.atlas = TextureAtlas()
+        pack_cached_frames(self.atlas)
+
+        # ===============================
+        # BACKEND ENEMY
+        # ===============================
+        # horde: semua enemy di array NumPy (spawn, update, damage &
+        # draw lewat Horde); group enemies & pool sprite tidak dipakai
+        self.enemy_backend = enemy_backend
+        self.horde = None
+        if enemy_backend == "horde":
+            self.horde = Horde([slime_archetype(), skeleton_archetype()], self.map.grid, self.flow_field)
+        # class enemy → index archetype Horde
+        self.horde_kinds = {Slime: 0, Skeleton: 1}
+
         # ===============================
         # PLAYER
         # ===============================
-        px = random.randint(0, self.map.map_width)
-        py = random.randint(0, self.map.map_height)
+        px = self.rng.randint(0, self.map.map_width)
+        py = self.rng.randint(0, self.map.map_height)
         self.player = Player(px, py, self)
         self.entities.add(self.player)
 
+        # radius cari enemy untuk damage kontak, diturunkan dari class enemy:
+        # jarak serang terjauh & setengah diagonal hitbox player (hitbox
+        # enemy yang bersentuhan selalu masuk lingkaran ini)
+        self.contact_range = max(
+            max(cls.ATTACK_DISTANCE for cls in self.enemy_pools),
+            math.hypot(*self.player.hitbox.size) / 2
+        )
+
         # ===============================
         # AUTO SPAWN MUSUH
         # ===============================
@@ -113,6 +264,11 @@ class Game:
         self.enemy_increase_timer = 0
         self.enemy_increase_interval = 20
         self.enemy_max_limit = 20
+        # pertambahan max enemy tiap enemy_increase_interval
+        self.enemy_increase_step = 1
+        if self.horde is not None:
+            self.enemy_max_limit = HORDE_ENEMY_MAX_LIMIT
+            self.enemy_increase_step = HORDE_ENEMY_INCREASE
 
         self.spawn_initial_enemies()
 
@@ -123,6 +279,66 @@ class Game:
         for i in range(self.max_hp_pickup):
             self.spawn_health()
 
+        # ===============================
+        # LAPORAN WAKTU LOADING
+        # ===============================
+        self.load_report = {
+            "first_frame_ms": loader.stats["first_frame_ms"],
+            "worker_ms": loader.stats["total_ms"],
+            "total_ms": (time.perf_counter() - load_start) * 1000,
+        }
+        print(
+            f"[Load] First frame {self.load_report['first_frame_ms']:.0f} ms, "
+            f"assets {self.load_report['worker_ms']:.0f} ms, "
+            f"total {self.load_report['total_ms']:.0f} ms"
+        )
+
+    # ==========================================================
+    # LOADING ASSET
+    # ==========================================================
+    def animation_sheets(self):
+        """Semua spritesheet animasi entity (untuk preloader)."""
+        sheets = [path for path, _ in Player.ANIMATIONS.values()]
+        sheets += [Slime.SHEET, Skeleton.SHEET, ThrownBomb.EXPLOSION_SHEET, ThrownBomb.IMAGE]
+        return sheets
+
+    def create_preloader(self):
+        """
+        Daftar asset yang dimuat sebelum game mulai:
+        gambar UI, spritesheet entity dan map (parse + cache di worker).
+        """
+        loader = Preloader()
+        loader.add_image("menu_bg", "assets/ui/bgMainMenu.jpg", alpha=False)
+        loader.add_image("heart", "assets/ui/heart.png")
+        loader.add_image("watermelon", "assets/food/watermelon.png")
+        loader.add_image("apple", "assets/food/apple.png")
+        loader.add_image("chicken", "assets/food/chicken.png")
+        loader.add_image("gameover_card", "assets/ui/cardGameOver.png")
+        loader.add_image("button", "assets/ui/button.png")
+
+        for path in self.animation_sheets():
+            loader.add_image(path, path)
+
+        # parse TMX / baca cache map: tanpa convert (bukan main thread)
+        loader.add_task(
+            "map",
+            lambda: self.map.load(
+                "assets/maps/mainMap.tmx",
+                merge_colliders=MERGE_COLLIDERS,
+                cache_dir=MAP_CACHE_DIR,
+                convert=False
+            ),
+            weight=10
+        )
+        return loader
+
+    def preload_animations(self):
+        """Isi asset cache dengan semua animasi entity."""
+        Player.load_animations()
+        Slime.load_animations()
+        Skeleton.load_animations()
+        ThrownBomb.load_animations()
+
     # =========================
     # ENCAPSULATION - SCORE
     # =========================
@@ -138,43 +354,92 @@ class Game:
 
     def spawn_initial_enemies(self):
         """Wave awal: semua slime dulu (spawn di posisi aman)."""
-        while len(self.enemies) < self.max_enemy:
-            x, y = self.get_random_safe_position()
-            slime = Slime(x, y, self.player, self.walls)
-            self.enemies.add(slime)
-            self.entities.add(slime)
+        while self.enemy_count() < self.max_enemy:
+            x, y = self.get_random_safe_position(avoid_view=True, min_dist=ENEMY_SPAWN_MIN_DIST)
+            self.add_enemy(Slime, x, y)
 
     def spawn_random_enemy(self, x, y):
-        enemy_type = random.choice(["slime", "skeleton"])
+        enemy_type = self.rng.choice(["slime", "skeleton"])
 
         if enemy_type == "slime":
-            e = Slime(x, y, self.player, self.walls)
+            self.add_enemy(Slime, x, y)
+        else:
+            self.add_enemy(Skeleton, x, y)
+
+    def add_enemy(self, cls, x, y):
+        """Spawn enemy cls (Slime / Skeleton) di (x, y) sesuai backend."""
+        if self.horde is not None:
+            self.horde.spawn(self.horde_kinds[cls], x, y)
         else:
-            e = Skeleton(x, y, self.player, self.walls)
+            self.enemies.add(self.enemy_pools[cls].acquire(x, y))
+
+    def enemy_count(self):
+        """Jumlah enemy hidup (group sprite atau Horde)."""
+        if self.horde is not None:
+            return self.horde.count
+        return len(self.enemies)
 
-        self.enemies.add(e)
-        self.entities.add(e)
+    def nearest_enemy(self, x, y):
+        """Pusat hitbox enemy terdekat dari (x, y) → ((ex, ey), jarak) / (None, inf)."""
+        if self.horde is not None:
+            return self.horde.nearest(x, y)
+        found = self.enemy_index.nearest(x, y, 1)
+        if not found:
+            return None, math.inf
+        dist, enemy = found[0]
+        return enemy.hitbox.center, dist
 
 
     # -------------------------------------------------------
     def respawn_enemy_if_needed(self):
-        while len(self.enemies) < self.max_enemy:
-            x, y = self.get_random_safe_position()
+        while self.enemy_count() < self.max_enemy:
+            # musuh baru muncul di luar layar
+            x, y = self.get_random_safe_position(avoid_view=True, min_dist=ENEMY_SPAWN_MIN_DIST)
             self.spawn_random_enemy(x, y)
 
 
-    def get_random_safe_position(self):
-        """Cari posisi random yang tidak overlap collider."""
+    def get_view_rect(self):
+        """Area dunia yang terlihat kamera (mengikuti player)."""
+        view_w = SCREEN_W / self.ZOOM
+        view_h = SCREEN_H / self.ZOOM
+        return pygame.Rect(
+            self.player.rect.centerx - view_w / 2,
+            self.player.rect.centery - view_h / 2,
+            view_w,
+            view_h
+        )
+
+    def get_random_safe_position(self, avoid_view=False, min_dist=0):
+        """
+        Cari posisi random yang tidak overlap collider.
+
+        Posisi diambil dari SpawnIndex map (O(1), tanpa cek wall).
+        Constraint opsional:
+        - avoid_view : jangan spawn di area yang terlihat kamera
+        - min_dist   : jarak minimal dari player (pixel)
+        """
         SAFE_SIZE = 32   # ukuran bounding pickup/enemy
 
+        index = self.map.spawn_index(SAFE_SIZE)
+        avoid = self.get_view_rect() if avoid_view else None
+        origin = self.player.hitbox.center if min_dist else None
+
+        pos = index.sample(self.rng, avoid=avoid, origin=origin, min_dist=min_dist)
+        if pos is None and (avoid or origin):
+            # constraint tidak bisa dipenuhi → abaikan constraint
+            pos = index.sample(self.rng)
+        if pos is not None:
+            return pos
+
+        # fallback: map tanpa cell aman di grid → cara lama
         while True:
-            x = random.randint(0, self.map_width - SAFE_SIZE)
-            y = random.randint(0, self.map_height - SAFE_SIZE)
+            x = self.rng.randint(0, self.map_width - SAFE_SIZE)
+            y = self.rng.randint(0, self.map_height - SAFE_SIZE)
 
             test = pygame.Rect(x, y, SAFE_SIZE, SAFE_SIZE)
 
             blocked = False
-            for wall in self.walls:
+            for wall in self.walls.query(test):
                 if test.colliderect(wall):
                     blocked = True
                     break
@@ -185,12 +450,12 @@ class Game:
     # -------------------------------------------------------
     def spawn_health(self):
         x, y = self.get_random_safe_position()
-        h = HealthPickup(x, y, self.hp_food_images)
+        h = HealthPickup(x, y, self.hp_food_images, self.rng)
         self.pickups.add(h)
 
     def spawn_bomb(self):
         x, y = self.get_random_safe_position()
-        b = BombPickup(x, y, self.bomb_img)
+        b = BombPickup(x, y, self.bomb_img, self.rng)
         self.bomb_pickups.add(b)
         self.entities.add(b)
 
@@ -202,14 +467,33 @@ class Game:
 
     def kill_enemy(self, enemy):
         self.add_score(1)
+        self.enemy_index.remove(enemy)
         if enemy in self.enemies:
             self.enemies.remove(enemy)
-        if enemy in self.entities:
-            self.entities.remove(enemy)
+        self.ai_lod.forget(enemy)
+        # objek bisa langsung dipakai respawn → jangan diinterpolasi
+        # dari posisi matinya
+        self.interpolator.forget(enemy)
         enemy.kill()
+        # simpan untuk spawn berikutnya (tanpa membuat objek baru)
+        self.enemy_pools[type(enemy)].release(enemy)
         print("Enemy mati!")
 
+    def kill_horde_enemies(self, count):
+        """Skor untuk enemy Horde yang mati (sudah dibuang dari array)."""
+        if count:
+            self.add_score(count)
+            print(f"Enemy mati! ({count})")
+
+    def pool_report(self):
+        """Statistik object pool per tipe (hit, miss, alokasi, ...)."""
+        report = {cls.__name__: pool.report() for cls, pool in self.enemy_pools.items()}
+        report["ThrownBomb"] = self.bomb_pool.report()
+        return report
+
     def play_bgm(self, path, volume=0.5, force=False):
+        if self.headless:
+            return
         if self.__current_bgm == path and not force:
             return
 
@@ -225,29 +509,25 @@ class Game:
         card_rect = self.__gameover_card.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2))
         self.screen.blit(self.__gameover_card, card_rect)
         
-        font_big = pygame.font.Font("assets/font/Tiny5-Regular.ttf", 60)
-        font_mid = pygame.font.Font("assets/font/Tiny5-Regular.ttf", 50)
-        font_small = pygame.font.Font("assets/font/Tiny5-Regular.ttf", 40)
-
         # Tulisan "GAME OVER"
-        text = font_big.render("GAME OVER", True, (102, 61, 0))
+        text = self.text.render(FONT_UI, 60, "GAME OVER", (102, 61, 0))
         rect = text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 3.5))
         self.screen.blit(text, rect)
 
         # === SCORE ===
-        score_text = font_mid.render(f"Score: {self.get_score()}", True, (255, 255, 255))
+        score_text = self.text.render(FONT_UI, 50, f"Score: {self.get_score()}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 3 + 20))
         self.screen.blit(score_text, score_rect)
 
         # Tombol Retry
-        retry_text = font_small.render("Retry", True, (255, 255, 255))
+        retry_text = self.text.render(FONT_UI, 40, "Retry", (255, 255, 255))
         self.retry_rect = retry_text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2))
         pygame.draw.rect(self.screen, (153, 102, 51), self.retry_rect.inflate(40, 20))
         self.screen.blit(retry_text, self.retry_rect)
         
 
         # Tombol Quit
-        home_text = font_small.render("Quit", True, (255, 255, 255))
+        home_text = self.text.render(FONT_UI, 40, "Quit", (255, 255, 255))
         self.home_rect = home_text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2 + 80))
         pygame.draw.rect(self.screen, (153, 102, 51), self.home_rect.inflate(40, 20))
         self.screen.blit(home_text, self.home_rect)
@@ -256,21 +536,18 @@ class Game:
             # === DRAW MENU BACKGROUND ===
         self.screen.blit(self.__menu_bg, (0, 0))
 
-        font_big = pygame.font.Font("assets/font/Jersey15-Regular.ttf", 100)
-        font_btn = pygame.font.Font("assets/font/Tiny5-Regular.ttf", 40)
-
-        title = font_big.render("FOREST SURVIVORS", True, (245, 190, 39))
+        title = self.text.render(FONT_TITLE, 100, "FOREST SURVIVORS", (245, 190, 39))
         title_rect = title.get_rect(center=(SCREEN_W // 2, SCREEN_H // 3))
         self.screen.blit(title, title_rect)
 
         # ========= PLAY =========
-        play_text = font_btn.render("Play", True, (255, 255, 255))
+        play_text = self.text.render(FONT_UI, 40, "Play", (255, 255, 255))
         self.play_rect = play_text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2))
         pygame.draw.rect(self.screen, (153, 102, 51), self.play_rect.inflate(40, 20))
         self.screen.blit(play_text, self.play_rect)
 
         # ========= QUIT =========
-        quit_text = font_btn.render("Quit", True, (255, 255, 255))
+        quit_text = self.text.render(FONT_UI, 40, "Quit", (255, 255, 255))
         self.quit_rect = quit_text.get_rect(center=(SCREEN_W // 2, SCREEN_H // 2 + 80))
         pygame.draw.rect(self.screen, (153, 102, 51), self.quit_rect.inflate(40, 20))
         self.screen.blit(quit_text, self.quit_rect)
@@ -279,12 +556,27 @@ class Game:
         # Reset semua variabel game
         self.reset_score()
         self.player.reset_hp()
+        self.player.reset_state()
         self.state = "PLAY"
+        self.bomb_available = True
+        self.current_bomb = None
 
-        # Reset player posisi
+        # Reset player posisi (gerak player memakai hitbox → ikut dipindah)
         self.player.rect.x, self.player.rect.y = self.get_random_safe_position()
-
-        # Bersihkan enemy lama
+        self.player.hitbox.center = self.player.rect.center
+        # posisi lama tidak diinterpolasi (player pindah tempat)
+        self.interpolator.clear()
+
+        # Bersihkan enemy lama (kembali ke pool), keluar dari semua
+        # group dulu seperti kill_enemy() supaya tidak ada yang masih
+        # menganggapnya hidup
+        for enemy in list(self.enemies):
+            self.ai_lod.forget(enemy)
+            enemy.kill()
+            self.enemy_pools[type(enemy)].release(enemy)
+        for bomb in list(self.projectiles):
+            bomb.kill()
+            self.bomb_pool.release(bomb)
         self.entities = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.pickups = pygame.sprite.Group()
@@ -293,9 +585,14 @@ class Game:
 
         # Tambah player lagi
         self.entities.add(self.player)
+        self.enemy_index.clear()
+        self.ai_lod.clear()
+        if self.horde is not None:
+            self.horde.clear()
 
         # Reset musuh awal
         self.max_enemy = 2
+        self.enemy_increase_timer = 0
         self.spawn_initial_enemies()
 
         # Spawn health lagi
@@ -305,6 +602,69 @@ class Game:
         # 🔁 PAKSA RESTART BGM GAME
         self.play_bgm(self.__game_bgm, volume=0.4, force=True)
 
+    # ==========================================================
+    # RUN BARU (SEED & REKAMAN REPLAY)
+    # ==========================================================
+    def start_run(self, seed=None):
+        """
+        Mulai run baru: rng di-seed ulang lalu restart_game(), jadi
+        seed + input yang sama selalu menghasilkan run yang sama.
+        Jika record_path di-set, input run ini mulai direkam.
+        Mengembalikan seed run.
+        """
+        self.finish_recording()
+        if seed is None:
+            seed = self.rng.randrange(2 ** 32)
+        self.run_seed = seed
+        self.rng.seed(seed)
+        self.restart_game()
+        self.snapshots.clear()
+        self.play_steps = 0
+
+        if self.record_path is not None:
+            self.recording = Replay(seed, enemy_backend=self.enemy_backend)
+        return seed
+
+    def finish_recording(self):
+        """Simpan replay run yang sedang direkam (jika ada)."""
+        if self.recording is None:
+            return
+        self.recording.checksum = world_checksum(self)
+        self.recorded_runs += 1
+        path = self.record_path
+        if self.recorded_runs > 1:
+            # satu file per run, run sebelumnya tidak tertimpa
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{self.recorded_runs}{ext}"
+        self.recording.save(path)
+        print(f"[Replay] {self.recording.ticks} tick (seed {self.recording.seed}) → {path}")
+        self.recording = None
+
+    # ==========================================================
+    # SNAPSHOT (SAVE / RESTORE / REWIND)
+    # ==========================================================
+    def save_snapshot(self):
+        """State simulasi lengkap → blob bytes (lihat core/snapshot.py)."""
+        return snapshot_game(self)
+
+    def load_snapshot(self, blob):
+        """
+        Kembalikan state dari save_snapshot(). Rekaman replay
+        yang sedang berjalan dihentikan (input tidak lagi berurutan).
+        """
+        if self.recording is not None:
+            print("[Replay] Rekaman dihentikan (snapshot di-restore)")
+            self.recording = None
+        restore_game(self, blob)
+
+    def rewind(self, count=1):
+        """Mundur `count` snapshot di ring buffer. False jika kosong."""
+        blob = self.snapshots.rewind(count)
+        if blob is None:
+            return False
+        self.load_snapshot(blob)
+        return True
+
     def go_to_menu(self):
         self.state = "MENU"
 
@@ -317,9 +677,13 @@ class Game:
 
     # -------------------------------------------------------
     def run(self):
+        """
+        Loop utama: render mengikuti FPS layar, simulasi berjalan
+        dengan langkah tetap SIM_HZ (lihat FixedTimestep).
+        """
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000
+            frame_dt = self.clock.tick(FPS) / 1000
 
             # ========================
             # BGM BASED ON GAME STATE
@@ -330,207 +694,403 @@ class Game:
             elif self.state == "PLAY":
                 self.play_bgm(self.__game_bgm, volume=0.4)
 
+            # Input
+            running = self.handle_events()
+
+            # Simulasi: 0..MAX_SIM_STEPS langkah tetap per frame
+            for _ in range(self.timestep.advance(frame_dt)):
+                self.step(self.timestep.step_dt)
+
+            self.render(self.timestep.alpha)
+
+        self.finish_recording()
+        if self.autosaver is not None:
+            self.autosaver.close()
+
+    # ==========================================================
+    # HEADLESS (TANPA RENDER, TANPA BATAS FPS)
+    # ==========================================================
+    def run_headless(self, seconds=600, stop_on_game_over=False):
+        """
+        Jalankan simulasi secepat mungkin selama `seconds` detik
+        waktu game. Saat player mati game di-restart (atau berhenti
+        jika stop_on_game_over). Mengembalikan laporan jumlah step,
+        kecepatan dan hasil game.
+        """
+        self.start_run(self.run_seed)
+        dt = self.timestep.step_dt
+        total_steps = int(seconds * SIM_HZ)
+
+        start = time.perf_counter()
+        steps = 0
+        deaths = 0
+        best_score = 0
+        while steps < total_steps:
+            self.step(dt)
+            steps += 1
+            if self.state == "GAMEOVER":
+                deaths += 1
+                best_score = max(best_score, self.get_score())
+                if stop_on_game_over:
+                    break
+                self.start_run()
+        wall = time.perf_counter() - start
+        self.finish_recording()
+
+        report = {
+            "steps": steps,
+            "sim_seconds": steps * dt,
+            "wall_seconds": wall,
+            "steps_per_sec": steps / wall if wall > 0 else 0.0,
+            "speedup": steps * dt / wall if wall > 0 else 0.0,
+            "score": self.get_score(),
+            "best_score": max(best_score, self.get_score()),
+            "deaths": deaths,
+            "state": self.state,
+            "pools": self.pool_report(),
+            "ai_lod": self.ai_lod.report(),
+            "ai_think": self.ai_scheduler.report(),
+            "snapshot": dict(self.snapshots.stats),
+        }
+        print(
+            f"[Headless] {report['steps']} step ({report['sim_seconds']:.0f} s game) "
+            f"dalam {report['wall_seconds']:.2f} s: "
+            f"{report['steps_per_sec']:.0f} step/s, {report['speedup']:.0f}x realtime, "
+            f"best score {report['best_score']}, mati {report['deaths']}x"
+        )
+        for name, stats in report["pools"].items():
+            print(
+                f"[Pool] {name}: hit {stats['hits']}, miss {stats['misses']}, "
+                f"alokasi {stats['allocations']}, bebas {stats['free']}"
+            )
+        lod = report["ai_lod"]
+        print(
+            f"[AI LOD] active {lod['active']}, near {lod['near']}, far {lod['far']} "
+            f"(step terakhir: {lod['full']} update penuh, {lod['coarse']} coarse)"
+        )
+        think = report["ai_think"]
+        print(
+            f"[AI Think] {think['thinks']} think, latency rata-rata {think['avg_latency']:.1f} "
+            f"step (maks {think['max_latency']}), maks {think['max_ms']:.2f} ms/step, "
+            f"melebihi budget {think['overruns']}x"
+        )
+        snap = report["snapshot"]
+        print(
+            f"[Snapshot] {snap['captures']} snapshot, {snap['bytes']} byte, "
+            f"maks {snap['max_ms']:.3f} ms"
+        )
+        if self.horde is not None:
+            horde = self.horde.stats
+            print(
+                f"[Horde] {self.horde.count} enemy hidup, "
+                f"spawn {horde['spawned']}, mati {horde['killed']}"
+            )
+        return report
+
+    def run_replay(self, replay):
+        """
+        Putar ulang Replay secepat mungkin (headless): seed & input
+        tiap tick sama persis dengan saat direkam. Checksum state
+        akhir dibandingkan dengan checksum di file replay.
+        """
+        if replay.sim_hz != SIM_HZ:
+            raise ValueError(f"Replay direkam pada {replay.sim_hz} Hz, game berjalan {SIM_HZ} Hz")
+        if replay.enemy_backend != self.enemy_backend:
+            raise ValueError(f"Replay direkam dengan ENEMY_BACKEND \"{replay.enemy_backend}\"")
+
+        self.input = ReplayInput(replay)
+        self.start_run(replay.seed)
+        dt = self.timestep.step_dt
+
+        start = time.perf_counter()
+        for _ in range(replay.ticks):
+            self.step(dt)
+        wall = time.perf_counter() - start
+
+        checksum = world_checksum(self)
+        report = {
+            "ticks": replay.ticks,
+            "wall_seconds": wall,
+            "steps_per_sec": replay.ticks / wall if wall > 0 else 0.0,
+            "score": self.get_score(),
+            "state": self.state,
+            "checksum": checksum,
+            "match": not replay.checksum or checksum == replay.checksum,
+        }
+        print(
+            f"[Replay] {replay.ticks} tick dalam {wall:.2f} s "
+            f"({report['steps_per_sec']:.0f} step/s), score {report['score']}, "
+            f"checksum {'cocok' if report['match'] else 'BEDA'}"
+        )
+        return report
 
-            # === TIMER PENAMBAHAN MUSUH OTOMATIS ===
-            self.enemy_increase_timer += dt
-
-            # setiap 20 detik max musuh bertambah 1
-            if self.enemy_increase_timer >= self.enemy_increase_interval:
-                if self.max_enemy < self.enemy_max_limit:
-                    self.max_enemy += 1
-                    print("Musuh bertambah! max sekarang =", self.max_enemy)
-                self.enemy_increase_timer = 0
+    # ==========================================================
+    # INPUT
+    # ==========================================================
+    def handle_events(self):
+        """Proses event window. Mengembalikan False jika game ditutup."""
+        running = True
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                running = False
 
+            # ======================================
+            # HANDLE INPUT SAAT MENU
+            # ======================================
+            if self.state == "MENU":
+                if e.type == pygame.MOUSEBUTTONDOWN:
+                    mx, my = pygame.mouse.get_pos()
 
-            # Input
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    running = False
-
-                # ======================================
-                # HANDLE INPUT SAAT MENU
-                # ======================================
-                if self.state == "MENU":
-                    if e.type == pygame.MOUSEBUTTONDOWN:
-                        mx, my = pygame.mouse.get_pos()
-
-                        if self.play_rect.collidepoint(mx, my):
-                            self.state = "PLAY"
-
-                        if self.quit_rect.collidepoint(mx, my):
-                            pygame.quit()
-                            quit()
-
-                    continue  # supaya input lain tidak aktif
-
-                # ======================================
-                # HANDLE INPUT SAAT GAME OVER
-                # ======================================   
-                if self.state == "GAMEOVER":
-                    if e.type == pygame.MOUSEBUTTONDOWN:
-                        mx, my = pygame.mouse.get_pos()
-                        print("Mouse clicked at:", mx, my)
-
-                        if self.retry_rect.collidepoint(mx, my):
-                            print("Retry CLICKED")
-                            self.restart_game()
-
-                        if self.home_rect.collidepoint(mx, my):
-                            pygame.quit()
-                            quit()
-
-                    continue
-
-                if e.type == pygame.KEYDOWN:
-                    if e.key == pygame.K_SPACE:
-                        self.player.attack()
-                    if e.key == pygame.K_LSHIFT or e.key == pygame.K_RSHIFT:
-                        self.player.roll()
-                    if e.key == pygame.K_e:
-                        self.player.throw_bomb()
+                    if self.play_rect.collidepoint(mx, my):
+                        self.start_run(self.run_seed)
 
-            # ========================
-            #   UPDATE ENTITY HANYA SAAT MAIN
-            # ========================
-            if self.state == "PLAY":
-                self.entities.update(dt)
-                self.projectiles.update(dt)
-            else:
-                # Freeze semua musuh dan player
-                for enemy in self.enemies:
-                    enemy.vel_x = 0
-                    enemy.vel_y = 0
-
-            if self.can_spawn_bomb():
-                self.spawn_bomb()
-
-            # === UPDATE CAMERA ===
-            # CAMERA FOLLOW + ZOOM
-            self.camera_x = self.player.rect.centerx - (SCREEN_W / self.ZOOM) / 2
-            self.camera_y = self.player.rect.centery - (SCREEN_H / self.ZOOM) / 2
-
-            # Batasi supaya tidak keluar map
-            self.camera_x = max(0, min(self.camera_x, self.map.map_width - (SCREEN_W / self.ZOOM)))
-            self.camera_y = max(0, min(self.camera_y, self.map.map_height - (SCREEN_H / self.ZOOM)))
-
-            map_w = self.map.surface.get_width()
-            map_h = self.map.surface.get_height()
-
-            self.player.clamp_to_map(self.map.map_width, self.map.map_height)
-
-            # === HEALTH PICKUP ===
-            for h in list(self.pickups):
-                if self.player.hitbox.colliderect(h.hitbox):
-                    h.apply_effect(self.player)
-
-                    # Pastikan jumlah makanan selalu 2
-                    while len(self.pickups) < self.max_hp_pickup:
-                        self.spawn_health()
-                        
-
-            # PLAYER AMBIL BOMB
-            for b in list(self.bomb_pickups):
-                if self.player.hitbox.colliderect(b.hitbox):
-                    if self.player.can_pick_bomb():
-                        self.player.pick_bomb(b)
-                        
-                       
-            # ===============================
-            # PLAYER SERANG SEMUA MUSUH
-            # ===============================
-            if self.player.attacking:
-                atk = self.player.get_attack_hitbox()
-
-                for enemy in list(self.enemies):
-                    if atk.colliderect(enemy.hitbox):
-                        enemy.take_damage(1)
-
-            # ===============================
-            # UNIVERSAL ENEMY DEATH CHECK
-            # (bom, projectile, poison, dll)
-            # ===============================
-            for enemy in list(self.enemies):
-                if not enemy.is_alive():
-                    self.kill_enemy(enemy)
-
-            # ===============================
-            # RESPAWN MUSUH OTOMATIS
-            # ===============================
-            self.respawn_enemy_if_needed()
-
-
-           # ======================================
-            #  DRAW KE CAMERA_SURFACE (NON-ZOOM)
-            # ======================================
-            self.camera_surface.fill((90, 150, 90))
+                    if self.quit_rect.collidepoint(mx, my):
+                        pygame.quit()
+                        quit()
 
-            # Map
-            self.map.draw(self.camera_surface, self.camera_x, self.camera_y) #, debug=True)
+                continue  # supaya input lain tidak aktif
 
-            # Player
-            self.camera_surface.blit(
-                self.player.image,
-                (self.player.rect.x - self.camera_x,
-                self.player.rect.y - self.camera_y)
+            # ======================================
+            # HANDLE INPUT SAAT GAME OVER
+            # ======================================   
+            if self.state == "GAMEOVER":
+                if e.type == pygame.MOUSEBUTTONDOWN:
+                    mx, my = pygame.mouse.get_pos()
+                    print("Mouse clicked at:", mx, my)
+
+                    if self.retry_rect.collidepoint(mx, my):
+                        print("Retry CLICKED")
+                        self.start_run()
+
+                    if self.home_rect.collidepoint(mx, my):
+                        pygame.quit()
+                        quit()
+
+                continue
+
+            # aksi diteruskan ke sumber input, dijalankan saat step
+            if e.type == pygame.KEYDOWN:
+                if e.key == pygame.K_SPACE:
+                    self.input.press("attack")
+                if e.key == pygame.K_LSHIFT or e.key == pygame.K_RSHIFT:
+                    self.input.press("roll")
+                if e.key == pygame.K_e:
+                    self.input.press("throw")
+                # debug: mundur ke snapshot sebelumnya
+                if e.key == pygame.K_BACKSPACE:
+                    self.rewind()
+
+        return running
+
+    # ==========================================================
+    # SIMULASI (LANGKAH TETAP)
+    # ==========================================================
+    def step(self, dt):
+        """Satu langkah simulasi sebesar dt detik (selalu 1 / SIM_HZ)."""
+        # posisi sebelum langkah ini, untuk interpolasi render
+        if not self.headless:
+            self.interpolator.snapshot(
+                itertools.chain((self.player,), self.enemies, self.projectiles)
             )
 
-            # Enemies
+        # input player untuk langkah ini (keyboard / script / bot)
+        self.controls = self.input.poll(self)
+        if self.recording is not None and self.state == "PLAY":
+            self.recording.record(self.controls)
+
+        # === TIMER PENAMBAHAN MUSUH OTOMATIS ===
+        self.enemy_increase_timer += dt
+
+        # setiap 20 detik max musuh bertambah 1
+        if self.enemy_increase_timer >= self.enemy_increase_interval:
+            if self.max_enemy < self.enemy_max_limit:
+                self.max_enemy = min(self.max_enemy + self.enemy_increase_step, self.enemy_max_limit)
+                print("Musuh bertambah! max sekarang =", self.max_enemy)
+            self.enemy_increase_timer = 0
+
+        # ========================
+        #   UPDATE ENTITY HANYA SAAT MAIN
+        # ========================
+        if self.state == "PLAY":
+            if self.controls.attack:
+                self.player.attack()
+            if self.controls.roll:
+                self.player.roll()
+            if self.controls.throw:
+                self.player.throw_bomb()
+
+            # hitung ulang hanya jika player pindah cell
+            self.flow_field.update(self.player.hitbox.center)
+            # player & bomb pickup
+            self.entities.update(dt)
+            if self.horde is not None:
+                # semua enemy sekaligus; damage kontak ke player
+                # langsung diberikan di dalam Horde.update()
+                self.horde.update(dt, self.player)
+            else:
+                # enemy sesuai tier jarak ke layar (active / near / far)
+                self.ai_lod.update(self.enemies, self.get_view_rect(), dt)
+            # index posisi terbaru (dipakai ledakan bomb di bawah)
+            self.rebuild_indexes()
+            self.projectiles.update(dt)
+        else:
+            # Freeze semua musuh dan player
             for enemy in self.enemies:
-                self.camera_surface.blit(
-                    enemy.image,
-                    (enemy.rect.x - self.camera_x,
-                    enemy.rect.y - self.camera_y)
-                )
-
-            # Pickup
-            for h in self.pickups:
-                self.camera_surface.blit(
-                    h.image,
-                    (h.rect.x - self.camera_x,
-                    h.rect.y - self.camera_y)
-                )
-            
-            # Bomb pickups
-            for b in self.bomb_pickups:
-                self.camera_surface.blit(
-                    b.image,
-                    (b.rect.x - self.camera_x,
-                    b.rect.y - self.camera_y)
-                )
-            # Projectiles
-            for p in self.projectiles:
-                self.camera_surface.blit(
-                    p.image,
-                    (p.rect.x - self.camera_x, p.rect.y - self.camera_y)
-                )
-
-            # Debug (gambar di camera, supaya ikut zoom)
-            # self.player.draw_debug(self.camera_surface)
-            # for enemy in self.enemies:
-            #     enemy.draw_debug(self.camera_surface)
-            # for h in self.pickups:
-            #     h.draw_debug(self.camera_surface, self.camera_x, self.camera_y)
+                enemy.vel_x = 0
+                enemy.vel_y = 0
 
-            # ======================================
-            #  APPLY ZOOM KE LAYAR
-            # ======================================
-            # scaled_frame = pygame.transform.scale(
-            #     self.camera_surface,
-            #     (SCREEN_W, SCREEN_H)
-            # )
-            scaled = pygame.transform.scale2x(self.camera_surface)
-            self.screen.blit(scaled, (0, 0))
-
-            if self.state == "PLAY":
-                self.draw_hp()
-                score_surf = self.font.render(f"Score: {self.get_score()}", True, (255,255,255))
-                score_rect = score_surf.get_rect(topright=(self.screen.get_width() - 20, 20))
-                self.screen.blit(score_surf, score_rect)
-
-            elif self.state == "GAMEOVER":
-                self.draw_game_over()
-
-            elif self.state == "MENU":
-                self.draw_menu()
-
-            pygame.display.flip()
+        if self.can_spawn_bomb():
+            self.spawn_bomb()
+
+        self.player.clamp_to_map(self.map.map_width, self.map.map_height)
+
+        # ===============================
+        # DAMAGE KONTAK ENEMY → PLAYER
+        # ===============================
+        # hanya enemy di sekitar player yang dicek
+        if self.state == "PLAY":
+            px, py = self.player.hitbox.center
+            for enemy in self.enemy_index.query_circle(px, py, self.contact_range):
+                enemy.hit_target()
+
+        # === HEALTH PICKUP ===
+        for h in self.pickup_index.query_rect(self.player.hitbox):
+            if h.alive():
+                h.apply_effect(self.player)
+
+                # Pastikan jumlah makanan selalu 2
+                while len(self.pickups) < self.max_hp_pickup:
+                    self.spawn_health()
+                    
+
+        # PLAYER AMBIL BOMB
+        for b in self.bomb_pickup_index.query_rect(self.player.hitbox):
+            if self.player.can_pick_bomb():
+                self.player.pick_bomb(b)
+                    
+                   
+        # ===============================
+        # PLAYER SERANG SEMUA MUSUH
+        # ===============================
+        if self.player.attacking:
+            atk = self.player.get_attack_hitbox()
+
+            if self.horde is not None:
+                self.kill_horde_enemies(self.horde.damage_rect(atk))
+            for enemy in self.enemy_index.query_rect(atk):
+                enemy.take_damage(1)
+
+        # ===============================
+        # UNIVERSAL ENEMY DEATH CHECK
+        # (bom, projectile, poison, dll)
+        # ===============================
+        for enemy in list(self.enemies):
+            if not enemy.is_alive():
+                self.kill_enemy(enemy)
+
+        # ===============================
+        # RESPAWN MUSUH OTOMATIS
+        # ===============================
+        self.respawn_enemy_if_needed()
+
+        # run selesai (player mati) → simpan replay
+        if self.recording is not None and self.state != "PLAY":
+            self.finish_recording()
+
+        # ===============================
+        # SNAPSHOT BERKALA (REWIND & AUTOSAVE)
+        # ===============================
+        if self.state == "PLAY":
+            self.play_steps += 1
+            if self.play_steps % SNAPSHOT_INTERVAL == 0:
+                blob = self.snapshots.capture(self)
+                if self.autosaver is not None and self.play_steps % AUTOSAVE_INTERVAL == 0:
+                    self.autosaver.submit(blob)
+
+    def rebuild_indexes(self):
+        """Bangun ulang index spasial enemy & pickup dari posisi sekarang."""
+        self.enemy_index.rebuild(self.enemies)
+        self.pickup_index.rebuild(self.pickups)
+        self.bomb_pickup_index.rebuild(self.bomb_pickups)
+
+    # ==========================================================
+    # RENDER
+    # ==========================================================
+    def render(self, alpha=1.0):
+        """
+        Gambar satu frame. alpha (0..1) = posisi di antara state
+        simulasi sebelumnya dan sekarang.
+        """
+        self.interpolator.alpha = alpha
+
+        # === UPDATE CAMERA ===
+        # CAMERA FOLLOW + ZOOM (ikut posisi player hasil interpolasi)
+        player_x, player_y = self.interpolator.center(self.player)
+        self.camera_x = player_x - (SCREEN_W / self.ZOOM) / 2
+        self.camera_y = player_y - (SCREEN_H / self.ZOOM) / 2
+
+        # Batasi supaya tidak keluar map
+        self.camera_x = max(0, min(self.camera_x, self.map.map_width - (SCREEN_W / self.ZOOM)))
+        self.camera_y = max(0, min(self.camera_y, self.map.map_height - (SCREEN_H / self.ZOOM)))
+
+       # ======================================
+        #  DRAW KE CAMERA_SURFACE (NON-ZOOM)
+        # ======================================
+        self.camera_surface.fill((90, 150, 90))
+
+        # Map
+        self.map.draw(self.camera_surface, self.camera_x, self.camera_y) #, debug=True)
+
+        # Player, enemy, pickup, bomb & projectile
+        # (satu blits(); frame atlas digambar dari page-nya)
+        self.atlas.blit_batch(
+            self.camera_surface,
+            itertools.chain(
+                (self.player,),
+                self.enemies,
+                self.pickups,
+                self.bomb_pickups,
+                self.projectiles
+            ),
+            self.camera_x,
+            self.camera_y,
+            position=self.interpolator.position
+        )
+
+        # enemy Horde langsung dari array (satu blits())
+        if self.horde is not None:
+            self.horde.draw(self.camera_surface, self.camera_x, self.camera_y, self.atlas, alpha)
+
+        # Layer map di atas entity (atap, pucuk pohon, ...)
+        self.map.draw_foreground(self.camera_surface, self.camera_x, self.camera_y)
+
+        # Debug (gambar di camera, supaya ikut zoom)
+        # self.player.draw_debug(self.camera_surface)
+        # for enemy in self.enemies:
+        #     enemy.draw_debug(self.camera_surface)
+        # for h in self.pickups:
+        #     h.draw_debug(self.camera_surface, self.camera_x, self.camera_y)
+
+        # ======================================
+        #  APPLY ZOOM KE LAYAR
+        # ======================================
+        # scaled_frame = pygame.transform.scale(
+        #     self.camera_surface,
+        #     (SCREEN_W, SCREEN_H)
+        # )
+        scaled = pygame.transform.scale2x(self.camera_surface)
+        self.screen.blit(scaled, (0, 0))
+
+        if self.state == "PLAY":
+            self.draw_hp()
+            score_surf = self.text.render(None, 40, f"Score: {self.get_score()}", (255,255,255))
+            score_rect = score_surf.get_rect(topright=(self.screen.get_width() - 20, 20))
+            self.screen.blit(score_surf, score_rect)
+
+        elif self.state == "GAMEOVER":
+            self.draw_game_over()
+
+        elif self.state == "MENU":
+            self.draw_menu()
+
+        pygame.display.flip()
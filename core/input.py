@@ -0,0 +1,213 @@
+import math
+import random
+
+import pygame
+
+
+class InputState:
+
+    """
+    InputState
+    ----------
+    Perintah untuk player pada satu langkah simulasi.
+
+    move_x / move_y : arah gerak (-1, 0, 1)
+    attack / roll / throw : aksi sekali tekan (True pada langkah
+                            saat aksi diminta)
+    """
+
+    def __init__(self, move_x=0, move_y=0, attack=False, roll=False, throw=False):
+        self.move_x = move_x
+        self.move_y = move_y
+        self.attack = attack
+        self.roll = roll
+        self.throw = throw
+
+
+# ==========================================================
+# KEYBOARD (MAIN NORMAL)
+# ==========================================================
+class KeyboardInput:
+
+    """
+    KeyboardInput
+    -------------
+    Gerak dari pygame.key.get_pressed() (WASD), aksi dari event
+    KEYDOWN yang diteruskan Game lewat press().
+
+    Aksi ditahan sampai langkah simulasi berikutnya, jadi tidak
+    hilang walaupun frame itu tidak menjalankan step.
+    """
+
+    def __init__(self):
+        self._pressed = set()
+
+    def press(self, action):
+        """action: "attack", "roll" atau "throw"."""
+        self._pressed.add(action)
+
+    def poll(self, game):
+        keys = pygame.key.get_pressed()
+        state = InputState(
+            keys[pygame.K_d] - keys[pygame.K_a],
+            keys[pygame.K_s] - keys[pygame.K_w],
+            "attack" in self._pressed,
+            "roll" in self._pressed,
+            "throw" in self._pressed
+        )
+        self._pressed.clear()
+        return state
+
+
+# ==========================================================
+# SCRIPT (URUTAN INPUT TETAP)
+# ==========================================================
+class ScriptedInput:
+
+    """
+    ScriptedInput
+    -------------
+    Input dari daftar langkah:
+
+        [(jumlah_step, move_x, move_y, ("attack", ...)), ...]
+
+    Aksi dikirim pada step pertama tiap entry. Setelah script
+    habis player diam (atau script diulang jika loop=True).
+    """
+
+    def __init__(self, script, loop=False):
+        self.script = list(script)
+        self.loop = loop
+        self._index = 0
+        self._step = 0
+
+    def press(self, action):
+        pass
+
+    def poll(self, game):
+        if self._index >= len(self.script):
+            if not self.loop or not self.script:
+                return InputState()
+            self._index = 0
+
+        steps, move_x, move_y, actions = self.script[self._index]
+        first = self._step == 0
+        state = InputState(
+            move_x,
+            move_y,
+            first and "attack" in actions,
+            first and "roll" in actions,
+            first and "throw" in actions
+        )
+
+        self._step += 1
+        if self._step >= steps:
+            self._index += 1
+            self._step = 0
+        return state
+
+
+# ==========================================================
+# BOT (AI SEDERHANA)
+# ==========================================================
+class BotInput:
+
+    """
+    BotInput
+    --------
+    Player otomatis untuk simulasi headless:
+    - HP kurang → ambil makanan terdekat
+    - pegang bomb & ada musuh dekat → lempar bomb
+    - selain itu kejar musuh terdekat lalu serang
+    - musuh terlalu dekat saat HP tinggal 1 → roll menjauh
+    - tidak bergerak beberapa saat (nyangkut tembok) → jalan acak
+    """
+
+    ATTACK_RANGE = 40
+    BOMB_RANGE = 160
+    STUCK_STEPS = 30
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self._last_pos = None
+        self._still = 0
+        self._moving = False
+        # (move_x, move_y, sisa step) saat keluar dari posisi nyangkut
+        self._wander = None
+
+    def press(self, action):
+        pass
+
+    def poll(self, game):
+        state = self._decide(game)
+        self._moving = bool(state.move_x or state.move_y)
+        return state
+
+    def _decide(self, game):
+        player = game.player
+        px, py = player.hitbox.center
+        self._track_stuck(player.hitbox.center)
+
+        if self._wander is not None:
+            move_x, move_y, left = self._wander
+            self._wander = (move_x, move_y, left - 1) if left > 1 else None
+            return InputState(move_x, move_y)
+
+        # posisi musuh terdekat (backend sprite maupun horde)
+        enemy, enemy_dist = game.nearest_enemy(px, py)
+
+        # darurat: roll menjauh dari musuh
+        if enemy is not None and player.get_hp() == 1 and enemy_dist < self.ATTACK_RANGE:
+            ex, ey = enemy
+            return InputState(_sign(px - ex), _sign(py - ey), roll=True)
+
+        food, _ = _nearest(px, py, game.pickup_index)
+        if player.get_hp() < player.get_max_hp() and food is not None:
+            fx, fy = food.hitbox.center
+            return InputState(_sign(fx - px), _sign(fy - py))
+
+        if enemy is None:
+            return InputState()
+
+        ex, ey = enemy
+        if player.has_bomb() and enemy_dist < self.BOMB_RANGE:
+            # hadap ke musuh lalu lempar
+            return InputState(_sign(ex - px), 0, throw=True)
+
+        if enemy_dist < self.ATTACK_RANGE:
+            return InputState(_sign(ex - px), 0, attack=True)
+
+        return InputState(_sign(ex - px), _sign(ey - py))
+
+    def _track_stuck(self, pos):
+        # hanya dihitung jika bot memang minta bergerak
+        if self._moving and pos == self._last_pos:
+            self._still += 1
+        else:
+            self._still = 0
+        self._last_pos = pos
+
+        if self._still >= self.STUCK_STEPS and self._wander is None:
+            self._still = 0
+            self._wander = (
+                self.rng.choice((-1, 0, 1)),
+                self.rng.choice((-1, 0, 1)),
+                self.rng.randint(20, 60)
+            )
+
+
+def _nearest(x, y, index):
+    """Entity terdekat dari DynamicSpatialHash → (entity, jarak)."""
+    found = index.nearest(x, y, 1)
+    if not found:
+        return None, math.inf
+    dist, sprite = found[0]
+    return sprite, dist
+
+
+def _sign(value, dead_zone=4):
+    if value > dead_zone:
+        return 1
+    if value < -dead_zone:
+        return -1
+    return 0
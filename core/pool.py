@@ -0,0 +1,59 @@
+class ObjectPool:
+
+    """
+    ObjectPool
+    ----------
+    Daur ulang objek satu tipe (enemy, projectile, ...).
+
+    Lifecycle:
+    - acquire(*args) : ambil objek bebas lalu obj.reset(*args),
+                       atau buat baru dengan factory(*args) jika kosong
+    - release(obj)   : objek selesai dipakai (mati / meledak),
+                       disimpan untuk acquire berikutnya
+
+    Objek yang dipakai ulang tidak memuat ulang sprite, tidak
+    membuat list frame baru dan tidak menambah sampah untuk GC
+    pada sesi panjang dengan spawn tinggi.
+
+    max_free: batas objek bebas yang disimpan (None = tanpa batas).
+    """
+
+    def __init__(self, factory, max_free=None):
+        self.factory = factory
+        self.max_free = max_free
+        self._free = []
+        # id objek yang sedang tersimpan (cegah release dua kali)
+        self._free_ids = set()
+        self.stats = {"hits": 0, "misses": 0, "allocations": 0, "releases": 0, "dropped": 0}
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            self._free_ids.discard(id(obj))
+            obj.reset(*args)
+            self.stats["hits"] += 1
+            return obj
+
+        self.stats["misses"] += 1
+        self.stats["allocations"] += 1
+        return self.factory(*args)
+
+    def release(self, obj):
+        if id(obj) in self._free_ids:
+            return
+        if self.max_free is not None and len(self._free) >= self.max_free:
+            self.stats["dropped"] += 1
+            return
+        self._free.append(obj)
+        self._free_ids.add(id(obj))
+        self.stats["releases"] += 1
+
+    def clear(self):
+        self._free.clear()
+        self._free_ids.clear()
+
+    def report(self):
+        """Statistik pool + jumlah objek bebas saat ini."""
+        report = dict(self.stats)
+        report["free"] = len(self._free)
+        return report
@@ -0,0 +1,146 @@
+import queue
+import threading
+import time
+
+import pygame
+
+
+class Preloader:
+
+    """
+    Preloader
+    ---------
+    Memuat asset bertahap sambil menampilkan layar loading.
+
+    Pembagian kerja:
+    - Worker thread : decode gambar (pygame.image.load) dan task berat
+                      lain (mis. parse map) yang tidak menyentuh display
+    - Main thread   : convert() / convert_alpha() ke format layar,
+                      menggambar progress, memproses event window
+
+    Surface tidak pernah di-convert di worker thread.
+    """
+
+    def __init__(self):
+        # (key, fungsi, bobot progress)
+        self._jobs = []
+        # (key, convert alpha?) untuk hasil gambar
+        self._convert = {}
+        self._done = queue.Queue()
+
+        self.results = {}
+        self.stats = {"first_frame_ms": None, "total_ms": 0.0, "jobs": 0}
+
+        # event QUIT selama loading (dikirim ulang setelah selesai)
+        self.quit_requested = False
+
+    # ==========================================================
+    # DAFTAR JOB
+    # ==========================================================
+    def add_image(self, key, path, alpha=True):
+        """Decode gambar di worker, convert di main thread."""
+        self._jobs.append((key, lambda: pygame.image.load(path), 1))
+        self._convert[key] = alpha
+
+    def add_task(self, key, fn, weight=1):
+        """Task bebas di worker (tidak boleh convert surface)."""
+        self._jobs.append((key, fn, weight))
+
+    # ==========================================================
+    # WORKER
+    # ==========================================================
+    def _work(self):
+        for key, fn, weight in self._jobs:
+            try:
+                result = fn()
+            except Exception as e:
+                self._done.put((key, None, weight, e))
+                return
+            self._done.put((key, result, weight, None))
+
+    # ==========================================================
+    # JALANKAN
+    # ==========================================================
+    def run(self, screen, draw_progress=None, fps=60, start=None):
+        """
+        Jalankan semua job sambil menggambar progress ke screen.
+        draw_progress(screen, progress 0..1, key terakhir) opsional.
+        start: waktu awal (perf_counter) untuk laporan, default sekarang.
+        Mengembalikan dict key -> hasil.
+        """
+        start = time.perf_counter() if start is None else start
+        draw_progress = draw_progress or self.draw_progress
+        total = sum(weight for _, _, weight in self._jobs) or 1
+        done = 0
+        remaining = len(self._jobs)
+        last_key = ""
+
+        worker = threading.Thread(target=self._work, name="preloader", daemon=True)
+        clock = pygame.time.Clock()
+
+        # frame pertama langsung tampil sebelum worker mulai
+        self._draw(screen, draw_progress, 0.0, last_key, start)
+        worker.start()
+
+        while remaining:
+            # input selama loading diabaikan, kecuali menutup window
+            for e in pygame.event.get():
+                if e.type == pygame.QUIT:
+                    self.quit_requested = True
+
+            # ambil semua hasil yang sudah selesai (convert di sini)
+            while True:
+                try:
+                    key, result, weight, error = self._done.get(timeout=1 / fps)
+                except queue.Empty:
+                    break
+                if error is not None:
+                    raise error
+                if key in self._convert:
+                    result = result.convert_alpha() if self._convert[key] else result.convert()
+                self.results[key] = result
+                done += weight
+                remaining -= 1
+                last_key = key
+                if self._done.empty():
+                    break
+
+            self._draw(screen, draw_progress, done / total, last_key, start)
+            clock.tick(fps)
+
+        worker.join()
+        self.stats["jobs"] = len(self._jobs)
+        self.stats["total_ms"] = (time.perf_counter() - start) * 1000
+
+        if self.quit_requested:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return self.results
+
+    def _draw(self, screen, draw_progress, progress, key, start):
+        draw_progress(screen, progress, key)
+        pygame.display.flip()
+        if self.stats["first_frame_ms"] is None:
+            self.stats["first_frame_ms"] = (time.perf_counter() - start) * 1000
+
+    # ==========================================================
+    # LAYAR LOADING DEFAULT
+    # ==========================================================
+    _font = None
+
+    def draw_progress(self, screen, progress, key):
+        """Layar loading sederhana: teks + progress bar."""
+        if Preloader._font is None:
+            Preloader._font = pygame.font.Font(None, 40)
+
+        w, h = screen.get_size()
+        screen.fill((20, 30, 20))
+
+        text = Preloader._font.render(f"Loading... {int(progress * 100)}%", True, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=(w // 2, h // 2 - 40)))
+
+        bar = pygame.Rect(0, 0, w // 2, 24)
+        bar.center = (w // 2, h // 2 + 10)
+        pygame.draw.rect(screen, (153, 102, 51), bar, 2)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(screen, (90, 150, 90), fill)
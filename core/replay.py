@@ -0,0 +1,184 @@
+import struct
+import zlib
+from array import array
+
+from core.input import InputState
+from core.settings import SIM_HZ
+
+# ==========================================================
+# BITMASK INPUT PER TICK
+# ==========================================================
+MOVE_LEFT = 1
+MOVE_RIGHT = 2
+MOVE_UP = 4
+MOVE_DOWN = 8
+ATTACK = 16
+ROLL = 32
+THROW = 64
+
+
+def encode_controls(controls):
+    """InputState → bitmask 1 byte."""
+    mask = 0
+    if controls.move_x < 0:
+        mask |= MOVE_LEFT
+    elif controls.move_x > 0:
+        mask |= MOVE_RIGHT
+    if controls.move_y < 0:
+        mask |= MOVE_UP
+    elif controls.move_y > 0:
+        mask |= MOVE_DOWN
+    if controls.attack:
+        mask |= ATTACK
+    if controls.roll:
+        mask |= ROLL
+    if controls.throw:
+        mask |= THROW
+    return mask
+
+
+def decode_controls(mask):
+    """Bitmask → InputState."""
+    return InputState(
+        bool(mask & MOVE_RIGHT) - bool(mask & MOVE_LEFT),
+        bool(mask & MOVE_DOWN) - bool(mask & MOVE_UP),
+        bool(mask & ATTACK),
+        bool(mask & ROLL),
+        bool(mask & THROW)
+    )
+
+
+def world_checksum(game):
+    """CRC32 state penting (score, HP, posisi player & enemy) untuk cek replay."""
+    values = array("i", (
+        game.get_score(),
+        game.player.get_hp(),
+        game.player.hitbox.x,
+        game.player.hitbox.y,
+        len(game.enemies),
+    ))
+    for enemy in game.enemies:
+        values.extend(enemy.hitbox.topleft)
+    checksum = zlib.crc32(values.tobytes())
+    if game.horde is not None:
+        # backend horde: seluruh state array enemy
+        checksum = zlib.crc32(game.horde.save_state(), checksum)
+    return checksum
+
+
+class Replay:
+
+    """
+    Replay
+    ------
+    Rekaman satu run: seed Game.rng + bitmask input per tick.
+
+    Format file (little endian):
+    - header  : magic "FSRP", versi (u8), sim_hz (u16), seed (u64),
+                jumlah tick (u32), checksum akhir (u32, 0 = tidak ada),
+                backend enemy (u8, index BACKENDS; tidak ada di versi 1)
+    - payload : zlib dari run-length (mask u8, jumlah u16) —
+                input jarang berubah, 10 menit main hanya beberapa KB
+
+    Run yang sama (seed + input) selalu menghasilkan state yang sama,
+    jadi replay bisa dipakai ulang sebagai skenario benchmark.
+    """
+
+    MAGIC = b"FSRP"
+    VERSION = 2
+    HEADER = struct.Struct("<4sBHQIIB")
+    # versi 1: tanpa backend enemy (selalu "sprite")
+    HEADER_V1 = struct.Struct("<4sBHQII")
+    RUN = struct.Struct("<BH")
+    BACKENDS = ("sprite", "horde")
+
+    def __init__(self, seed, masks=None, sim_hz=SIM_HZ, checksum=0, enemy_backend="sprite"):
+        self.seed = seed
+        self.masks = array("B", masks or ())
+        self.sim_hz = sim_hz
+        self.checksum = checksum
+        self.enemy_backend = enemy_backend
+
+    @property
+    def ticks(self):
+        return len(self.masks)
+
+    def record(self, controls):
+        """Tambah input satu tick."""
+        self.masks.append(encode_controls(controls))
+
+    # ==========================================================
+    # ENCODE / DECODE
+    # ==========================================================
+    def to_bytes(self):
+        runs = bytearray()
+        masks = self.masks
+        i = 0
+        while i < len(masks):
+            mask = masks[i]
+            count = 1
+            while i + count < len(masks) and masks[i + count] == mask and count < 0xFFFF:
+                count += 1
+            runs += self.RUN.pack(mask, count)
+            i += count
+
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.sim_hz, self.seed, len(masks), self.checksum,
+            self.BACKENDS.index(self.enemy_backend)
+        )
+        return header + zlib.compress(bytes(runs), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, sim_hz, seed, ticks, checksum = cls.HEADER_V1.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Bukan file replay")
+        if version == 1:
+            header_size = cls.HEADER_V1.size
+            backend = "sprite"
+        elif version == cls.VERSION:
+            header_size = cls.HEADER.size
+            backend = cls.BACKENDS[cls.HEADER.unpack_from(data)[-1]]
+        else:
+            raise ValueError(f"Versi replay {version} tidak didukung")
+
+        masks = array("B")
+        runs = zlib.decompress(data[header_size:])
+        for mask, count in cls.RUN.iter_unpack(runs):
+            masks.extend(array("B", (mask,)) * count)
+        if len(masks) != ticks:
+            raise ValueError("File replay rusak (jumlah tick tidak cocok)")
+        return cls(seed, masks, sim_hz, checksum, backend)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayInput:
+
+    """
+    ReplayInput
+    -----------
+    Sumber input player dari Replay (tick demi tick).
+    Setelah replay habis player diam.
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        self._tick = 0
+
+    def press(self, action):
+        pass
+
+    def poll(self, game):
+        if self._tick >= self.replay.ticks:
+            return InputState()
+        mask = self.replay.masks[self._tick]
+        self._tick += 1
+        return decode_controls(mask)
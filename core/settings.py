@@ -2,5 +2,67 @@ SCREEN_W = 1080
 SCREEN_H = 600
 FPS = 60
 
+# simulasi langkah tetap (Hz), terpisah dari FPS render
+SIM_HZ = 60
+# batas langkah simulasi per frame saat frame tersendat
+MAX_SIM_STEPS = 5
+
 PLAYER_SPEED = 200
 ENEMY_SPEED = 120
+
+# gabungkan collider map yang menempel / overlap saat load
+MERGE_COLLIDERS = True
+
+# folder cache map hasil bake (None = selalu parse TMX)
+MAP_CACHE_DIR = ".cache/maps"
+
+# nama layer TMX yang digambar di atas entity (atap, pucuk pohon, ...)
+# layer dengan property "foreground" = true di Tiled juga ikut
+MAP_FOREGROUND_LAYERS = ()
+
+# jarak minimal spawn musuh baru dari player (pixel)
+ENEMY_SPAWN_MIN_DIST = 200
+
+# animasi ledakan bomb: skala frame & detik per frame
+EXPLOSION_SCALE = 3
+EXPLOSION_FRAME_TIME = 0.07
+
+# font UI (file TTF)
+FONT_TITLE = "assets/font/Jersey15-Regular.ttf"
+FONT_UI = "assets/font/Tiny5-Regular.ttf"
+
+# jumlah surface teks maksimal di TextCache (LRU)
+TEXT_CACHE_SIZE = 128
+
+# ukuran cell index spasial entity (enemy, pickup)
+ENTITY_INDEX_CELL = 64
+
+# backend enemy: "sprite" = class Slime / Skeleton (default),
+# "horde" = Horde, array NumPy untuk ribuan enemy (butuh NumPy)
+ENEMY_BACKEND = "sprite"
+# mode horde: batas max enemy & pertambahannya tiap enemy_increase_interval
+HORDE_ENEMY_MAX_LIMIT = 2000
+HORDE_ENEMY_INCREASE = 50
+
+# AI level of detail (jarak dihitung dari tepi layar, pixel dunia)
+# active: <= margin → update tiap step
+AI_LOD_ACTIVE_MARGIN = 64
+# near: <= distance → update penuh tiap NEAR_INTERVAL step
+AI_LOD_NEAR_DISTANCE = 512
+AI_LOD_NEAR_INTERVAL = 3
+# far: sisanya → gerak kasar (flow field) tiap FAR_INTERVAL step
+AI_LOD_FAR_INTERVAL = 12
+
+# budget waktu think AI (line of sight, arah kejar) per step, ms
+AI_THINK_BUDGET_MS = 1.0
+# jumlah think minimal per step walaupun budget habis
+AI_THINK_MIN = 4
+# think per step saat simulasi deterministik (seed / replay)
+AI_THINK_FIXED = 32
+
+# snapshot state ke ring buffer tiap N step PLAY (rewind: Backspace)
+SNAPSHOT_INTERVAL = 30
+SNAPSHOT_RING_SIZE = 20
+# autosave tiap N step PLAY (kelipatan SNAPSHOT_INTERVAL), ditulis di thread
+AUTOSAVE_INTERVAL = 30 * 60
+AUTOSAVE_PATH = ".cache/autosave.fss"
@@ -0,0 +1,312 @@
+import math
+import os
+import struct
+import threading
+import time
+from array import array
+from collections import deque
+
+from entities.slime import Slime
+from entities.skeleton import Skeleton
+from entities.health import HealthPickup
+from entities.BombPickup import BombPickup
+from entities.thrown_bomb import ThrownBomb
+
+# ==========================================================
+# FORMAT BLOB
+# ==========================================================
+# Semua little endian:
+# - header  : magic "FSSN", versi (u8), state game (u8),
+#             backend enemy (u8, index ENEMY_BACKENDS)
+# - game    : score, seed run, timer & batas spawn, bomb_available
+# - rng     : state Mersenne Twister Game.rng (625 x u32 + gauss)
+# - player  : Player.STATE + index bomb yang dipegang
+# - group   : enemies, pickups, bomb_pickups, projectiles →
+#             jumlah (u16) lalu per sprite: kind (u8) + <Kind>.STATE
+# - ai      : fase LOD (u32), dt tertunda per enemy (f64, NaN = belum
+#             dijadwalkan), antrean AIScheduler (index enemy u16)
+# - horde   : hanya backend "horde", Horde.save_state()
+MAGIC = b"FSSN"
+VERSION = 2
+
+HEADER = struct.Struct("<4sBBB")
+GAME = struct.Struct("<iQBdidiiB")
+GAUSS = struct.Struct("<Bd")
+HELD = struct.Struct("<i")
+COUNT = struct.Struct("<H")
+KIND = struct.Struct("<B")
+AI = struct.Struct("<IH")
+
+GAME_STATES = ("MENU", "PLAY", "GAMEOVER")
+ENEMY_BACKENDS = ("sprite", "horde")
+GROUPS = ("enemies", "pickups", "bomb_pickups", "projectiles")
+# kind sprite -> class (index = kind)
+KINDS = (Slime, Skeleton, HealthPickup, BombPickup, ThrownBomb)
+_KIND_OF = {cls: kind for kind, cls in enumerate(KINDS)}
+_RNG_WORDS = 625
+
+
+def snapshot_game(game):
+    """Seluruh state simulasi Game → blob bytes (versi VERSION)."""
+    parts = [HEADER.pack(
+        MAGIC, VERSION, GAME_STATES.index(game.state), ENEMY_BACKENDS.index(game.enemy_backend)
+    )]
+
+    seed = game.run_seed
+    parts.append(GAME.pack(
+        game.get_score(), seed if seed is not None else 0, seed is not None,
+        game.enemy_increase_timer, game.max_enemy, game.enemy_increase_interval,
+        game.enemy_max_limit, game.max_hp_pickup, game.bomb_available
+    ))
+
+    _, words, gauss = game.rng.getstate()
+    parts.append(array("I", words).tobytes())
+    parts.append(GAUSS.pack(gauss is not None, gauss or 0.0))
+
+    bombs = list(game.bomb_pickups)
+    held = game.player.get_held_bomb()
+    parts.append(game.player.save_state())
+    parts.append(HELD.pack(bombs.index(held) if held in bombs else -1))
+
+    for name in GROUPS:
+        group = getattr(game, name)
+        parts.append(COUNT.pack(len(group)))
+        for sprite in (bombs if name == "bomb_pickups" else group):
+            parts.append(KIND.pack(_KIND_OF[type(sprite)]))
+            parts.append(sprite.save_state())
+
+    # jadwal AI, supaya lanjutan setelah restore sama persis
+    enemies = list(game.enemies)
+    slot = {enemy: i for i, enemy in enumerate(enemies)}
+    order = [slot[enemy] for enemy in game.ai_scheduler.order() if enemy in slot]
+    parts.append(AI.pack(game.ai_lod.next_phase, len(order)))
+    pending = (game.ai_lod.pending_of(enemy) for enemy in enemies)
+    parts.append(array("d", (math.nan if dt is None else dt for dt in pending)).tobytes())
+    parts.append(array("H", order).tobytes())
+
+    if game.horde is not None:
+        parts.append(game.horde.save_state())
+
+    return b"".join(parts)
+
+
+def restore_game(game, blob):
+    """
+    Kembalikan state dari snapshot_game(). Objek lama dipakai
+    ulang: enemy & bomb lewat ObjectPool, pickup dari group lama.
+    """
+    magic, version, state, backend = HEADER.unpack_from(blob, 0)
+    if magic != MAGIC:
+        raise ValueError("Bukan snapshot game")
+    if version != VERSION:
+        raise ValueError(f"Versi snapshot {version} tidak didukung")
+    if ENEMY_BACKENDS[backend] != game.enemy_backend:
+        raise ValueError(f"Snapshot dibuat dengan ENEMY_BACKEND \"{ENEMY_BACKENDS[backend]}\"")
+    offset = HEADER.size
+
+    (score, seed, has_seed, game.enemy_increase_timer, game.max_enemy,
+     game.enemy_increase_interval, game.enemy_max_limit, game.max_hp_pickup,
+     bomb_available) = GAME.unpack_from(blob, offset)
+    offset += GAME.size
+
+    words = array("I")
+    words.frombytes(blob[offset:offset + _RNG_WORDS * 4])
+    offset += _RNG_WORDS * 4
+    has_gauss, gauss = GAUSS.unpack_from(blob, offset)
+    offset += GAUSS.size
+
+    player_state = blob[offset:offset + game.player.STATE.size]
+    offset += game.player.STATE.size
+    (held,) = HELD.unpack_from(blob, offset)
+    offset += HELD.size
+
+    # kembalikan sprite lama ke pool / daftar pakai ulang
+    reusable = {HealthPickup: [], BombPickup: []}
+    for enemy in list(game.enemies):
+        game.ai_lod.forget(enemy)
+        enemy.kill()
+        game.enemy_pools[type(enemy)].release(enemy)
+    for bomb in list(game.projectiles):
+        bomb.kill()
+        game.bomb_pool.release(bomb)
+    for pickup in list(game.pickups) + list(game.bomb_pickups):
+        if pickup not in reusable[type(pickup)]:
+            reusable[type(pickup)].append(pickup)
+    for name in GROUPS:
+        getattr(game, name).empty()
+
+    for name in GROUPS:
+        group = getattr(game, name)
+        (count,) = COUNT.unpack_from(blob, offset)
+        offset += COUNT.size
+        for _ in range(count):
+            (kind,) = KIND.unpack_from(blob, offset)
+            offset += KIND.size
+            cls = KINDS[kind]
+            sprite = _acquire(game, cls, reusable)
+            sprite.load_state(blob[offset:offset + cls.STATE.size])
+            offset += cls.STATE.size
+            group.add(sprite)
+
+    # player & bomb yang dipegang
+    game.player.load_state(player_state)
+    bombs = list(game.bomb_pickups)
+    game.player.set_held_bomb(bombs[held] if held >= 0 else None)
+    game.current_bomb = bombs[held] if held >= 0 else None
+    game.bomb_available = bool(bomb_available)
+
+    game.entities.empty()
+    game.entities.add(game.player, *bombs)
+
+    game.reset_score()
+    game.add_score(score)
+    game.run_seed = seed if has_seed else None
+    game.state = GAME_STATES[state]
+
+    # rng terakhir: membuat pickup baru di atas ikut memakai rng
+    game.rng.setstate((3, tuple(words), gauss if has_gauss else None))
+
+    # jadwal AI (LOD & antrean think)
+    enemies = list(game.enemies)
+    phase, queued = AI.unpack_from(blob, offset)
+    offset += AI.size
+    pending = array("d")
+    pending.frombytes(blob[offset:offset + len(enemies) * 8])
+    offset += len(enemies) * 8
+    order = array("H")
+    order.frombytes(blob[offset:offset + queued * 2])
+    offset += queued * 2
+
+    if game.horde is not None:
+        offset += game.horde.load_state(blob[offset:])
+
+    game.ai_lod.clear()
+    game.ai_lod.restore(phase, {
+        enemy: dt for enemy, dt in zip(enemies, pending) if not math.isnan(dt)
+    })
+    game.ai_scheduler.restore([enemies[i] for i in order])
+
+    # state turunan: dibangun ulang dari posisi baru
+    game.interpolator.clear()
+    game.rebuild_indexes()
+
+
+def _acquire(game, cls, reusable):
+    if cls in game.enemy_pools:
+        return game.enemy_pools[cls].acquire(0, 0)
+    if cls is ThrownBomb:
+        return game.bomb_pool.acquire(0, 0, 1)
+    if reusable[cls]:
+        return reusable[cls].pop()
+    if cls is HealthPickup:
+        return HealthPickup(0, 0, game.hp_food_images, game.rng)
+    return BombPickup(0, 0, game.bomb_img, game.rng)
+
+
+# ==========================================================
+# RING BUFFER (REWIND)
+# ==========================================================
+class SnapshotRing:
+
+    """
+    SnapshotRing
+    ------------
+    Menyimpan `capacity` snapshot terakhir di memori untuk rewind.
+    Snapshot terlama otomatis terbuang (deque maxlen).
+    """
+
+    def __init__(self, capacity=20):
+        self._items = deque(maxlen=capacity)
+        self.stats = {"captures": 0, "last_ms": 0.0, "max_ms": 0.0, "bytes": 0}
+
+    def __len__(self):
+        return len(self._items)
+
+    def capture(self, game):
+        """Ambil snapshot game sekarang, simpan & kembalikan blob-nya."""
+        start = time.perf_counter()
+        blob = snapshot_game(game)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self._items.append(blob)
+        stats = self.stats
+        stats["captures"] += 1
+        stats["last_ms"] = elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        stats["bytes"] = len(blob)
+        return blob
+
+    def rewind(self, count=1):
+        """
+        Buang `count` snapshot terbaru, kembalikan snapshot sebelumnya
+        (tetap disimpan). None jika ring kosong.
+        """
+        if not self._items:
+            return None
+        for _ in range(min(count, len(self._items) - 1)):
+            self._items.pop()
+        return self._items[-1]
+
+    def clear(self):
+        self._items.clear()
+
+
+# ==========================================================
+# AUTOSAVE (THREAD BACKGROUND)
+# ==========================================================
+class Autosaver:
+
+    """
+    Autosaver
+    ---------
+    Menulis blob snapshot ke file di thread background, jadi
+    loop game hanya membayar biaya snapshot (< 1 ms), bukan I/O.
+
+    Hanya blob terbaru yang ditulis: jika blob baru datang saat
+    penulisan sebelumnya belum selesai, blob lama dilewati.
+    File ditulis ke .tmp lalu os.replace (tidak pernah setengah jadi).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._pending = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"saves": 0, "skipped": 0, "last_ms": 0.0}
+
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, blob):
+        with self._cond:
+            if self._pending is not None:
+                self.stats["skipped"] += 1
+            self._pending = blob
+            self._cond.notify()
+
+    def close(self):
+        """Tulis blob yang tersisa lalu hentikan thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                blob, self._pending = self._pending, None
+                if blob is None:
+                    return
+
+            start = time.perf_counter()
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, self.path)
+            self.stats["saves"] += 1
+            self.stats["last_ms"] = (time.perf_counter() - start) * 1000
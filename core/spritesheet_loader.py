@@ -1,5 +1,11 @@
 import pygame
 
+# NumPy opsional: dipakai untuk deteksi segment frame attack
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 def load_spritesheet(path, frame_width, frame_height, scale=1):
     """
     Memuat spritesheet berbasis grid (baris x kolom).
@@ -41,7 +47,8 @@ def load_attack_frames(path):
     - Frame dipisahkan oleh area kosong (transparan)
 
     Teknik:
-    1. Deteksi kolom yang berisi pixel (non-transparan)
+    1. Deteksi kolom yang berisi pixel (non-transparan),
+       sekaligus untuk seluruh sheet (lihat find_segments)
     2. Crop frame secara dinamis
     3. Pad semua frame ke lebar yang sama
 
@@ -50,27 +57,12 @@ def load_attack_frames(path):
     """
 
     sheet = pygame.image.load(path).convert_alpha()
-    w, h = sheet.get_width(), sheet.get_height()
+    h = sheet.get_height()
 
     # ============================
     # 1. DETEKSI SEGMENT FRAME
     # ============================
-    segments = []
-    started = False
-    start = 0
-
-    for x in range(w):
-        column = sheet.subsurface((x, 0, 1, h))
-        if column.get_bounding_rect() != pygame.Rect(0,0,0,0):
-            if not started:
-                start = x
-                started = True
-        else:
-            if started:
-                segments.append((start, x))
-                started = False
-    if started:
-        segments.append((start, w))
+    segments = find_segments(sheet)
 
     frames = []
 
@@ -99,6 +91,43 @@ def load_attack_frames(path):
 
     return frames
 
+def find_segments(sheet, use_numpy=None):
+    """
+    Cari rentang kolom [start, end) yang berisi pixel tidak transparan
+    penuh (alpha >= 1), sama seperti get_bounding_rect() per kolom.
+
+    - NumPy  : reduksi alpha per kolom (any) untuk seluruh sheet
+    - Tanpa  : mask pygame → bounding rect tiap komponen, lalu
+               gabungkan rentang x yang overlap / bersebelahan
+               (kolom dalam satu komponen selalu berisi pixel)
+
+    sheet harus punya per-pixel alpha (convert_alpha / SRCALPHA).
+    use_numpy=None → pakai NumPy jika ter-install.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+
+    if use_numpy:
+        alpha = pygame.surfarray.pixels_alpha(sheet)
+        filled = alpha.any(axis=1)
+        del alpha   # lepas lock surface
+
+        # perubahan kosong ↔ berisi menandai awal / akhir segment
+        edges = numpy.flatnonzero(numpy.diff(filled.astype(numpy.int8), prepend=0, append=0))
+        return [(int(a), int(b)) for a, b in zip(edges[::2], edges[1::2])]
+
+    mask = pygame.mask.from_surface(sheet, 0)
+    spans = sorted((r.left, r.right) for r in mask.get_bounding_rects())
+
+    segments = []
+    for a, b in spans:
+        if segments and a <= segments[-1][1]:
+            if b > segments[-1][1]:
+                segments[-1] = (segments[-1][0], b)
+        else:
+            segments.append((a, b))
+    return segments
+
 # ==========================================================
 # STABLE SPRITESHEET LOADER (TIDAK CROP)
 # ==========================================================
@@ -148,4 +177,146 @@ def load_spritesheet_stable(path, frame_width, frame_height, scale=1):
 
             frames.append(frame)
 
-    return frames
\ No newline at end of file
+    return frames
+
+
+# ==========================================================
+# ASSET CACHE (DIPAKAI BERSAMA SEMUA INSTANCE)
+# ==========================================================
+# Setiap spawn enemy / bomb sebelumnya membaca PNG dari disk,
+# scale dan flip ulang semua frame. Cache di bawah menyimpan
+# hasilnya sekali per proses; semua instance memakai surface yang
+# sama, jadi frame hasil cache TIDAK BOLEH diubah (digambar ke,
+# set_alpha, dll). Salin dulu dengan .copy() jika perlu.
+
+# path -> Surface (convert_alpha)
+_image_cache = {}
+# (path, frame_w, frame_h, scale, flip) -> tuple Surface
+_frame_cache = {}
+_cache_stats = {"disk_loads": 0, "hits": 0, "misses": 0}
+
+
+def _load_sheet(path):
+    sheet = _image_cache.get(path)
+    if sheet is None:
+        sheet = pygame.image.load(path).convert_alpha()
+        _image_cache[path] = sheet
+        _cache_stats["disk_loads"] += 1
+    return sheet
+
+
+def register_image(path, surface):
+    """
+    Masukkan gambar yang sudah di-decode & di-convert (mis. oleh
+    Preloader) ke cache, jadi loader di bawah tidak membaca disk lagi.
+    """
+    _image_cache[path] = surface
+
+
+def _cached_frames(key, build):
+    frames = _frame_cache.get(key)
+    if frames is None:
+        frames = tuple(build())
+        _frame_cache[key] = frames
+        _cache_stats["misses"] += 1
+    else:
+        _cache_stats["hits"] += 1
+    return frames
+
+
+def load_image_cached(path, scale=1, flip=False):
+    """Satu gambar utuh (mis. bomb.png), di-scale / flip sekali saja."""
+    if scale == 1 and not flip:
+        return _load_sheet(path)
+
+    sheet = _load_sheet(path)
+    w, h = sheet.get_size()
+    return load_frames_cached(path, w, h, scale, flip)[0]
+
+
+def load_frames_cached(path, frame_width, frame_height, scale=1, flip=False):
+    """
+    Versi cache dari load_spritesheet_stable.
+    Mengembalikan tuple frame (baris x kolom) yang dipakai bersama.
+    """
+    key = (path, frame_width, frame_height, scale, flip)
+
+    def build():
+        if flip:
+            # flip dari frame versi normal (juga di-cache)
+            normal = load_frames_cached(path, frame_width, frame_height, scale)
+            return [pygame.transform.flip(f, True, False) for f in normal]
+
+        sheet = _load_sheet(path)
+        rows = sheet.get_height() // frame_height
+        cols = sheet.get_width() // frame_width
+
+        frames = []
+        for y in range(rows):
+            for x in range(cols):
+                rect = (x * frame_width, y * frame_height, frame_width, frame_height)
+                frame = sheet.subsurface(rect)
+                if scale != 1:
+                    frame = pygame.transform.scale(
+                        frame, (frame_width * scale, frame_height * scale)
+                    )
+                else:
+                    frame = frame.copy()
+                frames.append(frame)
+        return frames
+
+    return _cached_frames(key, build)
+
+
+def load_strip_cached(path, count, scale=1, flip=False):
+    """
+    Spritesheet satu baris berisi count frame
+    (lebar frame = lebar gambar // count, tinggi = tinggi gambar).
+    """
+    sheet = _load_sheet(path)
+    frame_width = sheet.get_width() // count
+    frames = load_frames_cached(path, frame_width, sheet.get_height(), scale, flip)
+    return frames[:count]
+
+
+def pack_cached_frames(atlas):
+    """
+    Pindahkan semua set frame di cache ke TextureAtlas.
+    Entity yang dibuat setelah ini memakai frame atlas (subsurface page).
+    """
+    keys = list(_frame_cache)
+    packed = atlas.pack([_frame_cache[key] for key in keys])
+    for key, frames in zip(keys, packed):
+        _frame_cache[key] = frames
+    return len(keys)
+
+
+def memory_report():
+    """
+    Ringkasan isi asset cache:
+    - images / frame_sets : jumlah gambar sumber & set frame
+    - surfaces / bytes    : total surface & perkiraan memori pixel
+                            (tanpa page atlas, lihat TextureAtlas)
+    - disk_loads          : jumlah PNG yang dibaca dari disk
+    - hits / misses       : lookup set frame
+    """
+    surfaces = list(_image_cache.values())
+    for frames in _frame_cache.values():
+        surfaces.extend(frames)
+
+    # subsurface (frame atlas) memakai pixel page, tidak dihitung dua kali
+    size = sum(s.get_width() * s.get_height() * s.get_bytesize()
+               for s in surfaces if s.get_parent() is None)
+
+    report = dict(_cache_stats)
+    report["images"] = len(_image_cache)
+    report["frame_sets"] = len(_frame_cache)
+    report["surfaces"] = len(surfaces)
+    report["bytes"] = size
+    return report
+
+
+def clear_asset_cache():
+    """Kosongkan cache (mis. setelah display dibuat ulang)."""
+    _image_cache.clear()
+    _frame_cache.clear()
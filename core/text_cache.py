@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+
+    """
+    FontRegistry
+    ------------
+    Satu objek pygame.font.Font per pasangan (file, ukuran).
+
+    Membuat Font dari file TTF berarti membaca & parse file font,
+    jadi tidak boleh dilakukan setiap frame.
+    path None = font default pygame.
+    """
+
+    def __init__(self):
+        # (path, size) -> Font
+        self.fonts = {}
+
+    def get(self, path, size):
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+
+class TextCache:
+
+    """
+    TextCache
+    ---------
+    Cache surface hasil Font.render() dengan eviction LRU.
+
+    Key: (font, teks, warna, antialias). Label statis ("Play",
+    "GAME OVER", ...) cukup di-render sekali; teks dinamis seperti
+    "Score: N" hanya di-render ulang saat nilainya berubah.
+    Entry yang paling lama tidak dipakai dibuang jika cache penuh.
+    """
+
+    def __init__(self, fonts=None, max_entries=128):
+        self.fonts = fonts or FontRegistry()
+        self.max_entries = max_entries
+        # key -> Surface (urutan = urutan terakhir dipakai)
+        self.surfaces = OrderedDict()
+        self.stats = {"hits": 0, "renders": 0, "evictions": 0}
+
+    def render(self, path, size, text, color, antialias=True):
+        """Surface teks dari cache, render baru jika belum ada."""
+        font = self.fonts.get(path, size)
+        key = (font, text, tuple(color), antialias)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.stats["hits"] += 1
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.stats["renders"] += 1
+
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.stats["evictions"] += 1
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
@@ -0,0 +1,94 @@
+class FixedTimestep:
+
+    """
+    FixedTimestep
+    -------------
+    Accumulator untuk simulasi dengan langkah tetap.
+
+    Waktu frame (dt render) ditampung di accumulator lalu dipecah
+    menjadi beberapa langkah simulasi sebesar step_dt. Jika frame
+    tersendat, jumlah langkah dibatasi max_steps dan sisa waktu
+    dibuang (game melambat sebentar, tapi tidak ada langkah raksasa
+    yang menembus collider).
+
+    alpha = sisa accumulator / step_dt (0..1), dipakai untuk
+    interpolasi posisi saat render.
+    """
+
+    def __init__(self, hz=60, max_steps=5):
+        self.step_dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.stats = {"steps": 0, "dropped_ms": 0.0}
+
+    def advance(self, frame_dt):
+        """Tambah waktu frame, kembalikan jumlah langkah simulasi."""
+        self.accumulator += frame_dt
+        steps = int(self.accumulator / self.step_dt)
+
+        if steps > self.max_steps:
+            # spiral of death: buang waktu yang tidak sempat dikejar
+            self.stats["dropped_ms"] += (steps - self.max_steps) * self.step_dt * 1000
+            steps = self.max_steps
+            self.accumulator %= self.step_dt
+        else:
+            self.accumulator -= steps * self.step_dt
+
+        self.stats["steps"] += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.step_dt
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+class Interpolator:
+
+    """
+    Interpolator
+    ------------
+    Menyimpan posisi sprite sebelum langkah simulasi terakhir,
+    supaya render bisa menggambar posisi di antara state sebelumnya
+    dan state sekarang.
+
+    Yang disimpan adalah rect.center (ukuran frame animasi bisa
+    berubah), hasilnya tetap berupa posisi topleft untuk blit.
+    Sprite baru (belum punya posisi sebelumnya) digambar apa adanya.
+    """
+
+    def __init__(self):
+        # sprite -> (center x, center y) sebelum langkah terakhir
+        self.previous = {}
+        self.alpha = 1.0
+
+    def snapshot(self, sprites):
+        """Catat posisi sekarang (dipanggil tepat sebelum step)."""
+        self.previous = {sprite: sprite.rect.center for sprite in sprites}
+
+    def position(self, sprite):
+        """Posisi topleft dunia hasil interpolasi."""
+        rect = sprite.rect
+        prev = self.previous.get(sprite)
+        if prev is None:
+            return rect.x, rect.y
+        t = 1.0 - self.alpha
+        cx, cy = rect.center
+        return rect.x + (prev[0] - cx) * t, rect.y + (prev[1] - cy) * t
+
+    def center(self, sprite):
+        """Titik tengah dunia hasil interpolasi (mis. untuk kamera)."""
+        x, y = self.position(sprite)
+        return x + sprite.rect.width / 2, y + sprite.rect.height / 2
+
+    def forget(self, sprite):
+        """
+        Lupakan posisi lama sprite (mis. enemy didaur ulang pool dan
+        muncul di tempat lain pada langkah yang sama).
+        """
+        self.previous.pop(sprite, None)
+
+    def clear(self):
+        self.previous.clear()
@@ -1,7 +1,9 @@
 import pygame
 import math
 import random
+import struct
 from entities.base_entity import BaseEntity
+from core.spritesheet_loader import load_image_cached
 
 class BombPickup(BaseEntity):
     """
@@ -16,7 +18,11 @@ class BombPickup(BaseEntity):
     bukan logika ledakan.
     """
 
-    def __init__(self, x, y, bomb_img):
+    # layout state biner (snapshot): posisi tengah, posisi dasar
+    # & waktu animasi mengambang, sedang dibawa player
+    STATE = struct.Struct("<iiddB")
+
+    def __init__(self, x, y, bomb_img, rng=random):
         super().__init__(x, y)
 
 
@@ -31,7 +37,7 @@ class BombPickup(BaseEntity):
         # FLOATING ANIMATION
         # =========================
         self.base_y = y                         # posisi awal Y
-        self.float_time = random.random() * 10
+        self.float_time = rng.random() * 10
         self.float_speed = 2
         self.float_range = 5
 
@@ -65,6 +71,20 @@ class BombPickup(BaseEntity):
         self.float_time += dt * self.float_speed
         self.rect.centery = self.base_y + math.sin(self.float_time) * self.float_range
 
+    # ============================================================
+    # SNAPSHOT STATE
+    # ============================================================
+    def save_state(self):
+        return self.STATE.pack(*self.rect.center, self.base_y, self.float_time, self.attached)
+
+    def load_state(self, data):
+        """Kembalikan state; player pembawa di-set ulang oleh snapshot."""
+        x, y, self.base_y, self.float_time, attached = self.STATE.unpack(data)
+        self.rect.center = (x, y)
+        self.hitbox.center = (x, y)
+        self.attached = bool(attached)
+        self.player = None
+
     # ============================================================
     # DEBUG DRAW
     # ============================================================
@@ -99,11 +119,11 @@ class BombPickup(BaseEntity):
         map_h = game.map.map_height
 
         # posisi random
-        x = random.randint(50, map_w - 50)
-        y = random.randint(50, map_h - 50)
+        x = game.rng.randint(50, map_w - 50)
+        y = game.rng.randint(50, map_h - 50)
 
-        bomb_img = pygame.image.load("assets/bomb.png").convert_alpha()
-        new_pickup = BombPickup(x, y, bomb_img)
+        bomb_img = load_image_cached("assets/bomb.png")
+        new_pickup = BombPickup(x, y, bomb_img, game.rng)
 
         new_pickup.attached = False
         new_pickup.player = None
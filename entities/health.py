@@ -1,4 +1,4 @@
-import pygame, random
+import pygame, random, struct
 from entities.base_entity import BaseEntity
 
 class HealthPickup(BaseEntity):
@@ -13,14 +13,19 @@ class HealthPickup(BaseEntity):
                      yang sama seperti pickup lain (bomb, dll)
     """
 
-    def __init__(self, x, y, food_images):
+    # layout state biner (snapshot): posisi tengah, index gambar
+    STATE = struct.Struct("<iiB")
+
+    def __init__(self, x, y, food_images, rng=random):
         super().__init__(x, y)
 
         # =========================
         # PILIH GAMBAR SECARA RANDOM
         # =========================
         # Memberi variasi visual tanpa logika tambahan
-        self.image = random.choice(food_images)
+        # (rng = Game.rng agar spawn bisa diulang)
+        self.food_images = food_images
+        self.image = rng.choice(food_images)
 
         # posisi & hitbox
         self.rect = self.image.get_rect(center=(x, y))
@@ -35,6 +40,15 @@ class HealthPickup(BaseEntity):
         """
         pass
 
+    def save_state(self):
+        return self.STATE.pack(*self.rect.center, self.food_images.index(self.image))
+
+    def load_state(self, data):
+        x, y, image_index = self.STATE.unpack(data)
+        self.image = self.food_images[image_index]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.hitbox = self.rect.copy()
+
     def draw_debug(self, screen, cam_x, cam_y):
         """Menampilkan hitbox untuk keperluan debug"""
         pygame.draw.rect(
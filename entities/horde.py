@@ -0,0 +1,549 @@
+import math
+import struct
+
+import pygame
+
+# NumPy opsional: Horde hanya bisa dipakai jika NumPy terpasang
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COUNT = struct.Struct("<I")
+
+
+class Archetype:
+
+    """
+    Archetype
+    ---------
+    Parameter satu jenis enemy di Horde (pengganti class per
+    jenis enemy). Perilaku Slime & Skeleton dinyatakan lewat
+    parameter ini, lihat slime_archetype() dan skeleton_archetype().
+
+    hitbox_size       : (w, h) hitbox
+    hitbox_offset_y   : pusat hitbox relatif ke pusat sprite
+    stop_distance     : berhenti mendekat jika jarak <= ini
+    attack_distance   : serang berdasarkan jarak; None = serang
+                        saat hitbox bersentuhan dengan target
+    attack_cooldown   : jeda antar damage ke target (detik)
+    anim_fps          : frame animasi per detik
+    anim_idle_reset   : True = animasi kembali ke frame 0 saat diam
+    """
+
+    def __init__(self, name, frames_right, frames_left, speed, hp,
+                 hitbox_size, hitbox_offset_y=0, stop_distance=0,
+                 attack_distance=None, attack_cooldown=1.0,
+                 anim_fps=8, anim_idle_reset=False):
+        self.name = name
+        self.frames_right = frames_right
+        self.frames_left = frames_left
+        self.speed = speed
+        self.hp = hp
+        self.hitbox_size = hitbox_size
+        self.hitbox_offset_y = hitbox_offset_y
+        self.stop_distance = stop_distance
+        self.attack_distance = attack_distance
+        self.attack_cooldown = attack_cooldown
+        self.anim_fps = anim_fps
+        self.anim_idle_reset = anim_idle_reset
+
+
+# Angka balancing dibaca dari class Slime / Skeleton saat archetype
+# dibuat, jadi ikut perubahan class (termasuk override batch runner).
+
+def slime_archetype():
+    """Parameter Slime (lihat entities/slime.py)."""
+    from entities.slime import Slime
+
+    right, left = Slime.load_animations()
+    w, h = right[0].get_size()
+    hitbox_h = int(h * 0.45)
+    return Archetype(
+        "slime", right, left,
+        speed=Slime.SPEED,
+        hp=1,
+        hitbox_size=(int(w * 0.55), hitbox_h),
+        # hitbox menempel di bawah sprite (midbottom)
+        hitbox_offset_y=(h - hitbox_h) / 2,
+        attack_distance=Slime.ATTACK_DISTANCE or None,
+        attack_cooldown=Slime.DAMAGE_DELAY,
+        anim_fps=1 / 0.12
+    )
+
+
+def skeleton_archetype():
+    """Parameter Skeleton (lihat entities/skeleton.py)."""
+    from entities.skeleton import Skeleton
+
+    right, left = Skeleton.load_animations()
+    w, h = right[0].get_size()
+    return Archetype(
+        "skeleton", right, left,
+        speed=Skeleton.SPEED,
+        hp=1,
+        hitbox_size=(int(w * 0.45), int(h * 0.55)),
+        hitbox_offset_y=-20,
+        stop_distance=25,
+        attack_distance=Skeleton.ATTACK_DISTANCE or None,
+        attack_cooldown=Skeleton.ATTACK_COOLDOWN,
+        anim_fps=9,
+        anim_idle_reset=True
+    )
+
+
+class Horde:
+
+    """
+    Horde
+    -----
+    Penyimpanan enemy berorientasi data (struct of arrays):
+    posisi, velocity, HP, cooldown dan animasi semua enemy
+    disimpan dalam array NumPy, bukan satu Sprite per enemy.
+
+    Satu update() memproses semua enemy sekaligus:
+    - steering : lurus ke target jika dekat, selain itu ikut
+                 arah FlowField (tabel arah per cell, dihitung
+                 ulang hanya saat flow field berubah)
+    - collision: sudut badan dicek ke OccupancyGrid per sumbu,
+                 tertahan di satu sudut → meluncur ke sisi kosong
+    - cooldown & animasi: operasi array
+
+    Dipakai Game jika ENEMY_BACKEND = "horde" (ribuan enemy);
+    default Game memakai class Slime / Skeleton biasa.
+    Posisi yang disimpan adalah pusat hitbox; prev_x / prev_y =
+    posisi sebelum update() terakhir (interpolasi render).
+    """
+
+    # jarak (pixel) di mana enemy mengejar lurus tanpa flow field
+    DIRECT_RANGE = 64
+
+    # array yang masuk save_state() (prev_x / prev_y hanya untuk render)
+    _STATE_ARRAYS = ("x", "y", "vx", "vy", "hp", "cooldown", "frame", "facing_right", "kind")
+
+    def __init__(self, archetypes, grid=None, flow=None, capacity=256):
+        if numpy is None:
+            raise ImportError("Horde membutuhkan NumPy (pip install numpy)")
+
+        self.archetypes = list(archetypes)
+        self.grid = grid
+        self.flow = flow
+        self.count = 0
+
+        # parameter archetype, diindeks dengan kind
+        a = self.archetypes
+        self._speed = numpy.array([t.speed for t in a], numpy.float32)
+        self._half_w = numpy.array([t.hitbox_size[0] / 2 for t in a], numpy.float32)
+        self._half_h = numpy.array([t.hitbox_size[1] / 2 for t in a], numpy.float32)
+        self._offset_y = numpy.array([t.hitbox_offset_y for t in a], numpy.float32)
+        self._stop = numpy.array([t.stop_distance for t in a], numpy.float32)
+        self._by_distance = numpy.array([t.attack_distance is not None for t in a])
+        self._attack_dist = numpy.array([t.attack_distance or 0 for t in a], numpy.float32)
+        self._cooldown = numpy.array([t.attack_cooldown for t in a], numpy.float32)
+        self._anim_fps = numpy.array([t.anim_fps for t in a], numpy.float32)
+        self._idle_reset = numpy.array([t.anim_idle_reset for t in a])
+        self._frame_count = numpy.array([len(t.frames_right) for t in a], numpy.float32)
+
+        self._allocate(capacity)
+
+        # tabel offset cell berikutnya (-1, 0, 1) per cell flow field
+        self._flow_key = None
+        self._flow_dx = None
+        self._flow_dy = None
+
+        self.stats = {"spawned": 0, "killed": 0, "flow_tables": 0}
+
+    # ==========================================================
+    # STORAGE
+    # ==========================================================
+    def _allocate(self, capacity):
+        f32 = numpy.float32
+        self.capacity = capacity
+        self.x = numpy.zeros(capacity, f32)
+        self.y = numpy.zeros(capacity, f32)
+        self.vx = numpy.zeros(capacity, f32)
+        self.vy = numpy.zeros(capacity, f32)
+        self.hp = numpy.zeros(capacity, numpy.int16)
+        self.cooldown = numpy.zeros(capacity, f32)
+        self.frame = numpy.zeros(capacity, f32)
+        self.facing_right = numpy.ones(capacity, bool)
+        self.kind = numpy.zeros(capacity, numpy.int8)
+        self.prev_x = numpy.zeros(capacity, f32)
+        self.prev_y = numpy.zeros(capacity, f32)
+
+    def _arrays(self):
+        return ("x", "y", "vx", "vy", "hp", "cooldown", "frame", "facing_right", "kind",
+                "prev_x", "prev_y")
+
+    def _grow(self):
+        old = {name: getattr(self, name) for name in self._arrays()}
+        self._allocate(self.capacity * 2)
+        for name, values in old.items():
+            getattr(self, name)[:len(values)] = values
+
+    def spawn(self, kind, x, y):
+        """
+        Tambah enemy archetype ke-`kind` dengan pusat sprite di (x, y).
+        Mengembalikan index enemy (berubah saat ada enemy yang mati).
+        """
+        if self.count == self.capacity:
+            self._grow()
+
+        i = self.count
+        archetype = self.archetypes[kind]
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y + archetype.hitbox_offset_y
+        self.vx[i] = self.vy[i] = 0
+        self.hp[i] = archetype.hp
+        self.cooldown[i] = 0
+        self.frame[i] = 0
+        self.facing_right[i] = True
+        self.kind[i] = kind
+
+        self.count += 1
+        self.stats["spawned"] += 1
+        return i
+
+    def _compact(self, keep):
+        """Buang enemy yang tidak di-keep (urutan sisa tetap)."""
+        n = self.count
+        alive = int(keep.sum())
+        for name in self._arrays():
+            values = getattr(self, name)
+            values[:alive] = values[:n][keep]
+        self.count = alive
+        self.stats["killed"] += n - alive
+        return n - alive
+
+    def clear(self):
+        self.count = 0
+
+    # ==========================================================
+    # UPDATE (SEMUA ENEMY SEKALIGUS)
+    # ==========================================================
+    def update(self, dt, target):
+        """
+        Kejar target (objek dengan hitbox & take_damage), gerak +
+        collision, cooldown dan animasi. Serangan yang kena langsung
+        diberikan ke target.take_damage() (1 per enemy, seperti
+        Slime.hit_target). Mengembalikan jumlah serangan tersebut.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+
+        kind = self.kind[:n]
+        x = self.x[:n]
+        y = self.y[:n]
+        tx, ty = target.hitbox.center
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+
+        # ===== STEERING =====
+        dx = tx - x
+        dy = ty - y
+        dist = numpy.hypot(dx, dy)
+        speed = self._speed[kind]
+
+        inv = numpy.divide(speed, dist, out=numpy.zeros_like(dist), where=dist > 0)
+        vx = dx * inv
+        vy = dy * inv
+
+        flow = self._flow_directions(x, y)
+        if flow is not None:
+            fx, fy = flow
+            use_flow = (dist > self.DIRECT_RANGE) & ((fx != 0) | (fy != 0))
+            vx = numpy.where(use_flow, fx * speed, vx)
+            vy = numpy.where(use_flow, fy * speed, vy)
+
+        moving = dist > self._stop[kind]
+        vx = numpy.where(moving, vx, 0)
+        vy = numpy.where(moving, vy, 0)
+        self.vx[:n] = vx
+        self.vy[:n] = vy
+        self.facing_right[:n] = dx >= 0
+
+        # ===== MOVE + COLLISION (per sumbu) =====
+        half_w = self._half_w[kind]
+        half_h = self._half_h[kind]
+
+        # sumbu yang tertahan wall hanya di satu sudut → geser ke
+        # sisi yang kosong (meluncur melewati ujung wall)
+        new_x = x + vx * dt
+        tl, tr, bl, br = self._corners(new_x, y, half_w, half_h)
+        free = ~(tl | tr | bl | br)
+        x[free] = new_x[free]
+        slide = numpy.abs(vx) * dt
+        self._nudge(y, x, half_w, half_h, ~free & ~(bl | br), slide, 1)
+        self._nudge(y, x, half_w, half_h, ~free & ~(tl | tr), slide, -1)
+
+        new_y = y + vy * dt
+        tl, tr, bl, br = self._corners(x, new_y, half_w, half_h)
+        free = ~(tl | tr | bl | br)
+        y[free] = new_y[free]
+        slide = numpy.abs(vy) * dt
+        self._nudge(x, y, half_w, half_h, ~free & ~(tr | br), slide, 1, axis_x=True)
+        self._nudge(x, y, half_w, half_h, ~free & ~(tl | bl), slide, -1, axis_x=True)
+
+        # ===== COOLDOWN =====
+        cooldown = self.cooldown[:n]
+        numpy.maximum(cooldown - dt, 0, out=cooldown)
+
+        # ===== SERANG TARGET =====
+        t = target.hitbox
+        dx = tx - x
+        dy = ty - y
+        touching = (numpy.abs(dx) < half_w + t.width / 2) & (numpy.abs(dy) < half_h + t.height / 2)
+        in_range = numpy.hypot(dx, dy) < self._attack_dist[kind]
+        hits = numpy.where(self._by_distance[kind], in_range, touching) & (cooldown <= 0)
+        cooldown[hits] = self._cooldown[kind][hits]
+        hit_count = int(hits.sum())
+        if hit_count:
+            target.take_damage(hit_count)
+
+        # ===== ANIMASI =====
+        frame = self.frame[:n]
+        frame += self._anim_fps[kind] * dt
+        idle = self._idle_reset[kind] & (vx == 0) & (vy == 0)
+        frame[idle] = 0
+        frame %= self._frame_count[kind]
+
+        return hit_count
+
+    def _nudge(self, values, other, half_w, half_h, mask, amount, sign, axis_x=False):
+        """Geser values (x jika axis_x, selain itu y) untuk mask jika tujuannya kosong."""
+        if not mask.any():
+            return
+        moved = values + sign * amount * mask
+        if axis_x:
+            corners = self._corners(moved, other, half_w, half_h)
+        else:
+            corners = self._corners(other, moved, half_w, half_h)
+        ok = mask & ~(corners[0] | corners[1] | corners[2] | corners[3])
+        values[ok] = moved[ok]
+
+    def _corners(self, x, y, half_w, half_h):
+        """
+        Status blocked keempat sudut badan enemy:
+        (kiri atas, kanan atas, kiri bawah, kanan bawah).
+
+        Cell grid selalu lebih besar dari wall aslinya (cell ikut
+        tertutup walau hanya tersentuh sebagian), jadi badan yang
+        dicek adalah hitbox dikecilkan setengah cell per sisi.
+        Tanpa ini enemy selebar 2-3 cell tersangkut di celah yang
+        dilewati flow field.
+        """
+        grid = self.grid
+        if grid is None:
+            none = numpy.zeros(len(x), bool)
+            return none, none, none, none
+
+        cells = numpy.frombuffer(grid.cells, numpy.uint8).reshape(grid.rows, grid.cols)
+        size = grid.cell_size
+        half_w = numpy.maximum(half_w - size / 2, 1)
+        half_h = numpy.maximum(half_h - size / 2, 1)
+        left = numpy.floor((x - half_w) / size).astype(numpy.int32)
+        right = numpy.floor((x + half_w - 1) / size).astype(numpy.int32)
+        top = numpy.floor((y - half_h) / size).astype(numpy.int32)
+        bottom = numpy.floor((y + half_h - 1) / size).astype(numpy.int32)
+
+        # di luar map = blocked
+        outside = (left < 0) | (top < 0) | (right >= grid.cols) | (bottom >= grid.rows)
+        numpy.clip(left, 0, grid.cols - 1, out=left)
+        numpy.clip(right, 0, grid.cols - 1, out=right)
+        numpy.clip(top, 0, grid.rows - 1, out=top)
+        numpy.clip(bottom, 0, grid.rows - 1, out=bottom)
+
+        return (
+            outside | (cells[top, left] != 0),
+            outside | (cells[top, right] != 0),
+            outside | (cells[bottom, left] != 0),
+            outside | (cells[bottom, right] != 0)
+        )
+
+    # ==========================================================
+    # FLOW FIELD → TABEL ARAH PER CELL
+    # ==========================================================
+    def _flow_directions(self, x, y):
+        """
+        Arah flow field (unit vector) di posisi tiap enemy: menuju
+        tengah cell berikutnya, sama seperti FlowField.direction_at.
+        (0, 0) jika tidak ada jalur / sudah di cell target.
+        """
+        flow = self.flow
+        if flow is None or flow.target_cell is None:
+            return None
+
+        key = (flow.target_cell, flow.stats["rebuilds"])
+        if key != self._flow_key:
+            self._build_flow_table()
+            self._flow_key = key
+
+        grid = flow.grid
+        size = grid.cell_size
+        cx = numpy.clip((x // size).astype(numpy.int32), 0, grid.cols - 1)
+        cy = numpy.clip((y // size).astype(numpy.int32), 0, grid.rows - 1)
+        step_x = self._flow_dx[cy, cx]
+        step_y = self._flow_dy[cy, cx]
+
+        dx = (cx + step_x + 0.5) * size - x
+        dy = (cy + step_y + 0.5) * size - y
+        length = numpy.hypot(dx, dy)
+        has_next = ((step_x != 0) | (step_y != 0)) & (length > 0)
+        inv = numpy.divide(1, length, out=numpy.zeros_like(length), where=has_next)
+        return dx * inv, dy * inv
+
+    def _build_flow_table(self):
+        """
+        Versi array dari FlowField.next_cell: untuk setiap cell
+        pilih tetangga dengan jarak BFS terkecil (diagonal tidak
+        boleh memotong sudut wall). Disimpan sebagai offset cell.
+        """
+        grid = self.flow.grid
+        rows, cols = grid.rows, grid.cols
+        dist = numpy.array(self.flow.dist, numpy.float32).reshape(rows, cols)
+        dist[dist < 0] = numpy.inf
+
+        padded = numpy.full((rows + 2, cols + 2), numpy.inf, numpy.float32)
+        padded[1:-1, 1:-1] = dist
+
+        def shifted(ox, oy):
+            return padded[1 + oy:1 + oy + rows, 1 + ox:1 + ox + cols]
+
+        best = dist.copy()
+        best_dx = numpy.zeros((rows, cols), numpy.int8)
+        best_dy = numpy.zeros((rows, cols), numpy.int8)
+
+        for ox, oy in self.flow.NEIGHBOURS:
+            d = shifted(ox, oy)
+            better = d < best
+            if ox and oy:
+                better &= numpy.isfinite(shifted(ox, 0)) & numpy.isfinite(shifted(0, oy))
+            best = numpy.where(better, d, best)
+            best_dx[better] = ox
+            best_dy[better] = oy
+
+        self._flow_dx = best_dx
+        self._flow_dy = best_dy
+        self.stats["flow_tables"] += 1
+
+    # ==========================================================
+    # DAMAGE
+    # ==========================================================
+    def damage_rect(self, rect, amount=1):
+        """Damage enemy yang hitbox-nya bersentuhan dengan rect."""
+        n = self.count
+        if n == 0:
+            return 0
+        kind = self.kind[:n]
+        half_w = self._half_w[kind]
+        half_h = self._half_h[kind]
+        cx, cy = rect.center
+        hit = (
+            (numpy.abs(self.x[:n] - cx) < half_w + rect.width / 2)
+            & (numpy.abs(self.y[:n] - cy) < half_h + rect.height / 2)
+        )
+        return self._apply_damage(hit, amount)
+
+    def damage_circle(self, x, y, radius, amount=1):
+        """
+        Damage enemy yang pusat sprite-nya di dalam lingkaran (AOE),
+        aturan yang sama dengan ledakan ThrownBomb pada enemy sprite.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        offset_y = self._offset_y[self.kind[:n]]
+        hit = numpy.hypot(self.x[:n] - x, self.y[:n] - offset_y - y) <= radius
+        return self._apply_damage(hit, amount)
+
+    def _apply_damage(self, hit, amount):
+        """Kurangi HP, buang yang mati. Mengembalikan jumlah yang mati."""
+        if not hit.any():
+            return 0
+        hp = self.hp[:self.count]
+        hp[hit] -= amount
+        return self._compact(hp > 0)
+
+    # ==========================================================
+    # DRAW
+    # ==========================================================
+    def draw(self, target, camera_x, camera_y, atlas=None, alpha=1.0):
+        """
+        Gambar enemy yang terlihat kamera dengan satu blits().
+        alpha (0..1): posisi di antara update() sebelumnya & terakhir.
+        """
+        n = self.count
+        if n == 0:
+            return
+        view_w, view_h = target.get_size()
+        prev_x = self.prev_x[:n]
+        prev_y = self.prev_y[:n]
+        x = prev_x + (self.x[:n] - prev_x) * alpha - camera_x
+        y = prev_y + (self.y[:n] - prev_y) * alpha - camera_y
+        visible = numpy.flatnonzero(
+            (x > -128) & (x < view_w + 128) & (y > -128) & (y < view_h + 128)
+        )
+
+        batch = []
+        archetypes = self.archetypes
+        kinds = self.kind
+        frames = self.frame
+        facing = self.facing_right
+        for i in visible.tolist():
+            archetype = archetypes[kinds[i]]
+            anim = archetype.frames_right if facing[i] else archetype.frames_left
+            image = anim[int(frames[i])]
+            w, h = image.get_size()
+            pos = (int(x[i]) - w // 2, int(y[i] - archetype.hitbox_offset_y) - h // 2)
+            batch.append(atlas.blit_args(image, pos) if atlas else (image, pos))
+        target.blits(batch, doreturn=False)
+
+    # ==========================================================
+    # QUERY & SNAPSHOT
+    # ==========================================================
+    def nearest(self, x, y):
+        """Pusat hitbox enemy terdekat → ((ex, ey), jarak) / (None, inf)."""
+        n = self.count
+        if n == 0:
+            return None, math.inf
+        dist = numpy.hypot(self.x[:n] - x, self.y[:n] - y)
+        i = int(dist.argmin())
+        return (float(self.x[i]), float(self.y[i])), float(dist[i])
+
+    def save_state(self):
+        """State semua enemy sebagai bytes: jumlah (u32) + isi tiap array."""
+        n = self.count
+        parts = [COUNT.pack(n)]
+        for name in self._STATE_ARRAYS:
+            parts.append(getattr(self, name)[:n].tobytes())
+        return b"".join(parts)
+
+    def load_state(self, data):
+        """Kembalikan state dari save_state(). Mengembalikan jumlah byte terbaca."""
+        (n,) = COUNT.unpack_from(data, 0)
+        offset = COUNT.size
+        while self.capacity < n:
+            self._grow()
+        for name in self._STATE_ARRAYS:
+            values = getattr(self, name)
+            size = n * values.itemsize
+            values[:n] = numpy.frombuffer(data, values.dtype, n, offset)
+            offset += size
+        self.count = n
+        # posisi baru, tidak diinterpolasi dari posisi lama
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        return offset
+
+    def rects(self):
+        """Hitbox semua enemy sebagai pygame.Rect (untuk debug)."""
+        n = self.count
+        result = []
+        for i in range(n):
+            kind = self.kind[i]
+            w, h = self._half_w[kind] * 2, self._half_h[kind] * 2
+            rect = pygame.Rect(0, 0, int(w), int(h))
+            rect.center = (int(self.x[i]), int(self.y[i]))
+            result.append(rect)
+        return result
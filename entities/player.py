@@ -1,7 +1,8 @@
 import pygame
+import struct
 from entities.base_entity import BaseEntity
-from entities.thrown_bomb import ThrownBomb
 from entities.BombPickup import BombPickup
+from core.spritesheet_loader import load_strip_cached
 
 class Player(BaseEntity):
 
@@ -15,80 +16,37 @@ class Player(BaseEntity):
     - Collision dengan map
     """
 
+    # nama animasi -> (spritesheet satu baris, jumlah frame)
+    ANIMATIONS = {
+        "run": ("assets/player/run.png", 8),
+        "idle": ("assets/player/idle.png", 9),
+        "attack": ("assets/player/attack.png", 10),
+        "roll": ("assets/player/roll.png", 10),   # <-- 10 frame (perbaikan utama)
+    }
+
+    # layout state biner (snapshot): hitbox x/y, hp, damage total,
+    # hadap kanan, attack (flag, timer), roll (flag, timer, arah),
+    # frame animasi, index STATES
+    STATE = struct.Struct("<iiiiBBdBddddB")
+    STATES = ("idle", "attack", "roll")
+
     def __init__(self, x, y, game):
         # Referensi ke Game (untuk map, projectiles, state)
         self.game = game
         super().__init__(x, y, speed=150)
 
-        SCALE = 2
-
 # ==================================================
 # LOAD ANIMATIONS
 # ==================================================
 
         # ============================
-        # LOAD RUN
+        # RUN / IDLE / ATTACK / ROLL (asset cache)
         # ============================
-        run_sheet = pygame.image.load("assets/player/run.png").convert_alpha()
-        RUN_FRAMES = 8
-        RUN_W = run_sheet.get_width() // RUN_FRAMES
-        RUN_H = run_sheet.get_height()
-
-        self.run_right = [
-            pygame.transform.scale(
-                run_sheet.subsurface((i * RUN_W, 0, RUN_W, RUN_H)),
-                (RUN_W * SCALE, RUN_H * SCALE)
-            ) for i in range(RUN_FRAMES)
-        ]
-        self.run_left = [pygame.transform.flip(f, True, False) for f in self.run_right]
-
-        # ============================
-        # LOAD IDLE
-        # ============================
-        idle_sheet = pygame.image.load("assets/player/idle.png").convert_alpha()
-        IDLE_FRAMES = 9
-        IDLE_W = idle_sheet.get_width() // IDLE_FRAMES
-        IDLE_H = idle_sheet.get_height()
-
-        self.idle_right = [
-            pygame.transform.scale(
-                idle_sheet.subsurface((i * IDLE_W, 0, IDLE_W, IDLE_H)),
-                (IDLE_W * SCALE, IDLE_H * SCALE)
-            ) for i in range(IDLE_FRAMES)
-        ]
-        self.idle_left = [pygame.transform.flip(f, True, False) for f in self.idle_right]
-
-        # ============================
-        # LOAD ATTACK
-        # ============================
-        atk_sheet = pygame.image.load("assets/player/attack.png").convert_alpha()
-        ATK_FRAMES = 10
-        ATK_W = atk_sheet.get_width() // ATK_FRAMES
-        ATK_H = atk_sheet.get_height()
-
-        self.atk_right = [
-            pygame.transform.scale(
-                atk_sheet.subsurface((i * ATK_W, 0, ATK_W, ATK_H)),
-                (ATK_W * SCALE, ATK_H * SCALE)
-            ) for i in range(ATK_FRAMES)
-        ]
-        self.atk_left = [pygame.transform.flip(f, True, False) for f in self.atk_right]
-
-        # ============================
-        # LOAD ROLL (10 FRAMES)
-        # ============================
-        roll_sheet = pygame.image.load("assets/player/roll.png").convert_alpha()
-        ROLL_FRAMES = 10   # <-- perbaikan utama
-        ROLL_W = roll_sheet.get_width() // ROLL_FRAMES
-        ROLL_H = roll_sheet.get_height()
-
-        self.roll_right = [
-            pygame.transform.scale(
-                roll_sheet.subsurface((i * ROLL_W, 0, ROLL_W, ROLL_H)),
-                (ROLL_W * SCALE, ROLL_H * SCALE)
-            ) for i in range(ROLL_FRAMES)
-        ]
-        self.roll_left = [pygame.transform.flip(f, True, False) for f in self.roll_right]
+        anims = self.load_animations()
+        self.run_right, self.run_left = anims["run"]
+        self.idle_right, self.idle_left = anims["idle"]
+        self.atk_right, self.atk_left = anims["attack"]
+        self.roll_right, self.roll_left = anims["roll"]
 
 # ============================
 # STATE & STATUS
@@ -118,6 +76,8 @@ class Player(BaseEntity):
         self.roll_duration = 0.3     # lamanya roll
         self.roll_timer = 0
         self.roll_speed = 450        # kecepatan saat roll
+        self.roll_dir_x = 0
+        self.roll_dir_y = 0
 
 
         # ============================
@@ -134,6 +94,24 @@ class Player(BaseEntity):
         # ==================================================
         self._max_hp = 3
         self._hp = self._max_hp
+        # total damage sejak game dimulai (statistik batch runner)
+        self.damage_taken = 0
+
+    # ==================================
+    @classmethod
+    def load_animations(cls):
+        """
+        Semua animasi player: nama -> (frame kanan, frame kiri).
+        PNG dibaca & di-scale sekali per proses (asset cache).
+        """
+        SCALE = 2
+        return {
+            name: (
+                load_strip_cached(path, count, SCALE),
+                load_strip_cached(path, count, SCALE, flip=True)
+            )
+            for name, (path, count) in cls.ANIMATIONS.items()
+        }
 
     # ==================================
     def roll(self):
@@ -143,9 +121,10 @@ class Player(BaseEntity):
             self.state = "roll"
             self.frame_index = 0
 
-            keys = pygame.key.get_pressed()
-            self.roll_dir_x = keys[pygame.K_d] - keys[pygame.K_a]
-            self.roll_dir_y = keys[pygame.K_s] - keys[pygame.K_w]
+            # arah roll dari input langkah ini (keyboard / script / bot)
+            controls = self.game.controls
+            self.roll_dir_x = controls.move_x
+            self.roll_dir_y = controls.move_y
 
             # normalize arah biar gak ngebut diagonal
             if self.roll_dir_x != 0 or self.roll_dir_y != 0:
@@ -185,7 +164,7 @@ class Player(BaseEntity):
 
         # Spawn ThrownBomb projectile
         direction = 1 if self.facing_right else -1
-        thrown = ThrownBomb(self.rect.centerx, self.rect.centery - 10, direction)
+        thrown = self.game.bomb_pool.acquire(self.rect.centerx, self.rect.centery - 10, direction)
         self.game.projectiles.add(thrown)
 
         self._held_bomb = None
@@ -200,7 +179,7 @@ class Player(BaseEntity):
         
     # ==================================
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        controls = self.game.controls
 
         # Timer attack sebelum hitbox aktif
         if self.attacking:
@@ -217,8 +196,8 @@ class Player(BaseEntity):
         if self.attacking:
             dx = dy = 0
         else:
-            dx = keys[pygame.K_d] - keys[pygame.K_a]
-            dy = keys[pygame.K_s] - keys[pygame.K_w]
+            dx = controls.move_x
+            dy = controls.move_y
 
             # ===========================
             # SET VELOCITY
@@ -374,7 +353,7 @@ class Player(BaseEntity):
 # ==================================================
 
     def collide_map_x(self):
-        for c in self.game.map.colliders:
+        for c in self.game.map.query(self.hitbox):
             if self.hitbox.colliderect(c):
                 if self.vel_x > 0:  # kanan
                     self.hitbox.right = c.left
@@ -385,7 +364,7 @@ class Player(BaseEntity):
                 self.rect.centerx = self.hitbox.centerx
 
     def collide_map_y(self):
-        for c in self.game.map.colliders:
+        for c in self.game.map.query(self.hitbox):
             if self.hitbox.colliderect(c):
                 if self.vel_y > 0:  # turun
                     self.hitbox.bottom = c.top
@@ -401,9 +380,15 @@ class Player(BaseEntity):
     def get_hp(self):
         return self._hp
 
+    def get_max_hp(self):
+        return self._max_hp
+
 
     def take_damage(self, amount):
+        old_hp = self._hp
         self._hp = max(0, self._hp - amount)
+        # hanya HP yang benar-benar hilang (tidak lewat dari 0)
+        self.damage_taken += old_hp - self._hp
         print("Player HP:", self._hp)
 
         if self._hp == 0:
@@ -415,6 +400,51 @@ class Player(BaseEntity):
     def reset_hp(self):
         self._hp = self._max_hp
 
+    # =========================
+    # SNAPSHOT STATE
+    # =========================
+    def save_state(self):
+        """State player sebagai bytes (bomb yang dipegang dicatat Game)."""
+        return self.STATE.pack(
+            self.hitbox.x, self.hitbox.y, self._hp, self.damage_taken,
+            self.facing_right, self.attacking, self.attack_timer,
+            self.rolling, self.roll_timer, self.roll_dir_x, self.roll_dir_y,
+            self.frame_index, self.STATES.index(self.state)
+        )
+
+    def load_state(self, data):
+        (self.hitbox.x, self.hitbox.y, self._hp, self.damage_taken,
+         facing_right, attacking, self.attack_timer,
+         rolling, self.roll_timer, self.roll_dir_x, self.roll_dir_y,
+         self.frame_index, state) = self.STATE.unpack(data)
+        self.facing_right = bool(facing_right)
+        self.attacking = bool(attacking)
+        self.rolling = bool(rolling)
+        self.state = self.STATES[state]
+
+        if self.attacking:
+            anim = self.atk_right if self.facing_right else self.atk_left
+        elif self.rolling:
+            anim = self.roll_right if self.facing_right else self.roll_left
+        else:
+            anim = self.idle_right if self.facing_right else self.idle_left
+        self.image = anim[int(self.frame_index) % len(anim)]
+        self.rect = self.image.get_rect(center=self.hitbox.center)
+
+    def reset_state(self):
+        """Kembalikan aksi, bomb & statistik ke awal (restart / replay)."""
+        self._held_bomb = None
+        self.attacking = False
+        self.attack_timer = 0
+        self.rolling = False
+        self.roll_timer = 0
+        self.state = "idle"
+        self.facing_right = True
+        self.frame_index = 0
+        self.vel_x = 0
+        self.vel_y = 0
+        self.damage_taken = 0
+
     def die(self):
         print("Player mati")
         self.game.state = "GAMEOVER"
@@ -424,6 +454,15 @@ class Player(BaseEntity):
     # =========================
     def has_bomb(self):
         return self._held_bomb is not None
+
+    def get_held_bomb(self):
+        return self._held_bomb
+
+    def set_held_bomb(self, bomb):
+        """Set bomb yang dipegang langsung (restore snapshot, tanpa ubah Game)."""
+        self._held_bomb = bomb
+        if bomb is not None:
+            bomb.attach_to_player(self)
     
     def can_pick_bomb(self):
         return not self.has_bomb()
@@ -1,6 +1,8 @@
 import pygame
 import math
+import struct
 from entities.slime import Slime
+from core.spritesheet_loader import load_strip_cached
 
 class Skeleton(Slime):
 
@@ -19,27 +21,26 @@ class Skeleton(Slime):
     - Polymorphism: override update() dan die()
     """
 
-    def __init__(self, x, y, target, walls):
-        # Panggil constructor parent (Slime)
-        super().__init__(x, y, target, walls)
+    # spritesheet animasi (juga dipakai preloader)
+    SHEET = "assets/enemy/skeleton_walk.png"
 
-        SCALE = 2
+    # angka balancing (bisa diubah batch runner)
+    SPEED = 90
+    ATTACK_COOLDOWN = 1.0
+    ATTACK_DISTANCE = 35
 
-        # ============================
-        # WALK ANIMATION
-        # ============================
-        sheet = pygame.image.load("assets/enemy/skeleton_walk.png").convert_alpha()
-        FRAMES = 8
-        FW = sheet.get_width() // FRAMES
-        FH = sheet.get_height()
+    # layout state biner (snapshot): hitbox x/y, velocity,
+    # cooldown serangan, frame animasi, hp, hadap kanan
+    STATE = struct.Struct("<iiddddiB")
 
-        self.frames_right = []
-        for i in range(FRAMES):
-            frame = sheet.subsurface((i * FW, 0, FW, FH))
-            frame = pygame.transform.scale(frame, (FW * SCALE, FH * SCALE))
-            self.frames_right.append(frame)
+    def __init__(self, x, y, target, walls, grid=None, flow=None):
+        # Panggil constructor parent (Slime)
+        super().__init__(x, y, target, walls, grid, flow)
 
-        self.frames_left = [pygame.transform.flip(f, True, False) for f in self.frames_right]
+        # ============================
+        # WALK ANIMATION (asset cache, dipakai bersama)
+        # ============================
+        self.frames_right, self.frames_left = self.load_animations()
 
         # ============================
         # STATE & STATUS
@@ -50,7 +51,7 @@ class Skeleton(Slime):
         self.facing_right = True
 
         # Attack cooldown
-        self.attack_cooldown = 1.0
+        self.attack_cooldown = self.ATTACK_COOLDOWN
         self.attack_timer = 0
 
         # Set sprite awal
@@ -61,7 +62,7 @@ class Skeleton(Slime):
         # DISTANCE RULES
         # ============================
         self.stop_distance = 25     # berhenti mendekat
-        self.attack_distance = 35   # jarak serang
+        self.attack_distance = self.ATTACK_DISTANCE   # jarak serang
 
         # ============================
         # HITBOX
@@ -78,16 +79,69 @@ class Skeleton(Slime):
         # ============================
         # MOVEMENT
         # ============================
-        self.speed = 90 
+        self.speed = self.SPEED
         self.vel_x = 0
         self.vel_y = 0
 
+    # ==================================================
+    # RESET (OBJECT POOL)
+    # ==================================================
+    def reset(self, x, y):
+        """Hidupkan lagi skeleton di (x, y) (dipakai ObjectPool)."""
+        super().reset(x, y)
+
+        self.frame_index = 0
+        self.facing_right = True
+        self.attack_timer = 0
+
+        self.image = self.frames_right[0]
+        self.rect = self.image.get_rect(center=(x, y))
+
+        w, h = self.rect.size
+        self.hitbox.size = (int(w * 0.45), int(h * 0.55))
+        self.hitbox.center = (self.rect.centerx, self.rect.centery + self.hitbox_offset_y)
+
+    # ==================================================
+    # SNAPSHOT STATE (POLYMORPHISM)
+    # ==================================================
+    def save_state(self):
+        """State skeleton sebagai bytes (lihat STATE)."""
+        return self.STATE.pack(
+            self.hitbox.x, self.hitbox.y, self.vel_x, self.vel_y,
+            self.attack_timer, self.frame_index, self._hp, self.facing_right
+        )
+
+    def load_state(self, data):
+        """Kembalikan state dari save_state() (setelah reset())."""
+        (self.hitbox.x, self.hitbox.y, self.vel_x, self.vel_y,
+         self.attack_timer, self.frame_index, self._hp, facing_right) = self.STATE.unpack(data)
+        self.facing_right = bool(facing_right)
+
+        anim = self.frames_right if self.facing_right else self.frames_left
+        self.image = anim[int(self.frame_index)]
+        self.rect = self.image.get_rect(
+            center=(self.hitbox.centerx, self.hitbox.centery - self.hitbox_offset_y)
+        )
+
+    # ==================================================
+    # ANIMASI (ASSET CACHE)
+    # ==================================================
+    @classmethod
+    def load_animations(cls):
+        """Frame jalan kanan & kiri, dipakai bersama semua skeleton."""
+        FRAMES = 8
+        SCALE = 2
+        return (
+            load_strip_cached(cls.SHEET, FRAMES, SCALE),
+            load_strip_cached(cls.SHEET, FRAMES, SCALE, flip=True)
+        )
+
     # ==================================================
     # COLLISION x
     # ==================================================
     def collide_x(self):
         """Handle collision horizontal dengan wall"""
-        for wall in self.walls:
+        for wall in self.walls.query(self.hitbox):
             if self.hitbox.colliderect(wall):
                 if self.vel_x > 0:
                     self.hitbox.right = wall.left
@@ -102,7 +156,7 @@ class Skeleton(Slime):
     # ==================================================
     def collide_y(self):
         """Handle collision vertikal dengan wall"""
-        for wall in self.walls:
+        for wall in self.walls.query(self.hitbox):
             if self.hitbox.colliderect(wall):
                 if self.vel_y > 0:
                     self.hitbox.bottom = wall.top
@@ -118,15 +172,15 @@ class Skeleton(Slime):
     def update(self, dt):
         """
         Update behavior Skeleton:
-        - mengejar player
-        - menyerang jika dekat
-        - update animasi
+        - mengejar player (think)
+        - cooldown serangan (serangan dicek lewat hit_target)
+        - gerak & update animasi (integrate)
         """
+        self.think()
+        self.integrate(dt)
 
-        # cooldown
-        if self.attack_timer > 0:
-            self.attack_timer -= dt
-
+    def think(self):
+        """Arah kejar & hadap skeleton (dipanggil bergiliran oleh AIScheduler)."""
         # posisi player
         px, py = self.target.hitbox.center
         ex, ey = self.hitbox.center
@@ -136,9 +190,8 @@ class Skeleton(Slime):
         # MOVEMENT (CHASE PLAYER)
         # ============================
         if dist > self.stop_distance:
-            angle = math.atan2(py - ey, px - ex)
-            self.vel_x = math.cos(angle) * self.speed
-            self.vel_y = math.sin(angle) * self.speed
+            # line of sight & menghindari wall (warisan Slime)
+            self.vel_x, self.vel_y = self.chase_velocity(px, py, ex, ey)
         else:
             self.vel_x = 0
             self.vel_y = 0
@@ -146,6 +199,11 @@ class Skeleton(Slime):
         # Hadap ke arah player
         self.facing_right = (px - ex) >= 0
 
+    def integrate(self, dt):
+        """Gerak + collision, cooldown & animasi skeleton tiap step."""
+        # cooldown
+        self.tick_cooldown(dt)
+
         # apply movement x
         self.hitbox.centerx += self.vel_x * dt
         self.collide_x()
@@ -157,10 +215,7 @@ class Skeleton(Slime):
         # ============================
         # ATTACK
         # ============================
-        if dist < self.attack_distance:
-            if self.attack_timer <= 0:
-                self.target.take_damage(1)
-                self.attack_timer = self.attack_cooldown
+        # serangan dicek Game lewat hit_target() (lihat Slime)
 
         # ============================
         # ANIMATION
@@ -182,6 +237,28 @@ class Skeleton(Slime):
         # sync hitbox
         self.hitbox.center = (self.rect.centerx, self.rect.centery + self.hitbox_offset_y)
 
+    def tick_cooldown(self, dt):
+        """Cooldown skeleton memakai attack_timer."""
+        if self.attack_timer > 0:
+            self.attack_timer -= dt
+
+    # ==================================================
+    # ATTACK (POLYMORPHISM)
+    # ==================================================
+    def hit_target(self):
+        """Serang target jika dalam jarak serang & cooldown habis."""
+        if self.attack_timer > 0:
+            return False
+
+        px, py = self.target.hitbox.center
+        ex, ey = self.hitbox.center
+        if math.hypot(px - ex, py - ey) >= self.attack_distance:
+            return False
+
+        self.target.take_damage(1)
+        self.attack_timer = self.attack_cooldown
+        return True
+
     # ==================================================
     # DIE (POLYMORPHISM)
     # ==================================================
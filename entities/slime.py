@@ -1,6 +1,7 @@
 import pygame
 import math
-from core.spritesheet_loader import load_spritesheet_stable
+import struct
+from core.spritesheet_loader import load_frames_cached
 from entities.base_entity import BaseEntity
 
 def line_blocked(start, end, walls):
@@ -18,6 +19,10 @@ def line_blocked(start, end, walls):
         dx = (x2 - x1) / steps
         dy = (y2 - y1) / steps
 
+        # hanya wall di sekitar garis yang perlu dicek
+        area = pygame.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + 2, abs(y2 - y1) + 2)
+        walls = walls.query(area)
+
         x, y = x1, y1
         for _ in range(steps):
             x += dx
@@ -41,9 +46,23 @@ class Slime(BaseEntity):
     - Polymorphism : override method update() dan die()
     """
 
-    def __init__(self, x, y, target, walls):
+    # spritesheet animasi (juga dipakai preloader)
+    SHEET = "assets/enemy/slime (1).png"
+
+    # angka balancing (bisa diubah batch runner)
+    SPEED = 80
+    DAMAGE_DELAY = 0.6
+    # jarak serang (pusat hitbox ke pusat target);
+    # 0 = hanya damage saat hitbox bersentuhan
+    ATTACK_DISTANCE = 0
+
+    # layout state biner (snapshot): hitbox x/y, posisi float,
+    # velocity, cooldown, timer & frame animasi, hp, hadap kanan
+    STATE = struct.Struct("<iiddddddiiB")
+
+    def __init__(self, x, y, target, walls, grid=None, flow=None):
         # Panggil constructor BaseEntity
-        super().__init__(x, y, image_path=None, speed=80)
+        super().__init__(x, y, image_path=None, speed=self.SPEED)
 
 
         # =========================
@@ -57,18 +76,17 @@ class Slime(BaseEntity):
         self._hp = 1
 
         # walls diterima dari Game (NO CIRCULAR IMPORT)
+        # berupa SpatialHash collider map → pakai walls.query(rect)
         self.walls = walls
+        # OccupancyGrid untuk line of sight (None = pakai line_blocked)
+        self.grid = grid
+        # FlowField bersama menuju player (None = muter per sumbu)
+        self.flow = flow
 
         # ==================================
-        # LOAD ANIMATION
+        # LOAD ANIMATION (asset cache, dipakai bersama)
         # ==================================
-        raw_frames = load_spritesheet_stable(
-            "assets/enemy/slime (1).png",
-            32, 32, scale=2
-        )
-
-        self.frames_right = raw_frames
-        self.frames_left = [pygame.transform.flip(f, True, False) for f in raw_frames]
+        self.frames_right, self.frames_left = self.load_animations()
 
         self.frames = self.frames_right
         self.frame_index = 0
@@ -98,15 +116,76 @@ class Slime(BaseEntity):
         # =========================
         # COMBAT
         # =========================
-        self.damage_delay = 0.6
+        self.damage_delay = self.DAMAGE_DELAY
         self.damage_cooldown = 0
 
+    # =========================================
+    # RESET (OBJECT POOL)
+    # =========================================
+    def reset(self, x, y):
+        """
+        Hidupkan lagi slime di (x, y) tanpa membuat objek baru
+        (dipakai ObjectPool). Frame, walls & target tetap.
+        """
+        self._alive = True
+        self._hp = 1
+        self.pos_x = float(x)
+        self.pos_y = float(y)
+
+        self.frames = self.frames_right
+        self.frame_index = 0
+        self.anim_timer = 0
+
+        self.image = self.frames[0]
+        self.rect = self.image.get_rect(center=(x, y))
+
+        # die() mengecilkan hitbox ke (0, 0) → kembalikan ukurannya
+        w, h = self.rect.size
+        self.hitbox.size = (int(w * 0.55), int(h * 0.45))
+        self.hitbox.midbottom = self.rect.midbottom
+
+        self.vel_x = 0
+        self.vel_y = 0
+        self.damage_cooldown = 0
+
+    # =========================================
+    # SNAPSHOT STATE
+    # =========================================
+    def save_state(self):
+        """State slime sebagai bytes (lihat STATE)."""
+        return self.STATE.pack(
+            self.hitbox.x, self.hitbox.y, self.pos_x, self.pos_y,
+            self.vel_x, self.vel_y, self.damage_cooldown, self.anim_timer,
+            self.frame_index, self._hp, self.frames is self.frames_right
+        )
+
+    def load_state(self, data):
+        """Kembalikan state dari save_state() (setelah reset())."""
+        (self.hitbox.x, self.hitbox.y, self.pos_x, self.pos_y,
+         self.vel_x, self.vel_y, self.damage_cooldown, self.anim_timer,
+         self.frame_index, self._hp, facing_right) = self.STATE.unpack(data)
+
+        self.frames = self.frames_right if facing_right else self.frames_left
+        self.image = self.frames[self.frame_index]
+        self.rect = self.image.get_rect(midbottom=self.hitbox.midbottom)
+
+    # =========================================
+    # ANIMASI (ASSET CACHE)
+    # =========================================
+    @classmethod
+    def load_animations(cls):
+        """Frame jalan kanan & kiri, dipakai bersama semua slime."""
+        return (
+            load_frames_cached(cls.SHEET, 32, 32, scale=2),
+            load_frames_cached(cls.SHEET, 32, 32, scale=2, flip=True)
+        )
+
     # =========================================
     # COLLISION X
     # =========================================
     def collide_x(self):
         """Handle collision horizontal dengan wall"""
-        for wall in self.walls:
+        for wall in self.walls.query(self.hitbox):
             if self.hitbox.colliderect(wall):
 
                 if self.vel_x > 0:
@@ -124,7 +203,7 @@ class Slime(BaseEntity):
     # ==================================================
     def collide_y(self):
         """Handle collision vertikal dengan wall"""
-        for wall in self.walls:
+        for wall in self.walls.query(self.hitbox):
             if self.hitbox.colliderect(wall):
 
                 if self.vel_y > 0:
@@ -141,18 +220,25 @@ class Slime(BaseEntity):
     def update(self, dt):
         """
         Update perilaku slime:
-        - mengejar player
-        - menghindari wall
-        - animasi
-        - memberi damage saat kontak
+        - mengejar player (think)
+        - gerak, menghindari wall, animasi & cooldown (integrate)
         """
+        self.think()
+        self.integrate(dt)
 
+    # =========================
+    # THINK (KEPUTUSAN AI)
+    # =========================
+    def think(self):
+        """
+        Bagian mahal AI: tentukan arah kejar (line of sight /
+        flow field) dan arah hadap. Dipanggil AIScheduler secara
+        bergiliran; velocity dipakai integrate() sampai think berikutnya.
+        """
         # FOLLOW PLAYER
         tx, ty = self.target.hitbox.center
         ex, ey = self.hitbox.center
 
-        angle = math.atan2(ty - ey, tx - ex)
-
         # ==========================
         # FACE PLAYER (Flip)
         # ==========================
@@ -161,9 +247,14 @@ class Slime(BaseEntity):
         else:
             self.frames = self.frames_left
 
-        self.vel_x = math.cos(angle) * self.speed
-        self.vel_y = math.sin(angle) * self.speed
+        # arah kejar (lurus / menghindari wall)
+        self.vel_x, self.vel_y = self.chase_velocity(tx, ty, ex, ey)
 
+    # =========================
+    # INTEGRATE (GERAK TIAP STEP)
+    # =========================
+    def integrate(self, dt):
+        """Bagian murah tiap step: gerak + collision, animasi, cooldown."""
         # ===== MOVE X =====
         self.pos_x += self.vel_x * dt
         self.hitbox.centerx = int(self.pos_x)
@@ -190,40 +281,101 @@ class Slime(BaseEntity):
 
 
         # =========================
-        # DAMAGE PLAYER
+        # COOLDOWN DAMAGE PLAYER
         # =========================
-        if self.damage_cooldown > 0:
-            self.damage_cooldown -= dt
+        # cek kontak dilakukan Game lewat hit_target(), hanya
+        # untuk enemy di dekat player (DynamicSpatialHash)
+        self.tick_cooldown(dt)
 
-        if self.hitbox.colliderect(self.target.hitbox):
-            if self.damage_cooldown <= 0:
-                self.target.take_damage(1)
-                print("Player kena! HP:", self.target.get_hp())
-                self.damage_cooldown = self.damage_delay
-        
+    # =========================
+    # COARSE UPDATE (AI LOD)
+    # =========================
+    def coarse_update(self, dt):
+        """
+        Update murah untuk enemy jauh dari layar (AILevelOfDetail):
+        ikut flow field (atau lurus ke target), tanpa line of sight
+        dan tanpa animasi. Collision wall tetap dicek.
+        """
         tx, ty = self.target.hitbox.center
         ex, ey = self.hitbox.center
 
-        # =========================
-        # OBSTACLE AVOIDANCE
-        # =========================
+        direction = self.flow.direction_at(ex, ey) if self.flow is not None else None
+        if direction is None:
+            dist = math.hypot(tx - ex, ty - ey)
+            if dist == 0:
+                return
+            direction = ((tx - ex) / dist, (ty - ey) / dist)
+
+        self.vel_x = direction[0] * self.speed
+        self.vel_y = direction[1] * self.speed
+
+        self.hitbox.centerx += round(self.vel_x * dt)
+        self.collide_x()
+        self.hitbox.centery += round(self.vel_y * dt)
+        self.collide_y()
+
+        # sinkron posisi float (dipakai update penuh berikutnya)
+        self.pos_x, self.pos_y = self.hitbox.center
+        self.tick_cooldown(dt)
+
+    def tick_cooldown(self, dt):
+        """Kurangi cooldown serangan sebesar dt."""
+        if self.damage_cooldown > 0:
+            self.damage_cooldown -= dt
 
-        blocked = line_blocked((ex, ey), (tx, ty), self.walls)
+    # =========================
+    # DAMAGE PLAYER
+    # =========================
+    def hit_target(self):
+        """Damage kontak ke target jika hitbox bersentuhan & cooldown habis."""
+        if self.damage_cooldown > 0:
+            return False
+        if not self.hitbox.colliderect(self.target.hitbox):
+            return False
 
-        if not blocked:
-            # cari jalur alternatif
+        self.target.take_damage(1)
+        print("Player kena! HP:", self.target.get_hp())
+        self.damage_cooldown = self.damage_delay
+        return True
+
+    # =========================
+    # OBSTACLE AVOIDANCE
+    # =========================
+    def target_blocked(self, start, end):
+        """Cek apakah jalur ke target terhalang wall."""
+        if self.grid is None:
+            return line_blocked(start, end, self.walls)
+
+        # cek dari keempat sudut hitbox, bukan hanya titik tengah,
+        # supaya badan enemy tidak tersangkut sudut wall
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        r = self.hitbox
+        for x, y in ((r.left, r.top), (r.right - 1, r.top),
+                     (r.left, r.bottom - 1), (r.right - 1, r.bottom - 1)):
+            if not self.grid.line_of_sight((x, y), (x + dx, y + dy)):
+                return True
+        return False
+
+    def chase_velocity(self, tx, ty, ex, ey):
+        """
+        Hitung velocity untuk mengejar target:
+        - Jalur terlihat   → lurus ke target
+        - Terhalang wall   → ikuti flow field menuju player
+        - Tanpa flow field → muter, geser horizontal / vertical
+        """
+        if not self.target_blocked((ex, ey), (tx, ty)):
             angle = math.atan2(ty - ey, tx - ex)
-            self.vel_x = math.cos(angle) * self.speed
-            self.vel_y = math.sin(angle) * self.speed
+            return math.cos(angle) * self.speed, math.sin(angle) * self.speed
 
-        else:
-            # muter: coba geser horizontal / vertical
-            if abs(tx - ex) > abs(ty - ey):
-                self.vel_x = self.speed if tx > ex else -self.speed
-                self.vel_y = 0
-            else:
-                self.vel_y = self.speed if ty > ey else -self.speed
-                self.vel_x = 0
+        if self.flow is not None:
+            direction = self.flow.direction_at(ex, ey)
+            if direction is not None:
+                return direction[0] * self.speed, direction[1] * self.speed
+
+        if abs(tx - ex) > abs(ty - ey):
+            return (self.speed if tx > ex else -self.speed), 0
+        return 0, (self.speed if ty > ey else -self.speed)
 
 # =========================
 # ENCAPSULATION - HP
@@ -1,6 +1,8 @@
-import pygame
 import math
+import struct
 from entities.base_entity import BaseEntity
+from core.spritesheet_loader import load_frames_cached, load_image_cached
+from core.settings import EXPLOSION_SCALE, EXPLOSION_FRAME_TIME
 
 class ThrownBomb(BaseEntity):
 
@@ -19,13 +21,25 @@ class ThrownBomb(BaseEntity):
     untuk menjaga Single Responsibility.
     """
 
-    def __init__(self, x, y, direction):
+    IMAGE = "assets/bomb.png"
+    EXPLOSION_SHEET = "assets/explosion.png"
+
+    # pelebaran query index ledakan: > jarak pusat rect enemy ke
+    # hitbox-nya (slime 18 px, skeleton 20 px)
+    QUERY_MARGIN = 32
+
+    # layout state biner (snapshot): posisi tengah, velocity,
+    # fuse timer, timer & frame ledakan, sedang meledak
+    STATE = struct.Struct("<iidddiB")
+
+    def __init__(self, x, y, direction, explosion_scale=EXPLOSION_SCALE,
+                 explosion_speed=EXPLOSION_FRAME_TIME):
         super().__init__(x, y)
 
         # =========================
         # VISUAL & HITBOX
         # =========================
-        self.image = pygame.image.load("assets/bomb.png").convert_alpha()
+        self.image = load_image_cached(self.IMAGE)
         self.rect = self.image.get_rect(center=(x, y))
         self.hitbox = self.rect.copy()
 
@@ -38,32 +52,66 @@ class ThrownBomb(BaseEntity):
         self.explode_time = 1.2
 
         # =========================
-        # LOAD EXPLOSION SPRITESHEET
+        # EXPLOSION STATE
         # =========================
-        sheet = pygame.image.load("assets/explosion.png").convert_alpha()
+        self.exploding = False
+        self.explosion_index = 0
+        self.explosion_speed = explosion_speed     # detik per frame
+        self.explosion_timer = 0
 
-        # tinggi frame = tinggi image
-        frame_h = sheet.get_height()
+        # ukuran ledakan (scale visual)
+        self.explosion_scale = explosion_scale
 
-        # lebar frame = tinggi (karena per frame itu kotak)
-        frame_w = frame_h
+        # =========================
+        # LOAD EXPLOSION SPRITESHEET (asset cache)
+        # =========================
+        # frame sudah di-scale sekali & dipakai bersama semua bomb
+        self.explosion_frames = self.load_animations(explosion_scale)
 
-        self.explosion_frames = []
+    def reset(self, x, y, direction):
+        """Pakai ulang bomb yang sudah meledak (dipakai ObjectPool)."""
+        self._alive = True
 
-        for i in range(6):
-            frame = sheet.subsurface(pygame.Rect(i * frame_w, 0, frame_w, frame_h))
-            self.explosion_frames.append(frame)
+        self.image = load_image_cached(self.IMAGE)
+        self.rect = self.image.get_rect(center=(x, y))
+        self.hitbox = self.rect.copy()
+
+        self.vel_x = 150 * direction
+        self.vel_y = 0
+        self.timer = 0
 
-        # =========================
-        # EXPLOSION STATE
-        # =========================
         self.exploding = False
         self.explosion_index = 0
-        self.explosion_speed = 0.07     # kecepatan animasi
         self.explosion_timer = 0
 
-        # ukuran ledakan (scale visual)
-        self.explosion_scale = 3
+    def save_state(self):
+        return self.STATE.pack(
+            *self.rect.center, self.vel_x, self.timer,
+            self.explosion_timer, self.explosion_index, self.exploding
+        )
+
+    def load_state(self, data):
+        """Kembalikan state dari save_state() (setelah reset())."""
+        (x, y, self.vel_x, self.timer, self.explosion_timer,
+         self.explosion_index, exploding) = self.STATE.unpack(data)
+        self.exploding = bool(exploding)
+
+        if self.exploding:
+            self.image = self.explosion_frames[self.explosion_index]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.hitbox.center = (x, y)
+
+    @classmethod
+    def load_animations(cls, scale=EXPLOSION_SCALE):
+        """
+        Frame ledakan ukuran akhir (dipakai bersama semua bomb).
+        Frame pertama tetap ukuran asli, frame berikutnya di-scale.
+        """
+        # frame kotak: lebar frame = tinggi image
+        frame_h = load_image_cached(cls.EXPLOSION_SHEET).get_height()
+        first = load_frames_cached(cls.EXPLOSION_SHEET, frame_h, frame_h)[0]
+        scaled = load_frames_cached(cls.EXPLOSION_SHEET, frame_h, frame_h, scale)
+        return [first] + list(scaled[1:6])
 
     # ============================================================
     # UPDATE
@@ -102,19 +150,13 @@ class ThrownBomb(BaseEntity):
                 from core.game import Game
                 Game.instance.bomb_available = True
                 self.kill()
+                # kembali ke pool untuk lemparan berikutnya
+                Game.instance.bomb_pool.release(self)
                 return
 
-            # update frame ledakan dengan scale
+            # ganti frame ledakan (sudah di-scale saat load)
             center = self.rect.center
-            frame = self.explosion_frames[self.explosion_index]
-
-            scale = self.explosion_scale
-            frame_big = pygame.transform.scale(
-                frame,
-                (frame.get_width() * scale, frame.get_height() * scale)
-            )
-
-            self.image = frame_big
+            self.image = self.explosion_frames[self.explosion_index]
             self.rect = self.image.get_rect(center=center)
 
     # ============================================================
@@ -143,17 +185,17 @@ class ThrownBomb(BaseEntity):
 
         from core.game import Game
 
-        # Loop semua enemy
-        for enemy in list(Game.instance.enemies):
-
-            # Ambil posisi musuh
+        # Enemy di sekitar ledakan saja (DynamicSpatialHash),
+        # bukan loop semua enemy. Index memakai hitbox, jadi query
+        # diperlebar QUERY_MARGIN lalu disaring dengan aturan asli:
+        # jarak pusat rect enemy ke pusat ledakan <= DAMAGE_RADIUS
+        cx, cy = self.rect.center
+        game = Game.instance
+        if game.horde is not None:
+            # backend horde: aturan sama, dihitung di array NumPy
+            game.kill_horde_enemies(game.horde.damage_circle(cx, cy, DAMAGE_RADIUS))
+        query = game.enemy_index.query_circle(cx, cy, DAMAGE_RADIUS + self.QUERY_MARGIN)
+        for enemy in query:
             ex, ey = enemy.rect.center
-
-            # hitung jarak
-            dist = math.hypot(
-                ex - self.rect.centerx,
-                ey - self.rect.centery
-            )
-
-            if dist <= DAMAGE_RADIUS:
-                enemy.take_damage(1)   # atau damage bom
\ No newline at end of file
+            if math.hypot(ex - cx, ey - cy) <= DAMAGE_RADIUS:
+                enemy.take_damage(1)   # atau damage bom
@@ -1,4 +1,66 @@
+import argparse
+import sys
+
 from core.game import Game
+from core.replay import Replay
+from core.settings import ENEMY_BACKEND
+
+
+def seed_arg(text):
+    """Seed harus muat di field u64 header replay (0 .. 2**64-1)."""
+    seed = int(text)
+    if not 0 <= seed < 2 ** 64:
+        raise argparse.ArgumentTypeError(f"seed harus 0 .. {2 ** 64 - 1}, bukan {seed}")
+    return seed
+
+
+parser = argparse.ArgumentParser(description="Forest Survivors")
+parser.add_argument(
+    "--headless", action="store_true",
+    help="simulasi tanpa window/audio dengan player bot, secepat mungkin"
+)
+parser.add_argument(
+    "--seconds", type=float, default=600,
+    help="lama simulasi headless dalam detik waktu game (default 600)"
+)
+parser.add_argument(
+    "--stop-on-death", action="store_true",
+    help="hentikan simulasi headless saat player mati (default: restart)"
+)
+parser.add_argument(
+    "--seed", type=seed_arg, default=None,
+    help="seed game (spawn & efek acak sama setiap dijalankan)"
+)
+parser.add_argument(
+    "--record", metavar="FILE", default=None,
+    help="rekam input tiap run ke file replay (run berikutnya: FILE-2, FILE-3, ...)"
+)
+parser.add_argument(
+    "--enemy-backend", choices=("sprite", "horde"), default=ENEMY_BACKEND,
+    help="enemy sebagai sprite Slime / Skeleton atau Horde NumPy (ribuan enemy)"
+)
+parser.add_argument(
+    "--load", metavar="FILE", default=None,
+    help="lanjutkan game dari file snapshot (mis. .cache/autosave.fss)"
+)
+parser.add_argument(
+    "--replay", metavar="FILE", default=None,
+    help="putar ulang file replay secepat mungkin (headless) lalu cek hasilnya"
+)
+args = parser.parse_args()
 
-game = Game()
-game.run()
+if args.replay:
+    replay = Replay.load(args.replay)
+    game = Game(headless=True, seed=replay.seed, enemy_backend=replay.enemy_backend)
+    report = game.run_replay(replay)
+    sys.exit(0 if report["match"] else 1)
+elif args.headless:
+    game = Game(headless=True, seed=args.seed, record_path=args.record,
+                enemy_backend=args.enemy_backend)
+    game.run_headless(args.seconds, stop_on_game_over=args.stop_on_death)
+else:
+    game = Game(seed=args.seed, record_path=args.record, enemy_backend=args.enemy_backend)
+    if args.load:
+        with open(args.load, "rb") as f:
+            game.load_snapshot(f.read())
+    game.run()
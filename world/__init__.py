@@ -1 +1,2 @@
 from .map_loader import MapLoader
+from .spatial_hash import SpatialHash, DynamicSpatialHash
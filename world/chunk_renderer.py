@@ -0,0 +1,123 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class ChunkRenderer:
+
+    """
+    ChunkRenderer
+    -------------
+    Menggambar map per potongan (chunk) berukuran tetap.
+
+    Cara kerja:
+    - Chunk baru di-bake saat pertama kali terlihat kamera
+    - Hanya chunk yang bersinggungan dengan kamera yang di-blit
+    - Chunk yang lama tidak terlihat dibuang (LRU)
+
+    Dengan begitu memori tetap terbatas (max_chunks) walaupun
+    map sangat besar, dan area blit per frame sebanding dengan
+    ukuran layar, bukan ukuran map.
+
+    alpha=False untuk layer opaque (ground): chunk di-convert()
+    tanpa alpha sehingga blit-nya berupa copy biasa.
+    bake_chunk boleh mengembalikan None untuk chunk kosong
+    (tidak ada yang digambar).
+    """
+
+    def __init__(self, bake_chunk, map_width, map_height, chunk_size=512, max_chunks=16,
+                 alpha=True):
+        # fungsi bake: bake_chunk(pygame.Rect) -> pygame.Surface / None
+        self.bake_chunk = bake_chunk
+        self.alpha = alpha
+
+        self.map_width = map_width
+        self.map_height = map_height
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+
+        # (chunk_x, chunk_y) -> Surface / None, urutan = LRU (paling lama di depan)
+        self.chunks = OrderedDict()
+
+        # statistik untuk debug / benchmark
+        self.stats = {"baked": 0, "evicted": 0, "blit_area": 0}
+
+    # ==========================================================
+    # CHUNK
+    # ==========================================================
+    def chunk_rect(self, cx, cy):
+        """Area chunk dalam koordinat map (dipotong di tepi map)."""
+        size = self.chunk_size
+        rect = pygame.Rect(cx * size, cy * size, size, size)
+        return rect.clip(pygame.Rect(0, 0, self.map_width, self.map_height))
+
+    def get_chunk(self, cx, cy):
+        """Ambil chunk dari cache, bake jika belum ada."""
+        key = (cx, cy)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+
+        surface = self.bake_chunk(self.chunk_rect(cx, cy))
+        # samakan format pixel dengan layar agar blit cepat
+        if surface is not None and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if self.alpha else surface.convert()
+        self.chunks[key] = surface
+        self.stats["baked"] += 1
+
+        return surface
+
+    def visible_chunks(self, view):
+        """Daftar (cx, cy) chunk yang bersinggungan dengan view rect."""
+        view = view.clip(pygame.Rect(0, 0, self.map_width, self.map_height))
+        if view.width <= 0 or view.height <= 0:
+            return []
+
+        size = self.chunk_size
+        x0 = view.left // size
+        y0 = view.top // size
+        x1 = (view.right - 1) // size
+        y1 = (view.bottom - 1) // size
+
+        return [(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def evict(self, keep=()):
+        """Buang chunk paling lama dipakai sampai jumlahnya <= max_chunks."""
+        keep = set(keep)
+        for key in list(self.chunks):
+            if len(self.chunks) <= self.max_chunks:
+                break
+            if key in keep:
+                continue
+            del self.chunks[key]
+            self.stats["evicted"] += 1
+
+    def clear(self):
+        self.chunks.clear()
+
+    # ==========================================================
+    # DRAW
+    # ==========================================================
+    def draw(self, screen, camera_x, camera_y):
+        """Blit chunk yang terlihat kamera ke screen."""
+        # offset integer sekali saja agar tidak ada celah antar chunk
+        ox = int(camera_x)
+        oy = int(camera_y)
+
+        view = pygame.Rect(ox, oy, screen.get_width(), screen.get_height())
+        visible = self.visible_chunks(view)
+
+        blit_area = 0
+        for cx, cy in visible:
+            surface = self.get_chunk(cx, cy)
+            if surface is None:
+                continue
+            x = cx * self.chunk_size
+            y = cy * self.chunk_size
+            screen.blit(surface, (x - ox, y - oy))
+
+            clipped = view.clip(pygame.Rect(x, y, surface.get_width(), surface.get_height()))
+            blit_area += clipped.width * clipped.height
+
+        self.stats["blit_area"] = blit_area
+        self.evict(keep=visible)
@@ -0,0 +1,165 @@
+from bisect import bisect_left
+
+import pygame
+
+from world.spatial_hash import SpatialHash
+
+
+def merge_rects(rects):
+    """
+    Gabungkan collider yang saling menempel / overlap
+    menjadi rect yang lebih besar dan lebih sedikit.
+
+    Dua strategi dicoba, lalu diambil hasil dengan jumlah
+    rect paling sedikit (tidak pernah lebih banyak dari input):
+    - merge berpasangan (union dua rect yang hasilnya tetap rect)
+    - dekomposisi strip (baris maupun kolom) dari union semua collider
+
+    Area yang tertutup collider tidak berubah sama sekali.
+    """
+    rects = [pygame.Rect(r) for r in rects if r.width > 0 and r.height > 0]
+    if len(rects) < 2:
+        return rects
+
+    candidates = [
+        _merge_pairs(rects),
+        _merge_strips(rects),
+        # versi kolom: transpose, strip, transpose balik
+        [_transpose(r) for r in _merge_strips([_transpose(r) for r in rects])],
+    ]
+
+    best = min(candidates, key=len)
+    best.sort(key=lambda r: (r.top, r.left))
+    return best
+
+
+def _transpose(rect):
+    return pygame.Rect(rect.y, rect.x, rect.height, rect.width)
+
+
+# ==========================================================
+# STRATEGI 1: MERGE BERPASANGAN
+# ==========================================================
+def _merge_pairs(rects):
+    """
+    Gabung rect yang union-nya tetap berbentuk rect:
+    - rect yang berada di dalam rect lain dibuang
+    - rect dengan kiri/kanan sama yang menempel vertikal digabung
+    - rect dengan atas/bawah sama yang menempel horizontal digabung
+
+    Diulang sampai tidak ada lagi yang bisa digabung.
+    """
+    result = _drop_contained(rects)
+    while True:
+        count = len(result)
+        result = _merge_runs(result, vertical=True)
+        result = _merge_runs(result, vertical=False)
+        if len(result) == count:
+            return result
+        result = _drop_contained(result)
+
+
+def _drop_contained(rects):
+    """Buang rect yang sepenuhnya tertutup rect lain."""
+    index = SpatialHash(128)
+    for i, r in enumerate(rects):
+        index.insert(i, r)
+
+    kept = []
+    for i, r in enumerate(rects):
+        covered = False
+        for j in index.query(r):
+            other = rects[j]
+            # rect identik: yang pertama saja yang disimpan
+            if j != i and other.contains(r) and (other != r or j < i):
+                covered = True
+                break
+        if not covered:
+            kept.append(r)
+    return kept
+
+
+def _merge_runs(rects, vertical):
+    """
+    Kelompokkan rect berdasarkan rentang sisi yang sama,
+    urutkan, lalu gabung yang menempel / overlap.
+    """
+    groups = {}
+    for r in rects:
+        key = (r.left, r.right) if vertical else (r.top, r.bottom)
+        groups.setdefault(key, []).append(r)
+
+    result = []
+    for group in groups.values():
+        group.sort(key=(lambda r: r.top) if vertical else (lambda r: r.left))
+        current = group[0]
+        for r in group[1:]:
+            start, end = (r.top, current.bottom) if vertical else (r.left, current.right)
+            if start <= end:
+                current = current.union(r)
+            else:
+                result.append(current)
+                current = r
+        result.append(current)
+    return result
+
+
+# ==========================================================
+# STRATEGI 2: DEKOMPOSISI STRIP
+# ==========================================================
+def _merge_strips(rects):
+    """
+    Teknik:
+    1. Kompresi koordinat: semua sisi rect jadi garis grid
+    2. Tandai cell grid yang tertutup collider
+    3. Gabung cell per baris jadi strip horizontal
+    4. Strip dengan rentang X sama di baris berikutnya
+       diperpanjang ke bawah (jadi satu rect)
+
+    Hasilnya rect yang tidak saling overlap.
+    """
+    xs = sorted({x for r in rects for x in (r.left, r.right)})
+    ys = sorted({y for r in rects for y in (r.top, r.bottom)})
+
+    # ============================
+    # 1. TANDAI CELL YANG TERTUTUP
+    # ============================
+    cols = len(xs) - 1
+    filled = [bytearray(cols) for _ in range(len(ys) - 1)]
+
+    for r in rects:
+        x0 = bisect_left(xs, r.left)
+        x1 = bisect_left(xs, r.right)
+        y0 = bisect_left(ys, r.top)
+        y1 = bisect_left(ys, r.bottom)
+        for row in filled[y0:y1]:
+            row[x0:x1] = b"\x01" * (x1 - x0)
+
+    # ============================
+    # 2. STRIP PER BARIS + GABUNG VERTIKAL
+    # ============================
+    merged = []
+    # (x0, x1) -> index baris awal strip yang masih "terbuka"
+    open_strips = {}
+
+    for j, row in enumerate(filled):
+        current = {}
+        start = row.find(1)
+        while start != -1:
+            end = row.find(0, start)
+            if end == -1:
+                end = cols
+            current[(start, end)] = open_strips.pop((start, end), j)
+            start = row.find(1, end)
+
+        # strip yang tidak berlanjut → tutup jadi rect
+        for (x0, x1), j0 in open_strips.items():
+            merged.append(pygame.Rect(xs[x0], ys[j0], xs[x1] - xs[x0], ys[j] - ys[j0]))
+
+        open_strips = current
+
+    end = len(ys) - 1
+    for (x0, x1), j0 in open_strips.items():
+        merged.append(pygame.Rect(xs[x0], ys[j0], xs[x1] - xs[x0], ys[end] - ys[j0]))
+
+    return merged
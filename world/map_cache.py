@@ -0,0 +1,190 @@
+import glob
+import hashlib
+import os
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+
+import pygame
+
+# ==========================================================
+# FORMAT FILE CACHE
+# ==========================================================
+# Naikkan versi ini setiap kali cara bake chunk berubah,
+# supaya cache lama otomatis dianggap tidak valid.
+FORMAT_VERSION = 2
+MAGIC = b"FSMC"
+
+# pass chunk: ground (opaque, RGB) & foreground (di atas entity, RGBA)
+PASS_GROUND = 0
+PASS_FOREGROUND = 1
+PASS_MODES = {PASS_GROUND: "RGB", PASS_FOREGROUND: "RGBA"}
+
+# magic, versi, chunk_size, map_w, map_h, jumlah collider, jumlah chunk
+HEADER = struct.Struct("<4sHIIIII")
+# x, y, w, h
+COLLIDER = struct.Struct("<iiii")
+# pass, chunk_x, chunk_y, w, h, offset data, panjang data
+CHUNK = struct.Struct("<BiiIIQI")
+
+
+def map_sources(tmx_path):
+    """
+    Daftar semua file yang mempengaruhi hasil bake map:
+    file TMX, tileset TSX eksternal, dan semua gambar tileset.
+    """
+    sources = [tmx_path]
+    base = os.path.dirname(tmx_path)
+    root = ET.parse(tmx_path).getroot()
+
+    for tileset in root.iter("tileset"):
+        tsx = tileset.get("source")
+        if tsx:
+            tsx_path = os.path.normpath(os.path.join(base, tsx))
+            sources.append(tsx_path)
+            ts_base = os.path.dirname(tsx_path)
+            ts_root = ET.parse(tsx_path).getroot()
+        else:
+            ts_base = base
+            ts_root = tileset
+
+        for image in ts_root.iter("image"):
+            sources.append(os.path.normpath(os.path.join(ts_base, image.get("source"))))
+
+    # image layer
+    for layer in root.iter("imagelayer"):
+        for image in layer.iter("image"):
+            sources.append(os.path.normpath(os.path.join(base, image.get("source"))))
+
+    return sources
+
+
+def cache_key(tmx_path, chunk_size, options=()):
+    """
+    Hash isi TMX + tileset + gambar (dan parameter bake).
+    options: parameter bake lain yang mempengaruhi hasil
+    (mis. warna background, daftar layer foreground).
+    """
+    digest = hashlib.sha256()
+    digest.update(MAGIC)
+    digest.update(struct.pack("<HI", FORMAT_VERSION, chunk_size))
+    digest.update(repr(tuple(options)).encode("utf-8"))
+
+    for path in map_sources(tmx_path):
+        with open(path, "rb") as f:
+            data = f.read()
+        digest.update(os.path.basename(path).encode("utf-8"))
+        digest.update(struct.pack("<Q", len(data)))
+        digest.update(data)
+
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir, tmx_path, key):
+    """Nama file cache: <nama map>-<16 karakter hash>.fsmap"""
+    stem = os.path.splitext(os.path.basename(tmx_path))[0]
+    return os.path.join(cache_dir, f"{stem}-{key[:16]}.fsmap")
+
+
+# ==========================================================
+# TULIS CACHE
+# ==========================================================
+def write_cache(path, map_width, map_height, chunk_size, colliders, chunks):
+    """
+    Simpan hasil bake ke file binary.
+
+    chunks: iterable (pass, chunk_x, chunk_y, Surface / None)
+    Pixel disimpan terkompresi zlib per chunk (RGB untuk ground,
+    RGBA untuk foreground), sehingga saat dibaca bisa di-decode
+    satu per satu. Chunk None (kosong) tidak disimpan.
+    """
+    entries = []
+    blobs = []
+    for layer_pass, cx, cy, surface in chunks:
+        if surface is None:
+            continue
+        w, h = surface.get_size()
+        blob = zlib.compress(pygame.image.tobytes(surface, PASS_MODES[layer_pass]), 6)
+        entries.append((layer_pass, cx, cy, w, h, len(blob)))
+        blobs.append(blob)
+
+    offset = HEADER.size + COLLIDER.size * len(colliders) + CHUNK.size * len(entries)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    # tulis ke file sementara dulu, baru rename (tidak ada cache setengah jadi)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, chunk_size,
+                            map_width, map_height, len(colliders), len(entries)))
+        for r in colliders:
+            f.write(COLLIDER.pack(r.x, r.y, r.width, r.height))
+        for layer_pass, cx, cy, w, h, length in entries:
+            f.write(CHUNK.pack(layer_pass, cx, cy, w, h, offset, length))
+            offset += length
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+    # hapus cache lama dari map yang sama
+    stem = os.path.basename(path).rsplit("-", 1)[0]
+    for old in glob.glob(os.path.join(os.path.dirname(path), f"{stem}-*.fsmap")):
+        if os.path.abspath(old) != os.path.abspath(path):
+            os.remove(old)
+
+
+# ==========================================================
+# BACA CACHE
+# ==========================================================
+class MapCache:
+
+    """
+    MapCache
+    --------
+    Pembaca file cache map hasil bake.
+
+    Header dan collider dibaca langsung saat open,
+    sedangkan pixel chunk baru dibaca dari disk saat dibutuhkan
+    (dipanggil oleh ChunkRenderer), jadi memori tetap kecil.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+
+        try:
+            data = self._file.read(HEADER.size)
+            magic, version, self.chunk_size, self.map_width, self.map_height, \
+                n_colliders, n_chunks = HEADER.unpack(data)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"cache map tidak dikenali: {path}")
+
+            data = self._file.read(COLLIDER.size * n_colliders)
+            self.colliders = [pygame.Rect(r) for r in COLLIDER.iter_unpack(data)]
+
+            data = self._file.read(CHUNK.size * n_chunks)
+            # (pass, cx, cy) -> (w, h, offset, length)
+            self.chunks = {(layer_pass, cx, cy): (w, h, offset, length)
+                           for layer_pass, cx, cy, w, h, offset, length
+                           in CHUNK.iter_unpack(data)}
+        except (struct.error, ValueError):
+            self.close()
+            raise ValueError(f"cache map rusak: {path}")
+
+    def read_chunk(self, cx, cy, layer_pass=PASS_GROUND):
+        """
+        Decode pixel satu chunk menjadi Surface.
+        None jika chunk kosong (tidak disimpan).
+        """
+        entry = self.chunks.get((layer_pass, cx, cy))
+        if entry is None:
+            return None
+        w, h, offset, length = entry
+        self._file.seek(offset)
+        data = zlib.decompress(self._file.read(length))
+        return pygame.image.frombytes(data, (w, h), PASS_MODES[layer_pass])
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
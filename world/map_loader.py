@@ -1,5 +1,19 @@
+import os
+import time
 import pygame
-from pytmx.util_pygame import load_pygame
+from world import map_cache
+from world.tile_loader import TileCache, convert_tiles, load_tmx
+from world.spatial_hash import SpatialHash
+from world.occupancy import OccupancyGrid
+from world.spawn_index import SpawnIndex
+from world.colliders import merge_rects
+from world.chunk_renderer import ChunkRenderer
+
+# resource hanya ada di Unix (untuk laporan peak memory)
+try:
+    import resource
+except ImportError:
+    resource = None
 
 class MapLoader:
 
@@ -8,8 +22,12 @@ class MapLoader:
     ---------
     Bertanggung jawab untuk:
     - Memuat file map (.tmx)
-    - Merender tile map ke dalam satu surface
+    - Merender tile map per chunk (lazy, hanya yang terlihat kamera)
+      dalam dua pass: ground (opaque, di bawah entity) dan
+      foreground (alpha, di atas entity)
     - Menyediakan data collision untuk entity
+      (lewat spatial index, lihat query())
+    - Menyimpan / membaca hasil bake dari file cache
 
     Prinsip OOP:
     - Single Responsibility Principle (SRP):
@@ -18,25 +36,129 @@ class MapLoader:
       karena map bersifat data statis, bukan entity aktif.
     """
 
-    def __init__(self):
+    def __init__(self, cell_size=64, chunk_size=512, max_chunks=16, grid_cell_size=16,
+                 nav_cell_size=32, background=(90, 150, 90), foreground_layers=()):
         # data TMX
         self.tmx = None
-        # surface hasil render seluruh map
-        self.surface = None
+        # warna dasar chunk ground (area tanpa tile)
+        self.background = tuple(background)
+        # nama layer yang digambar di atas entity
+        # (selain layer dengan property "foreground" di TMX)
+        self.foreground_layers = tuple(foreground_layers)
+        self.ground_tile_layers = []
+        self.foreground_tile_layers = []
+        # surface tile per (gid, opacity), dibuat saat load TMX
+        self.tile_cache = None
+        # renderer chunk ground & foreground (dibuat saat load)
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.renderer = None
+        self.foreground_renderer = None
+        # file cache hasil bake (jika dipakai)
+        self.cache = None
+        self.cache_path = None
         # ukuran map dalam pixel
         self.map_width = 0
         self.map_height = 0
         # daftar collider (pygame.Rect)
         self.colliders = []
+        # index spasial collider (dibangun saat load)
+        self.cell_size = cell_size
+        self.collider_index = SpatialHash(cell_size)
+        # laporan jumlah collider sebelum / sesudah merge
+        self.collider_stats = {"before": 0, "after": 0}
+        # grid occupancy untuk line of sight (dibangun saat load)
+        self.grid_cell_size = grid_cell_size
+        self.grid = None
+        # grid navigasi (lebih kasar) untuk flow field enemy
+        self.nav_cell_size = nav_cell_size
+        self.nav_grid = None
+        # index posisi spawn per ukuran footprint (dibuat saat dibutuhkan)
+        self._spawn_indexes = {}
+        # laporan waktu parse / bake & memori (lihat bake_report())
+        self.bake_stats = {}
 
-    def load(self, path):
+    def load(self, path, merge_colliders=False, cache_dir=None, convert=True):
         """
         Memuat file TMX dan:
         - Menghitung ukuran map
-        - Merender tile ke satu surface
+        - Menyiapkan renderer chunk (tile di-bake saat terlihat)
         - Mengambil collision dari layer khusus
+        - (opsional) menggabungkan collider yang menempel / overlap
+        - Membangun spatial index & occupancy grid untuk collider
+
+        Jika cache_dir diisi, hasil bake disimpan ke file cache
+        (key = hash TMX + tileset + gambar). Saat cache valid,
+        map dimuat dari cache tanpa menjalankan pytmx sama sekali.
+
+        convert=False jika dipanggil dari worker thread: tile tidak
+        di-convert ke format layar; panggil convert_tiles() di main
+        thread setelahnya.
         """
-        self.tmx = load_pygame(path)
+        if cache_dir:
+            key = map_cache.cache_key(
+                path,
+                self.chunk_size,
+                (self.background, self.foreground_layers)
+            )
+            self.cache_path = map_cache.cache_path(cache_dir, path, key)
+
+            if os.path.exists(self.cache_path):
+                try:
+                    self._load_from_cache(self.cache_path)
+                except (OSError, ValueError) as e:
+                    print(f"[Map] Cache tidak valid, bake ulang: {e}")
+                    self._load_from_tmx(path, convert)
+                    self.bake_cache(self.cache_path)
+            else:
+                self._load_from_tmx(path, convert)
+                self.bake_cache(self.cache_path)
+        else:
+            self._load_from_tmx(path, convert)
+
+        before = len(self.colliders)
+        if merge_colliders:
+            self.colliders = merge_rects(self.colliders)
+        self.collider_stats = {"before": before, "after": len(self.colliders)}
+
+        # ======================================
+        #  SPATIAL INDEX COLLIDER
+        # ======================================
+        self.collider_index = SpatialHash.from_rects(self.colliders, self.cell_size)
+
+        # ======================================
+        #  OCCUPANCY GRID (LINE OF SIGHT & NAVIGASI)
+        # ======================================
+        self.grid = OccupancyGrid(
+            self.colliders,
+            self.map_width,
+            self.map_height,
+            self.grid_cell_size
+        )
+        self.nav_grid = OccupancyGrid(
+            self.colliders,
+            self.map_width,
+            self.map_height,
+            self.nav_cell_size
+        )
+        self._spawn_indexes = {}
+
+        if merge_colliders:
+            print(f"[Map] Merged colliders: {before} -> {len(self.colliders)}")
+        print(f"[Map] Loaded {len(self.colliders)} colliders")
+
+    # ==========================================================
+    def _load_from_tmx(self, path, convert=True):
+        """Parse TMX dengan pytmx, siapkan renderer & collider."""
+        # pytmx di-import di dalam load_tmx: saat cache valid tidak perlu di-load
+        start = time.perf_counter()
+        self.tmx, loader_stats = load_tmx(path, convert)
+        self.tile_cache = TileCache(self.tmx.images)
+
+        self.bake_stats = dict(loader_stats)
+        self.bake_stats["parse_ms"] = (time.perf_counter() - start) * 1000
+        self.bake_stats["bake_ms"] = 0.0
+        self.bake_stats["chunks"] = 0
 
         # ============================
         # HITUNG UKURAN MAP (PIXEL)
@@ -45,30 +167,21 @@ class MapLoader:
         self.map_height = self.tmx.height * self.tmx.tileheight
 
         # ============================
-        # BUAT SURFACE MAP
-        # ============================
-        self.surface = pygame.Surface((self.map_width, self.map_height), pygame.SRCALPHA)
-
-        # ============================
-        # RENDER TILE MAP
+        # PISAHKAN LAYER GROUND / FOREGROUND
         # ============================
+        self.ground_tile_layers = []
+        self.foreground_tile_layers = []
         for layer in self.tmx.visible_layers:
             if hasattr(layer, "tiles"):
+                if self.is_foreground(layer):
+                    self.foreground_tile_layers.append(layer)
+                else:
+                    self.ground_tile_layers.append(layer)
 
-                # opacity layer (default = 1.0)
-                opacity = int((layer.opacity if layer.opacity is not None else 1) * 255)
-
-                for x, y, tile in layer.tiles():
-                    if tile:
-                        # salin tile agar alpha tidak mengubah source
-                        temp = tile.copy()
-                        temp.set_alpha(opacity)
-
-                        # gambar tile ke surface map
-                        self.surface.blit(
-                            temp,
-                            (x * self.tmx.tilewidth, y * self.tmx.tileheight)
-                        )
+        # ============================
+        # RENDERER CHUNK
+        # ============================
+        self._create_renderers(self._bake_ground, self._bake_foreground)
 
         # ======================================
         #  COLLISION OBJECTS (layer name = "collision")
@@ -81,19 +194,219 @@ class MapLoader:
                     rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
                     self.colliders.append(rect)
 
-        print(f"[Map] Loaded {len(self.colliders)} colliders")
+    def convert_tiles(self):
+        """
+        Convert tile TMX ke format layar (main thread) setelah
+        load(convert=False), supaya bake chunk berikutnya cepat.
+        """
+        if self.tmx is None:
+            return
+        convert_tiles(self.tmx.images)
+        self.tile_cache.clear()
+
+    def _load_from_cache(self, cache_file):
+        """Muat ukuran map, collider dan pixel chunk dari file cache."""
+        self.cache = map_cache.MapCache(cache_file)
+
+        self.map_width = self.cache.map_width
+        self.map_height = self.cache.map_height
+        self.colliders = list(self.cache.colliders)
+
+        size = self.chunk_size
+        self._create_renderers(
+            lambda rect: self.cache.read_chunk(
+                rect.x // size, rect.y // size, map_cache.PASS_GROUND),
+            lambda rect: self.cache.read_chunk(
+                rect.x // size, rect.y // size, map_cache.PASS_FOREGROUND),
+        )
+        print(f"[Map] Loaded from cache {cache_file}")
+
+    def _create_renderers(self, bake_ground, bake_foreground):
+        # ground: opaque (convert tanpa alpha) → blit berupa copy biasa
+        self.renderer = ChunkRenderer(
+            bake_ground,
+            self.map_width,
+            self.map_height,
+            self.chunk_size,
+            self.max_chunks,
+            alpha=False
+        )
+        # foreground: per-pixel alpha, digambar setelah entity
+        self.foreground_renderer = ChunkRenderer(
+            bake_foreground,
+            self.map_width,
+            self.map_height,
+            self.chunk_size,
+            self.max_chunks,
+            alpha=True
+        )
+
+    def is_foreground(self, layer):
+        """Layer digambar di atas entity (property TMX atau nama layer)."""
+        flag = layer.properties.get("foreground", False)
+        if isinstance(flag, str):
+            flag = flag.lower() == "true"
+        return bool(flag) or layer.name in self.foreground_layers
+
+    def bake_cache(self, cache_file):
+        """
+        Bake semua chunk dari TMX lalu simpan ke file cache
+        bersama collider dan ukuran map.
+        """
+        renderer = self.renderer
+        cols = -(-self.map_width // self.chunk_size)
+        rows = -(-self.map_height // self.chunk_size)
+
+        passes = (
+            (map_cache.PASS_GROUND, self._bake_ground),
+            (map_cache.PASS_FOREGROUND, self._bake_foreground),
+        )
+        chunks = (
+            (layer_pass, cx, cy, bake(renderer.chunk_rect(cx, cy)))
+            for layer_pass, bake in passes
+            for cy in range(rows) for cx in range(cols)
+        )
+        map_cache.write_cache(
+            cache_file,
+            self.map_width,
+            self.map_height,
+            self.chunk_size,
+            self.colliders,
+            chunks
+        )
+        print(f"[Map] Baked cache {cache_file}")
+        self.print_bake_report()
+
+    def bake_report(self):
+        """
+        Statistik load TMX & bake chunk:
+        - parse_ms / bake_ms : waktu parse TMX & total bake chunk
+        - sheets / tilesets  : gambar tileset yang di-decode / total tileset
+        - tiles              : jumlah tile (GID) yang dimuat
+        - tile_bytes         : memori tile yang dimuat + salinan tile opacity
+        - peak_rss_kb        : puncak memori proses (jika tersedia)
+        """
+        report = dict(self.bake_stats)
+        if self.tile_cache:
+            report["tile_copies"] = self.tile_cache.stats["copies"]
+            report["tile_bytes"] = report.get("tile_bytes", 0) + self.tile_cache.stats["copy_bytes"]
+        if resource is not None:
+            # Linux: KB, macOS: byte
+            report["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return report
+
+    def print_bake_report(self):
+        r = self.bake_report()
+        if not r:
+            return
+        print(
+            f"[Map] Parse {r['parse_ms']:.1f} ms, bake {r['chunks']} chunk {r['bake_ms']:.1f} ms, "
+            f"tileset {r['sheets']}/{r['tilesets']}, tile {r['tiles']}, "
+            f"memori tile {r.get('tile_bytes', 0) / 1024:.0f} KB"
+            + (f", peak RSS {r['peak_rss_kb'] / 1024:.1f} MB" if "peak_rss_kb" in r else "")
+        )
+
+    # ==========================================================
+    def query(self, rect):
+        """
+        Ambil collider yang berada di sekitar rect.
+        Dipakai entity supaya tidak perlu loop semua collider.
+        """
+        return self.collider_index.query(rect)
+
+    def spawn_index(self, footprint):
+        """
+        SpawnIndex untuk objek berukuran footprint x footprint.
+        Dihitung sekali per ukuran lalu dipakai ulang.
+        """
+        index = self._spawn_indexes.get(footprint)
+        if index is None:
+            index = SpawnIndex(self.grid, self.map_width, self.map_height, footprint)
+            self._spawn_indexes[footprint] = index
+        return index
+
+    # ==========================================================
+    def _bake_ground(self, rect):
+        """
+        Chunk ground: semua layer di bawah entity digambar di atas
+        warna background ke surface tanpa alpha. Layer transparan
+        (bayangan, opacity < 1) ikut di-blend di sini sekali saja,
+        sehingga saat draw cukup copy opaque.
+        """
+        surface = pygame.Surface(rect.size)
+        surface.fill(self.background)
+        self._bake_layers(surface, rect, self.ground_tile_layers)
+        return surface
+
+    def _bake_foreground(self, rect):
+        """
+        Chunk foreground (per-pixel alpha) untuk layer di atas entity.
+        None jika chunk ini tidak punya tile foreground sama sekali.
+        """
+        if not self.foreground_tile_layers:
+            return None
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        if not self._bake_layers(surface, rect, self.foreground_tile_layers):
+            return None
+        return surface
+
+    def _bake_layers(self, surface, rect, layers):
+        """
+        Render tile dari layers yang berada di dalam rect ke surface.
+        Mengembalikan jumlah tile yang digambar.
+
+        Surface tile diambil dari TileCache (satu per gid & opacity)
+        dan setiap layer digambar dengan satu panggilan blits().
+        """
+        start = time.perf_counter()
+
+        tw = self.tmx.tilewidth
+        th = self.tmx.tileheight
+        get_tile = self.tile_cache.get
+
+        # range tile yang menyentuh chunk
+        tx0 = rect.left // tw
+        ty0 = rect.top // th
+        tx1 = min(self.tmx.width, -(-rect.right // tw))
+        ty1 = min(self.tmx.height, -(-rect.bottom // th))
+
+        drawn = 0
+        for layer in layers:
+
+            # opacity layer (default = 1.0)
+            opacity = int((layer.opacity if layer.opacity is not None else 1) * 255)
+
+            batch = []
+            for y in range(ty0, ty1):
+                row = layer.data[y]
+                py = y * th - rect.y
+                for x in range(tx0, tx1):
+                    gid = row[x]
+                    if gid:
+                        tile = get_tile(gid, opacity)
+                        if tile:
+                            batch.append((tile, (x * tw - rect.x, py)))
+
+            # gambar seluruh tile layer ini sekaligus
+            surface.blits(batch, doreturn=False)
+            drawn += len(batch)
+
+        self.bake_stats["bake_ms"] += (time.perf_counter() - start) * 1000
+        self.bake_stats["chunks"] += 1
+        return drawn
 
     # ==========================================================
     def draw(self, screen, camera_x, camera_y, debug=False):
-        """Gambar map sesuai kamera"""
-        if self.surface:
-            screen.blit(self.surface, (-camera_x, -camera_y))
+        """Gambar chunk ground yang terlihat kamera (sebelum entity)"""
+        if self.renderer:
+            self.renderer.draw(screen, camera_x, camera_y)
 
         # ======================================
         # DEBUG COLLIDERS
         # ======================================
         if debug:
-            for c in self.colliders:
+            view = pygame.Rect(camera_x, camera_y, screen.get_width(), screen.get_height())
+            for c in self.query(view):
                 pygame.draw.rect(
                     screen,
                     (0, 255, 0),
@@ -105,3 +418,8 @@ class MapLoader:
                     ),
                     2
                 )
+
+    def draw_foreground(self, screen, camera_x, camera_y):
+        """Gambar chunk foreground yang terlihat kamera (setelah entity)"""
+        if self.foreground_renderer:
+            self.foreground_renderer.draw(screen, camera_x, camera_y)
@@ -0,0 +1,158 @@
+import math
+from collections import deque
+
+
+class FlowField:
+
+    """
+    FlowField
+    ---------
+    Peta jarak (BFS) dari cell player ke seluruh cell walkable
+    pada OccupancyGrid.
+
+    Cara kerja:
+    - Dihitung ulang hanya saat player pindah cell
+    - Setiap enemy cukup melihat cell tetangga dengan jarak
+      paling kecil → itulah arah langkah berikutnya
+
+    Biaya pathing jadi O(grid) per perpindahan cell player,
+    dibagi bersama oleh semua enemy.
+    """
+
+    # 8 arah: (dx, dy)
+    NEIGHBOURS = (
+        (1, 0), (-1, 0), (0, 1), (0, -1),
+        (1, 1), (1, -1), (-1, 1), (-1, -1),
+    )
+
+    def __init__(self, grid):
+        self.grid = grid
+        # jarak BFS per cell, -1 = tidak terjangkau
+        self.dist = [-1] * (grid.cols * grid.rows)
+        self.target_cell = None
+        # cache arah per cell: (cx, cy) -> cell tetangga tujuan / None
+        self._next_cell = {}
+        self.stats = {"rebuilds": 0}
+
+    # ==========================================================
+    # BUILD
+    # ==========================================================
+    def update(self, target_pos):
+        """
+        Pastikan flow field mengarah ke target_pos.
+        Mengembalikan True jika field dihitung ulang.
+        """
+        cell = self.grid.cell_of(*target_pos)
+        if cell == self.target_cell:
+            return False
+
+        self.target_cell = cell
+        self._rebuild(cell)
+        return True
+
+    def _rebuild(self, cell):
+        grid = self.grid
+        cols = grid.cols
+        rows = grid.rows
+        cells = grid.cells
+        total = cols * rows
+
+        dist = [-1] * total
+        self._next_cell = {}
+        self.dist = dist
+        self.stats["rebuilds"] += 1
+
+        cx, cy = cell
+        if not (0 <= cx < cols and 0 <= cy < rows):
+            return
+
+        # cell target tetap jadi sumber walaupun blocked
+        # (player menempel wall bisa berada di cell tertutup)
+        start = cy * cols + cx
+        dist[start] = 0
+        queue = deque([start])
+        pop = queue.popleft
+        push = queue.append
+
+        while queue:
+            i = pop()
+            d = dist[i] + 1
+            x = i % cols
+
+            if x > 0:
+                j = i - 1
+                if dist[j] < 0 and not cells[j]:
+                    dist[j] = d
+                    push(j)
+            if x < cols - 1:
+                j = i + 1
+                if dist[j] < 0 and not cells[j]:
+                    dist[j] = d
+                    push(j)
+            if i >= cols:
+                j = i - cols
+                if dist[j] < 0 and not cells[j]:
+                    dist[j] = d
+                    push(j)
+            if i + cols < total:
+                j = i + cols
+                if dist[j] < 0 and not cells[j]:
+                    dist[j] = d
+                    push(j)
+
+    # ==========================================================
+    # QUERY
+    # ==========================================================
+    def distance(self, cx, cy):
+        grid = self.grid
+        if 0 <= cx < grid.cols and 0 <= cy < grid.rows:
+            return self.dist[cy * grid.cols + cx]
+        return -1
+
+    def next_cell(self, cx, cy):
+        """
+        Cell tetangga yang paling dekat ke target.
+        Diagonal hanya boleh jika kedua sisi-nya walkable
+        (tidak memotong sudut wall).
+        """
+        key = (cx, cy)
+        if key in self._next_cell:
+            return self._next_cell[key]
+
+        own = self.distance(cx, cy)
+        best = None
+        best_dist = own if own >= 0 else math.inf
+
+        for dx, dy in self.NEIGHBOURS:
+            d = self.distance(cx + dx, cy + dy)
+            if d < 0 or d >= best_dist:
+                continue
+            if dx and dy and (self.distance(cx + dx, cy) < 0 or self.distance(cx, cy + dy) < 0):
+                continue
+            best = (cx + dx, cy + dy)
+            best_dist = d
+
+        self._next_cell[key] = best
+        return best
+
+    def direction_at(self, x, y):
+        """
+        Arah (unit vector) dari posisi pixel menuju cell berikutnya.
+        None jika sudah di cell target atau tidak ada jalur.
+        """
+        cell = self.grid.cell_of(x, y)
+        if cell == self.target_cell:
+            return None
+
+        nxt = self.next_cell(*cell)
+        if nxt is None:
+            return None
+
+        # arahkan ke tengah cell tujuan
+        size = self.grid.cell_size
+        dx = (nxt[0] + 0.5) * size - x
+        dy = (nxt[1] + 0.5) * size - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length, dy / length
@@ -0,0 +1,137 @@
+class OccupancyGrid:
+
+    """
+    OccupancyGrid
+    -------------
+    Grid boolean hasil rasterisasi collider map.
+
+    Satu cell dianggap tertutup (blocked) jika ada collider
+    yang menyentuhnya, walaupun hanya sebagian. Dengan begitu
+    wall tipis (lebih kecil dari 1 cell) tetap terdeteksi.
+
+    Digunakan untuk:
+    - Line of sight enemy → player (line_of_sight)
+    - Grid navigasi untuk FlowField (world/navigation.py)
+    """
+
+    def __init__(self, colliders, map_width, map_height, cell_size=16):
+        self.cell_size = cell_size
+        self.cols = -(-map_width // cell_size)
+        self.rows = -(-map_height // cell_size)
+
+        # 1 byte per cell, index = cy * cols + cx
+        self.cells = bytearray(self.cols * self.rows)
+
+        for rect in colliders:
+            self.mark(rect)
+
+    def mark(self, rect):
+        """Tandai semua cell yang disentuh rect sebagai blocked."""
+        if rect.width <= 0 or rect.height <= 0:
+            return
+
+        size = self.cell_size
+        x0 = max(0, rect.left // size)
+        y0 = max(0, rect.top // size)
+        x1 = min(self.cols - 1, (rect.right - 1) // size)
+        y1 = min(self.rows - 1, (rect.bottom - 1) // size)
+        if x1 < x0 or y1 < y0:
+            return
+
+        row = b"\x01" * (x1 - x0 + 1)
+        for cy in range(y0, y1 + 1):
+            start = cy * self.cols + x0
+            self.cells[start:start + len(row)] = row
+
+    # ==========================================================
+    # QUERY
+    # ==========================================================
+    def cell_of(self, x, y):
+        """Koordinat pixel → koordinat cell."""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def blocked(self, cx, cy):
+        """Cell di luar map juga dianggap blocked."""
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.cells[cy * self.cols + cx] != 0
+        return True
+
+    def blocked_at(self, x, y):
+        return self.blocked(*self.cell_of(x, y))
+
+    def line_of_sight(self, start, end):
+        """
+        True jika garis start → end tidak melewati cell blocked.
+
+        Menelusuri cell yang dilewati garis satu per satu (DDA /
+        Amanatides-Woo), jadi biayanya sebanding dengan jumlah cell
+        yang dilalui, bukan jarak pixel × jumlah wall.
+        Berhenti di cell blocked pertama (early exit).
+
+        Cell awal tidak dicek (sama seperti line_blocked yang
+        mulai dari langkah pertama), karena enemy yang menempel
+        wall bisa berada di cell yang ikut tertutup.
+        """
+        x0, y0 = start
+        x1, y1 = end
+        size = self.cell_size
+
+        cx, cy = int(x0 // size), int(y0 // size)
+        ex, ey = int(x1 // size), int(y1 // size)
+
+        dx = x1 - x0
+        dy = y1 - y0
+
+        # ============================
+        # SETUP DDA
+        # ============================
+        if dx > 0:
+            step_x = 1
+            t_max_x = ((cx + 1) * size - x0) / dx
+            t_delta_x = size / dx
+        elif dx < 0:
+            step_x = -1
+            t_max_x = (cx * size - x0) / dx
+            t_delta_x = -size / dx
+        else:
+            step_x = 0
+            t_max_x = t_delta_x = float("inf")
+
+        if dy > 0:
+            step_y = 1
+            t_max_y = ((cy + 1) * size - y0) / dy
+            t_delta_y = size / dy
+        elif dy < 0:
+            step_y = -1
+            t_max_y = (cy * size - y0) / dy
+            t_delta_y = -size / dy
+        else:
+            step_y = 0
+            t_max_y = t_delta_y = float("inf")
+
+        cols = self.cols
+        rows = self.rows
+        cells = self.cells
+
+        # ============================
+        # TELUSURI CELL
+        # ============================
+        while cx != ex or cy != ey:
+            if t_max_x < t_max_y:
+                # t > 1 berarti garis sudah selesai (jaga error float)
+                if t_max_x > 1:
+                    break
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                if t_max_y > 1:
+                    break
+                cy += step_y
+                t_max_y += t_delta_y
+
+            if not (0 <= cx < cols and 0 <= cy < rows):
+                return False
+            if cells[cy * cols + cx]:
+                return False
+
+        return True
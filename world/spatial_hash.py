@@ -0,0 +1,296 @@
+import math
+
+import pygame
+
+
+class SpatialHash:
+
+    """
+    SpatialHash
+    -----------
+    Index spasial berbasis grid seragam (uniform grid).
+
+    Setiap item disimpan di semua cell yang disentuh rect-nya,
+    sehingga query hanya perlu memeriksa cell di sekitar area
+    yang dicari, bukan seluruh daftar item.
+
+    Digunakan untuk:
+    - Collider statis map (dibangun sekali saat load)
+
+    Catatan:
+    - Hasil query dikembalikan sesuai urutan insert, sehingga
+      urutan resolusi collision sama seperti loop list biasa.
+    """
+
+    def __init__(self, cell_size=64):
+        # ukuran 1 cell dalam pixel
+        self.cell_size = cell_size
+        # (cell_x, cell_y) -> list index item
+        self.cells = {}
+        # item & rect disimpan berurutan sesuai insert
+        self.items = []
+        self.rects = []
+
+    @classmethod
+    def from_rects(cls, rects, cell_size=64):
+        """Bangun index dari list pygame.Rect (item = rect itu sendiri)."""
+        index = cls(cell_size)
+        for rect in rects:
+            index.insert(rect)
+        return index
+
+    # ==========================================================
+    # BUILD
+    # ==========================================================
+    def _cell_range(self, rect):
+        """Range cell (inklusif) yang disentuh sebuah rect."""
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        # right/bottom eksklusif → kurangi 1 pixel
+        x1 = (rect.right - 1) // size
+        y1 = (rect.bottom - 1) // size
+        return x0, y0, max(x0, x1), max(y0, y1)
+
+    def insert(self, item, rect=None):
+        """Tambah item ke index. Jika rect kosong, item dianggap Rect."""
+        rect = pygame.Rect(item if rect is None else rect)
+
+        i = len(self.items)
+        self.items.append(item)
+        self.rects.append(rect)
+
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), []).append(i)
+
+    def clear(self):
+        """Kosongkan index (dipakai untuk rebuild)."""
+        self.cells.clear()
+        self.items.clear()
+        self.rects.clear()
+
+    # ==========================================================
+    # QUERY
+    # ==========================================================
+    def query(self, rect):
+        """
+        Mengembalikan item yang cell-nya bersinggungan dengan rect.
+
+        Hasil adalah kandidat (broadphase): pemanggil tetap
+        melakukan colliderect untuk cek yang presisi.
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+
+        # fast path: rect kecil yang hanya menyentuh 1 cell
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            return [self.items[i] for i in bucket]
+
+        found = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+
+        return [self.items[i] for i in sorted(found)]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+class DynamicSpatialHash:
+
+    """
+    DynamicSpatialHash
+    ------------------
+    Index spasial untuk entity yang bergerak (loose grid).
+
+    Berbeda dengan SpatialHash (collider statis), setiap entity
+    hanya disimpan di satu cell berdasarkan titik tengah hitbox-nya,
+    dan index dibangun ulang setiap langkah simulasi (rebuild) —
+    biayanya O(jumlah entity), tanpa Rect baru per entity.
+
+    Query diperluas sebesar setengah hitbox terbesar (loose), lalu
+    dicek presisi, jadi biaya query sebanding dengan kepadatan
+    entity di sekitar area, bukan jumlah total entity.
+
+    Digunakan untuk:
+    - serangan player ke enemy, damage kontak enemy ke player
+    - player mengambil pickup
+    - AOE ledakan bomb
+    - nearest (mis. target terdekat untuk bot)
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        # (cell_x, cell_y) -> list entity
+        self.cells = {}
+        self.count = 0
+        # setengah ukuran hitbox terbesar (untuk perluasan query)
+        self.max_half_w = 0
+        self.max_half_h = 0
+
+    # ==========================================================
+    # BUILD
+    # ==========================================================
+    def rebuild(self, sprites):
+        """Bangun ulang index dari sprite (butuh atribut hitbox)."""
+        cells = {}
+        size = self.cell_size
+        max_w = max_h = 0
+        count = 0
+
+        for sprite in sprites:
+            box = sprite.hitbox
+            cx, cy = box.center
+            key = (cx // size, cy // size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+            if box.width > max_w:
+                max_w = box.width
+            if box.height > max_h:
+                max_h = box.height
+            count += 1
+
+        self.cells = cells
+        self.count = count
+        self.max_half_w = (max_w + 1) // 2
+        self.max_half_h = (max_h + 1) // 2
+
+    def remove(self, sprite):
+        """
+        Hapus satu entity tanpa rebuild (mis. enemy mati di tengah
+        langkah). Dicari di cell posisi sekarang, lalu semua cell.
+        """
+        size = self.cell_size
+        cx, cy = sprite.hitbox.center
+        bucket = self.cells.get((cx // size, cy // size))
+        if not bucket or sprite not in bucket:
+            bucket = next((b for b in self.cells.values() if sprite in b), None)
+            if bucket is None:
+                return False
+        bucket.remove(sprite)
+        self.count -= 1
+        return True
+
+    def clear(self):
+        self.cells = {}
+        self.count = 0
+
+    def _candidates(self, left, top, right, bottom):
+        """Entity di cell yang bisa menyentuh area (sudah diperluas)."""
+        size = self.cell_size
+        x0 = int((left - self.max_half_w) // size)
+        y0 = int((top - self.max_half_h) // size)
+        x1 = int((right + self.max_half_w) // size)
+        y1 = int((bottom + self.max_half_h) // size)
+
+        cells = self.cells
+        # area lebih luas dari jumlah cell terisi → cek semua cell
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    yield from bucket
+            return
+
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    # ==========================================================
+    # QUERY
+    # ==========================================================
+    def query_rect(self, rect):
+        """Entity yang hitbox-nya bersentuhan dengan rect."""
+        rect = pygame.Rect(rect)
+        return [
+            sprite for sprite in self._candidates(rect.left, rect.top, rect.right, rect.bottom)
+            if rect.colliderect(sprite.hitbox)
+        ]
+
+    def query_circle(self, x, y, radius):
+        """Entity yang hitbox-nya bersentuhan dengan lingkaran."""
+        found = []
+        r2 = radius * radius
+        for sprite in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            box = sprite.hitbox
+            # titik hitbox terdekat ke pusat lingkaran
+            dx = x - max(box.left, min(x, box.right))
+            dy = y - max(box.top, min(y, box.bottom))
+            if dx * dx + dy * dy <= r2:
+                found.append(sprite)
+        return found
+
+    def nearest(self, x, y, k=1, max_dist=math.inf):
+        """
+        Maksimal k entity terdekat (jarak ke titik tengah hitbox),
+        terurut dari yang terdekat. Mengembalikan list (jarak, entity).
+
+        Cell diperiksa per cincin dari cell (x, y) keluar; berhenti
+        saat cincin berikutnya pasti lebih jauh dari hasil ke-k.
+        """
+        if not self.cells or k <= 0:
+            return []
+
+        size = self.cell_size
+        ox, oy = int(x // size), int(y // size)
+        xs = [cx for cx, _ in self.cells]
+        ys = [cy for _, cy in self.cells]
+        # cincin terjauh yang masih berisi entity
+        last_ring = max(abs(ox - min(xs)), abs(ox - max(xs)), abs(oy - min(ys)), abs(oy - max(ys)))
+
+        best = []
+        cells = self.cells
+        for ring in range(last_ring + 1):
+            # semua entity di cincin ring+1 dst. berjarak >= ring * size
+            if len(best) >= k and best[k - 1][0] <= ring * size - size:
+                break
+            if ring * size - size > max_dist:
+                break
+
+            for cx, cy in _ring_cells(ox, oy, ring):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for sprite in bucket:
+                    sx, sy = sprite.hitbox.center
+                    dist = math.hypot(sx - x, sy - y)
+                    if dist <= max_dist:
+                        best.append((dist, sprite))
+
+            if len(best) >= k:
+                best.sort(key=lambda item: item[0])
+                del best[k:]
+
+        best.sort(key=lambda item: item[0])
+        return best[:k]
+
+    def __len__(self):
+        return self.count
+
+
+def _ring_cells(ox, oy, ring):
+    """Cell pada cincin Chebyshev berjarak ring dari (ox, oy)."""
+    if ring == 0:
+        yield ox, oy
+        return
+    for cx in range(ox - ring, ox + ring + 1):
+        yield cx, oy - ring
+        yield cx, oy + ring
+    for cy in range(oy - ring + 1, oy + ring):
+        yield ox - ring, cy
+        yield ox + ring, cy
@@ -0,0 +1,97 @@
+import math
+import random
+
+import pygame
+
+
+class SpawnIndex:
+
+    """
+    SpawnIndex
+    ----------
+    Daftar cell yang aman untuk spawn objek berukuran footprint
+    (enemy, pickup, bomb), dihitung sekali dari OccupancyGrid.
+
+    Satu cell spawn valid jika footprint yang ditaruh di titik
+    mana pun di dalam cell tersebut tidak menyentuh cell blocked.
+    Jadi posisi spawn cukup: pilih cell acak + geser acak di
+    dalam cell → O(1), tanpa rejection sampling ke wall.
+    """
+
+    def __init__(self, grid, map_width, map_height, footprint=32):
+        self.grid = grid
+        self.footprint = footprint
+
+        size = grid.cell_size
+        # jumlah cell grid yang bisa disentuh footprint dari 1 cell spawn
+        span = 2 + (footprint - 2) // size
+
+        # batas agar footprint tetap di dalam map
+        max_cx = (map_width - footprint + 1) // size - 1
+        max_cy = (map_height - footprint + 1) // size - 1
+
+        cols = grid.cols
+        cells = grid.cells
+
+        # posisi kiri-atas cell spawn (pixel)
+        self.cells = []
+        for cy in range(max(0, max_cy + 1)):
+            for cx in range(max(0, max_cx + 1)):
+                free = True
+                for row in range(cy, min(cy + span, grid.rows)):
+                    start = row * cols + cx
+                    if any(cells[start:start + span]):
+                        free = False
+                        break
+                if free:
+                    self.cells.append((cx * size, cy * size))
+
+    def __len__(self):
+        return len(self.cells)
+
+    # ==========================================================
+    # SAMPLING
+    # ==========================================================
+    def _accept(self, x, y, avoid, origin, min_dist):
+        if avoid is not None:
+            if avoid.colliderect(pygame.Rect(x, y, self.footprint, self.footprint)):
+                return False
+        if origin is not None and min_dist > 0:
+            half = self.footprint / 2
+            if math.hypot(x + half - origin[0], y + half - origin[1]) < min_dist:
+                return False
+        return True
+
+    def sample(self, rng=random, avoid=None, origin=None, min_dist=0, attempts=16):
+        """
+        Ambil posisi kiri-atas acak yang bebas wall.
+
+        Constraint opsional:
+        - avoid    : pygame.Rect yang tidak boleh disentuh (mis. view kamera)
+        - origin   : titik acuan (mis. posisi player)
+        - min_dist : jarak minimal dari origin
+
+        Mengembalikan None jika tidak ada posisi yang memenuhi.
+        """
+        if not self.cells:
+            return None
+
+        size = self.grid.cell_size
+
+        # coba acak beberapa kali dulu (biasanya langsung kena)
+        for _ in range(attempts):
+            cx, cy = rng.choice(self.cells)
+            x = cx + rng.randrange(size)
+            y = cy + rng.randrange(size)
+            if self._accept(x, y, avoid, origin, min_dist):
+                return x, y
+
+        # constraint ketat → saring semua cell sekali
+        candidates = []
+        for cx, cy in self.cells:
+            x = cx + rng.randrange(size)
+            y = cy + rng.randrange(size)
+            if self._accept(x, y, avoid, origin, min_dist):
+                candidates.append((x, y))
+
+        return rng.choice(candidates) if candidates else None
@@ -0,0 +1,135 @@
+from functools import partial
+
+import pygame
+
+
+# ==========================================================
+# IMAGE LOADER PYTMX (LAZY)
+# ==========================================================
+def lazy_image_loader(filename, colorkey, stats=None, convert=True, **kwargs):
+    """
+    Pengganti pytmx.util_pygame.pygame_image_loader.
+
+    Perbedaan:
+    - Gambar tileset baru di-decode saat tile pertamanya diminta,
+      jadi tileset yang tidak dipakai map tidak pernah dibaca
+    - Tile yang dimuat adalah salinan (bukan subsurface), sehingga
+      gambar tileset utuh bisa dibuang setelah pytmx selesai memuat
+
+    Tile di-convert ke format layar (smart_convert pytmx) jika
+    display sudah ada, supaya blit saat bake chunk cepat.
+    convert=False untuk load di worker thread (convert dilakukan
+    nanti di main thread, lihat convert_tiles).
+
+    stats (opsional) diisi jumlah tileset yang di-decode, jumlah
+    tile dan byte pixel tile yang dimuat.
+    """
+    # import di sini: modul ini ikut di-import saat map dimuat dari cache
+    from pytmx.util_pygame import handle_transformation, smart_convert
+
+    if colorkey:
+        colorkey = pygame.Color(f"#{colorkey}")
+
+    if stats is None:
+        stats = {"sheets": 0, "tiles": 0, "tile_bytes": 0}
+    sheet = []
+
+    def load_image(rect=None, flags=None):
+        if not sheet:
+            sheet.append(pygame.image.load(filename))
+            stats["sheets"] += 1
+        image = sheet[0]
+
+        tile = image.subsurface(rect) if rect else image
+        if flags:
+            tile = handle_transformation(tile, flags)
+        if convert and pygame.display.get_surface() is not None:
+            tile = smart_convert(tile, colorkey, True)
+        else:
+            # tanpa display (headless): cukup salin pixel tile
+            tile = tile.copy()
+            if colorkey:
+                tile.set_colorkey(colorkey)
+
+        stats["tiles"] += 1
+        stats["tile_bytes"] += _surface_bytes(tile)
+        return tile
+
+    return load_image
+
+
+def load_tmx(path, convert=True):
+    """
+    Parse TMX dan muat hanya tile (GID) yang benar-benar dipakai layer.
+    Mengembalikan (TiledMap, statistik loader).
+    """
+    import pytmx
+
+    stats = {"sheets": 0, "tiles": 0, "tile_bytes": 0}
+    tmx = pytmx.TiledMap(
+        path,
+        image_loader=partial(lazy_image_loader, stats=stats, convert=convert),
+        load_all=False
+    )
+    stats["tilesets"] = len(tmx.tilesets)
+    return tmx, stats
+
+
+def convert_tiles(images):
+    """
+    Convert tile hasil load_tmx(convert=False) ke format layar.
+    Harus dipanggil di main thread setelah display dibuat.
+    """
+    from pytmx.util_pygame import smart_convert
+
+    for gid, tile in enumerate(images):
+        if tile is not None:
+            images[gid] = smart_convert(tile, tile.get_colorkey(), True)
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# ==========================================================
+# CACHE TILE PER OPACITY
+# ==========================================================
+class TileCache:
+
+    """
+    TileCache
+    ---------
+    Satu surface per pasangan (gid, opacity).
+
+    Sebelumnya setiap tile di setiap layer di-copy() lalu
+    set_alpha() ulang saat bake. Dengan cache ini tile yang sama
+    (mis. rumput yang dipakai ratusan kali) hanya disalin sekali
+    per opacity, dan tile opaque penuh langsung memakai surface asli.
+    """
+
+    def __init__(self, images):
+        # tmx.images: index gid -> Surface / None
+        self.images = images
+        # (gid, opacity) -> Surface
+        self.surfaces = {}
+        self.stats = {"hits": 0, "copies": 0, "copy_bytes": 0}
+
+    def get(self, gid, opacity=255):
+        key = (gid, opacity)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.stats["hits"] += 1
+            return surface
+
+        surface = self.images[gid]
+        if surface is not None and opacity < 255:
+            surface = surface.copy()
+            surface.set_alpha(opacity)
+            self.stats["copies"] += 1
+            self.stats["copy_bytes"] += _surface_bytes(surface)
+
+        self.surfaces[key] = surface
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()